@@ -1,19 +1,24 @@
-from checkcord.core.checker import DiscordChecker
-from checkcord.core.config import AppConfig
-from checkcord.core.generator import (
-    DictionaryGenerator,
-    LeetGenerator,
-    PatternGenerator,
-    RandomCharGenerator,
-    RemoteListGenerator,
-)
-from checkcord.core.ratelimiter import GlobalRateLimiter
-from checkcord.models import CheckResult, CheckStatus
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from checkcord.core.checker import DiscordChecker
+    from checkcord.core.config import AppConfig
+    from checkcord.core.generator import (
+        DictionaryGenerator,
+        LeetGenerator,
+        PatternGenerator,
+        RandomCharGenerator,
+        RemoteListGenerator,
+    )
+    from checkcord.core.ratelimiter import GlobalRateLimiter
+    from checkcord.models import CheckRecord, CheckResult, CheckStatus
 
 __all__ = [
     "DiscordChecker",
     "GlobalRateLimiter",
     "AppConfig",
+    "CheckRecord",
     "CheckResult",
     "CheckStatus",
     "DictionaryGenerator",
@@ -23,5 +28,34 @@ __all__ = [
     "RemoteListGenerator",
 ]
 
+# Public name -> module defining it. Importing the package stays cheap; the
+# module (and curl_cffi, pydantic, rich behind it) loads on first access.
+_LAZY = {
+    "DiscordChecker": "checkcord.core.checker",
+    "GlobalRateLimiter": "checkcord.core.ratelimiter",
+    "AppConfig": "checkcord.core.config",
+    "CheckRecord": "checkcord.models",
+    "CheckResult": "checkcord.models",
+    "CheckStatus": "checkcord.models",
+    "DictionaryGenerator": "checkcord.core.generator",
+    "LeetGenerator": "checkcord.core.generator",
+    "PatternGenerator": "checkcord.core.generator",
+    "RandomCharGenerator": "checkcord.core.generator",
+    "RemoteListGenerator": "checkcord.core.generator",
+}
+
 __version__ = "0.1.0"
 __author__ = "Xsyncio"
+
+
+def __getattr__(name: str) -> object:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *__all__])
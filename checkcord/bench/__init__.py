@@ -0,0 +1,4 @@
+from checkcord.bench.loadtest import BenchmarkReport, run_benchmark
+from checkcord.bench.mock_server import MockDiscordServer, MockOptions
+
+__all__ = ["BenchmarkReport", "MockDiscordServer", "MockOptions", "run_benchmark"]
@@ -0,0 +1,51 @@
+import asyncio
+
+import typer
+from rich.table import Table
+
+from checkcord.bench.loadtest import run_benchmark
+from checkcord.bench.mock_server import MockOptions, lognormal
+from checkcord.core.util import get_console
+
+console = get_console()
+
+
+def bench(
+    count: int = typer.Option(5000, help="Usernames to check"),
+    threads: int = typer.Option(50, help="Concurrent workers (thread_count)"),
+    rps: float = typer.Option(0.0, help="requests_per_second (0 = unthrottled)"),
+    latency: float = typer.Option(0.02, help="Median mock latency in seconds"),
+    bucket_limit: int = typer.Option(0, help="Mock per-token bucket size (0 = off)"),
+    bucket_window: float = typer.Option(1.0, help="Mock bucket window in seconds"),
+    global_429: float = typer.Option(0.0, help="Fraction of global 429 answers"),
+    server_errors: float = typer.Option(0.0, help="Fraction of 503 answers"),
+    workers: int = typer.Option(1, min=1, help="Checker processes"),
+):
+    """Benchmark the checker against a local mock Discord server."""
+    options = MockOptions(
+        latency=lognormal(latency) if latency > 0 else MockOptions().latency,
+        bucket_limit=bucket_limit,
+        bucket_window=bucket_window,
+        global_429_ratio=global_429,
+        server_error_ratio=server_errors,
+    )
+    report = asyncio.run(
+        run_benchmark(
+            count,
+            options,
+            workers,
+            thread_count=threads,
+            requests_per_second=rps or None,
+        )
+    )
+
+    table = Table(title="Benchmark")
+    table.add_column("Metric", style="magenta")
+    table.add_column("Value", style="cyan")
+    for name, value in report.rows():
+        table.add_row(name, value)
+    console.print(table)
+
+
+if __name__ == "__main__":
+    typer.run(bench)
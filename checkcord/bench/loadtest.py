@@ -0,0 +1,135 @@
+import sys
+import time
+from dataclasses import dataclass, field
+
+from checkcord.bench.mock_server import MockDiscordServer, MockOptions
+from checkcord.models import AppConfig, CheckRecord, CheckStatus
+
+
+def peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+@dataclass
+class BenchmarkReport:
+    checks: int
+    requests: int
+    rate_limited: int  # 429 responses, including ones later retried
+    elapsed: float
+    latencies: list[float] = field(repr=False)
+    statuses: dict[CheckStatus, int]
+    peak_rss_mb: float | None
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def p50(self) -> float:
+        return percentile(self.latencies, 50)
+
+    @property
+    def p99(self) -> float:
+        return percentile(self.latencies, 99)
+
+    @property
+    def resolved(self) -> int:
+        return self.statuses[CheckStatus.AVAILABLE] + self.statuses[CheckStatus.TAKEN]
+
+    @property
+    def rate_limited_ratio(self) -> float:
+        return self.rate_limited / self.requests if self.requests else 0.0
+
+    def rows(self) -> list[tuple[str, str]]:
+        rss = f"{self.peak_rss_mb:.1f} MB" if self.peak_rss_mb is not None else "n/a"
+        return [
+            ("Checks", str(self.checks)),
+            ("Requests", str(self.requests)),
+            ("Unresolved", str(self.checks - self.resolved)),
+            ("Elapsed", f"{self.elapsed:.2f}s"),
+            ("Requests/sec", f"{self.requests_per_second:.1f}"),
+            ("p50 latency", f"{self.p50 * 1000:.1f} ms"),
+            ("p99 latency", f"{self.p99 * 1000:.1f} ms"),
+            ("429 rate", f"{self.rate_limited_ratio:.2%}"),
+            ("Peak RSS", rss),
+        ]
+
+
+def bench_config(server: MockDiscordServer, **overrides: object) -> AppConfig:
+    """Config that points at the mock and leaves no state on disk."""
+    values: dict[str, object] = {
+        "token": "bench-token",
+        "api_base": server.base_url,
+        "thread_count": 50,
+        "retry_delay": 0.0,
+        # The mock asks for short waits, so retries need not wait long either
+        "retry_backoff": 0.05,
+        "cache_path": None,
+        "known_taken_path": None,
+    }
+    values.update(overrides)
+    return AppConfig.model_validate(values)
+
+
+async def run_benchmark(
+    count: int = 5000,
+    options: MockOptions | None = None,
+    workers: int = 1,
+    **config: object,
+) -> BenchmarkReport:
+    """Drive the full `run_checks` pipeline against a local mock server."""
+    if workers > 1:
+        # One token per worker process
+        config.setdefault("tokens", [f"bench-token-{i}" for i in range(1, workers)])
+    from checkcord.cli import runner
+
+    latencies: list[float] = []
+    statuses = {s: 0 for s in CheckStatus}
+
+    def collect(result: CheckRecord):
+        statuses[result.status] += 1
+        if result.latency is not None:
+            latencies.append(result.latency)
+
+    usernames = (f"bench{i}" for i in range(count))
+    async with MockDiscordServer(options) as server:
+        quiet = runner.console.quiet
+        runner.console.quiet = True
+        try:
+            started = time.perf_counter()
+            await runner.run_checks(
+                usernames,
+                bench_config(server, **config),
+                total=count,
+                on_result=collect,
+                output_file=None,
+                workers=workers,
+                quiet=True,
+            )
+            elapsed = time.perf_counter() - started
+        finally:
+            runner.console.quiet = quiet
+
+    return BenchmarkReport(
+        checks=count,
+        requests=server.requests,
+        rate_limited=server.statuses[429],
+        elapsed=elapsed,
+        latencies=latencies,
+        statuses=statuses,
+        peak_rss_mb=peak_rss_mb(),
+    )
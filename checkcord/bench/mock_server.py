@@ -0,0 +1,204 @@
+import asyncio
+import json
+import math
+import random
+import zlib
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from checkcord.core.checker import POMELO_PATH
+
+REASONS = {
+    200: "OK",
+    401: "Unauthorized",
+    404: "Not Found",
+    429: "Too Many Requests",
+    503: "Service Unavailable",
+}
+
+
+def constant(seconds: float) -> Callable[[], float]:
+    return lambda: seconds
+
+
+def uniform(low: float, high: float) -> Callable[[], float]:
+    return lambda: random.uniform(low, high)
+
+
+def lognormal(median: float, sigma: float = 0.5) -> Callable[[], float]:
+    """Long-tailed latency, the usual shape of real API round trips."""
+    mu = math.log(median)
+    return lambda: random.lognormvariate(mu, sigma)
+
+
+@dataclass
+class MockOptions:
+    taken_ratio: float = 0.9
+    latency: Callable[[], float] = field(default_factory=lambda: constant(0.0))
+    # Per-token bucket: `bucket_limit` requests every `bucket_window` seconds
+    bucket_limit: int = 0
+    bucket_window: float = 1.0
+    # Fraction of requests answered with a global 429 regardless of budget
+    global_429_ratio: float = 0.0
+    retry_after: float = 0.05
+    # Fraction of requests answered with a 503, as during a Discord outage
+    server_error_ratio: float = 0.0
+    valid_tokens: set[str] | None = None
+
+
+class _Bucket:
+    def __init__(self, reset_at: float, remaining: int):
+        self.reset_at: float = reset_at
+        self.remaining: int = remaining
+
+
+class MockDiscordServer:
+    """
+    Local stand-in for the pomelo-attempt endpoint.
+
+    Answers taken/available deterministically per name, sleeps according to a
+    latency distribution, enforces a per-token bucket with real
+    `X-RateLimit-*` headers and 429s, and returns 401 for unknown tokens.
+    """
+
+    def __init__(self, options: MockOptions | None = None):
+        self.options: MockOptions = options or MockOptions()
+        self.statuses: Counter[int] = Counter()
+        self._buckets: dict[str, _Bucket] = {}
+        self._server: asyncio.Server | None = None
+        self._connections: dict[asyncio.Task[None], asyncio.StreamWriter] = {}
+        self.port: int = 0
+
+    @property
+    def base_url(self) -> str:
+        """Value for `AppConfig.api_base` pointing at this server."""
+        return f"http://127.0.0.1:{self.port}/api/v9"
+
+    @property
+    def requests(self) -> int:
+        return sum(self.statuses.values())
+
+    async def start(self, port: int = 0):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            # Idle keep-alive connections would otherwise outlive the server
+            for writer in self._connections.values():
+                writer.close()
+            _ = await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "MockDiscordServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc: object):
+        await self.stop()
+
+    def is_taken(self, username: str) -> bool:
+        return zlib.crc32(username.encode()) / 2**32 < self.options.taken_ratio
+
+    def _rate_limit(self, token: str) -> tuple[int, dict[str, object], dict[str, str]]:
+        opts = self.options
+        now = asyncio.get_running_loop().time()
+
+        if random.random() < opts.global_429_ratio:
+            body: dict[str, object] = {
+                "message": "You are being rate limited.",
+                "retry_after": opts.retry_after,
+                "global": True,
+            }
+            headers = {
+                "X-RateLimit-Global": "true",
+                "Retry-After": str(opts.retry_after),
+            }
+            return 429, body, headers
+
+        if not opts.bucket_limit:
+            return 200, {}, {}
+
+        bucket = self._buckets.get(token)
+        if bucket is None or now >= bucket.reset_at:
+            bucket = _Bucket(now + opts.bucket_window, opts.bucket_limit)
+            self._buckets[token] = bucket
+
+        headers = {
+            "X-RateLimit-Bucket": "pomelo",
+            "X-RateLimit-Limit": str(opts.bucket_limit),
+            "X-RateLimit-Reset-After": f"{bucket.reset_at - now:.3f}",
+        }
+        if bucket.remaining <= 0:
+            headers["X-RateLimit-Remaining"] = "0"
+            headers["X-RateLimit-Scope"] = "user"
+            retry_after = round(bucket.reset_at - now, 3)
+            body = {
+                "message": "You are being rate limited.",
+                "retry_after": retry_after,
+                "global": False,
+            }
+            return 429, body, headers
+
+        bucket.remaining -= 1
+        headers["X-RateLimit-Remaining"] = str(bucket.remaining)
+        return 200, {}, headers
+
+    def _respond(
+        self, path: str, headers: dict[str, str], body: bytes
+    ) -> tuple[int, dict[str, object], dict[str, str]]:
+        if path != f"/api/v9{POMELO_PATH}":
+            return 404, {"message": "404: Not Found"}, {}
+
+        token = headers.get("authorization", "")
+        valid = self.options.valid_tokens
+        if not token or (valid is not None and token not in valid):
+            return 401, {"message": "401: Unauthorized", "code": 0}, {}
+        if random.random() < self.options.server_error_ratio:
+            return 503, {"message": "upstream connect error"}, {}
+
+        status, data, rl_headers = self._rate_limit(token)
+        if status != 200:
+            return status, data, rl_headers
+
+        username = str(json.loads(body or b"{}").get("username", ""))
+        return 200, {"taken": self.is_taken(username)}, rl_headers
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        assert task is not None
+        self._connections[task] = writer
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                _, path, _ = request_line.decode().split(" ", 2)
+
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                await asyncio.sleep(self.options.latency())
+                status, data, extra = self._respond(path, headers, body)
+                self.statuses[status] += 1
+
+                payload = json.dumps(data).encode()
+                head = [
+                    f"HTTP/1.1 {status} {REASONS.get(status, 'OK')}",
+                    "Content-Type: application/json",
+                    f"Content-Length: {len(payload)}",
+                    *(f"{k}: {v}" for k, v in extra.items()),
+                ]
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + payload)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            _ = self._connections.pop(task, None)
+            writer.close()
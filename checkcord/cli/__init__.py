@@ -1,5 +1,25 @@
-from checkcord.cli.main import app, run
-from checkcord.cli.runner import run_checks
-from checkcord.cli.wizard import run_wizard
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from checkcord.cli.main import app, run
+    from checkcord.cli.runner import run_checks
+    from checkcord.cli.wizard import run_wizard
 
 __all__ = ["app", "run", "run_checks", "run_wizard"]
+
+_LAZY = {
+    "app": "checkcord.cli.main",
+    "run": "checkcord.cli.main",
+    "run_checks": "checkcord.cli.runner",
+    "run_wizard": "checkcord.cli.wizard",
+}
+
+
+def __getattr__(name: str) -> object:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
@@ -1,13 +1,14 @@
-import asyncio
+from collections.abc import AsyncIterable, Iterable
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, TextIO
 
 import typer
 
-from checkcord.cli.runner import run_checks
-from checkcord.core.config import load_config
 from checkcord.core.util import get_console, setup_logging
 
+if TYPE_CHECKING:
+    from checkcord.core.sinks import SinkFormat
+
 app = typer.Typer(
     name="CheckCord",
     help="A modern, high-performance Discord username checker and generator.",
@@ -36,55 +37,363 @@ def wizard():
     run_wizard()
 
 
+METRICS_PORT = typer.Option(
+    "--metrics-port", help="Serve Prometheus metrics on this local port"
+)
+METRICS_JSON = typer.Option(
+    "--metrics-json", help="Write a JSON snapshot of the metrics here at the end"
+)
+
+PROFILE = typer.Option(help="Print how long each phase of the checks took")
+PROFILE_OUTPUT = typer.Option(
+    "--profile-output",
+    help="Also save a profile: speedscope trace for .json, else cProfile stats",
+)
+
+QUIET = typer.Option(help="No progress bar or per-name lines, just the summary")
+JSON_PROGRESS = typer.Option(
+    "--json-progress",
+    help="Print progress as JSON lines on stdout (other output goes to stderr)",
+)
+
+OUTPUT = typer.Option(
+    "--output",
+    "-o",
+    help="Where results go as they arrive (default: valid_usernames.txt)",
+)
+# A plain string so the CLI module never imports the sinks up front
+OUTPUT_FORMAT = typer.Option(
+    "--format",
+    help="Output format: available names only (txt) or every result "
+    "(jsonl, csv, sqlite). Guessed from the --output suffix by default",
+)
+
+
+def sink_format(value: str | None) -> "SinkFormat | None":
+    from checkcord.core.sinks import SinkFormat
+
+    if value is None:
+        return None
+    try:
+        return SinkFormat(value.lower())
+    except ValueError:
+        choices = ", ".join(f.value for f in SinkFormat)
+        raise typer.BadParameter(
+            f"{value!r} is not one of {choices}", param_hint="--format"
+        ) from None
+
+
+def use_stderr() -> TextIO:
+    """Send every other message to stderr and return stdout for JSON progress."""
+    import sys
+
+    stdout = sys.stdout
+    # Rich consoles without a file of their own write to the current sys.stdout
+    sys.stdout = sys.stderr
+    return stdout
+
+
+GENERATE_COUNT = typer.Option(
+    help="Usernames to check (default 1, or no limit with --until-available)"
+)
+UNTIL_AVAILABLE = typer.Option(
+    "--until-available", min=1, help="Stop once this many available names are found"
+)
+
+SWEEP_START = typer.Option("--start", min=0, help="First keyspace index to check")
+SWEEP_END = typer.Option("--end", min=0, help="Stop before this keyspace index")
+
+GENERATE_JOURNAL = typer.Option(
+    "--journal",
+    help="Journal of finished checks (default: one per run, such as "
+    "generate-4-seed1234.journal or generate-4-sweep.journal)",
+)
+
+
 @app.command()
 def generate(
-    count: int = typer.Option(1, help="Number of usernames to generate"),
+    count: Annotated[int | None, GENERATE_COUNT] = None,
     length: int = typer.Option(4, help="Length of the usernames generated"),
     dictionary: bool = typer.Option(
         False,
         help="Use a dictionary for words (Not implemented yet, uses random chars)",
     ),
+    resume: bool = typer.Option(False, help="Continue the run recorded in the journal"),
+    sweep: bool = typer.Option(
+        False,
+        help="Check every valid name of the length (a-z, 0-9, _ and .) in order "
+        "instead of sampling",
+    ),
+    start: Annotated[int, SWEEP_START] = 0,
+    end: Annotated[int | None, SWEEP_END] = None,
+    seed: int | None = typer.Option(
+        None, help="Seed of the shuffled order; pass the earlier one with --resume"
+    ),
+    workers: int = typer.Option(1, min=1, help="Processes to spread checks over"),
+    journal_path: Annotated[Path | None, GENERATE_JOURNAL] = None,
+    metrics_port: Annotated[int | None, METRICS_PORT] = None,
+    metrics_json: Annotated[Path | None, METRICS_JSON] = None,
+    profile: Annotated[bool, PROFILE] = False,
+    profile_output: Annotated[Path | None, PROFILE_OUTPUT] = None,
+    output: Annotated[Path | None, OUTPUT] = None,
+    output_format: Annotated[str | None, OUTPUT_FORMAT] = None,
+    quiet: Annotated[bool, QUIET] = False,
+    json_progress: Annotated[bool, JSON_PROGRESS] = False,
+    until_available: Annotated[int | None, UNTIL_AVAILABLE] = None,
 ):
-    """Generate random usernames and check their availability."""
+    """
+    Generate random usernames and check their availability.
+    With --sweep, check the whole keyspace of the length (or --start/--end of it).
+    With --until-available, keep going until that many available names are found.
+    """
+    import asyncio
+
+    from checkcord.cli.runner import run_checks
+    from checkcord.core.config import load_config
     from checkcord.core.generator import RandomCharGenerator
+    from checkcord.core.journal import Journal, JournalMismatchError
 
+    output_sink = sink_format(output_format)
+    progress_stream = use_stderr() if json_progress else None
     config = load_config()
     setup_logging()
 
-    if config.token == "YOUR_TOKEN_HERE" or config.token == "INVALID_TOKEN_LOAD_FAILED":
+    if not config.accounts():
         console.print(
             "[bold red]Please configure your token in config.json![/bold red]"
         )
         return
 
+    if resume and not sweep and seed is None:
+        console.print(
+            "[bold red]--resume needs the --seed of the run being resumed[/bold red]"
+        )
+        return
+
     # Use the new generator module
-    gen = RandomCharGenerator(length=length)
-    usernames = asyncio.run(gen.generate(count))
+    gen = RandomCharGenerator(length=length, seed=seed)
+
+    # Sweep offsets are keyspace indices, so any range of one length can share
+    # a journal; a shuffled run's offsets only mean something for its seed
+    if sweep:
+        run = f"generate length={length} sweep"
+        default_journal = Path(f"generate-{length}-sweep.journal")
+    else:
+        run = f"generate length={length} seed={gen.seed}"
+        default_journal = Path(f"generate-{length}-seed{gen.seed}.journal")
+    try:
+        journal = Journal(journal_path or default_journal, resume=resume, run=run)
+    except JournalMismatchError as e:
+        console.print(f"[bold red]Cannot resume: {e}[/bold red]")
+        return
+    usernames: Iterable[str] | AsyncIterable[str]
+    total: int | None = None
+    if sweep:
+        # Streamed in keyspace order; resuming skips what the journal settled
+        end = gen.keyspace.size if end is None else min(end, gen.keyspace.size)
+        console.print(
+            f"[cyan]Sweeping names {start}-{end} of {gen.keyspace.size} "
+            f"of length {length}[/cyan]"
+        )
+        usernames = gen.sweep(start, end)
+        total = max(end - start, 0)
+        offset = start
+    else:
+        # The same seed gives the same names, so a resumed run replays them and
+        # the journal skips the ones already settled
+        console.print(
+            f"[cyan]Shuffling {gen.keyspace.size} names of length {length} "
+            f"with --seed {gen.seed}[/cyan]"
+        )
+        # Generated as the checks ask for them, so a slow run never builds a
+        # backlog and --until-available needs no count
+        if count is None and until_available is None:
+            count = 1
+        usernames = gen.stream(count)
+        total = count
+        offset = 0
 
-    asyncio.run(run_checks(usernames, config))
+    asyncio.run(
+        run_checks(
+            usernames,
+            config,
+            total=total,
+            journal=journal,
+            start=offset,
+            workers=workers,
+            metrics_port=metrics_port,
+            metrics_json=metrics_json,
+            profile=profile,
+            profile_output=profile_output,
+            output_file=str(output or "valid_usernames.txt"),
+            output_format=output_sink,
+            quiet=quiet,
+            json_progress=progress_stream,
+            until_available=until_available,
+        )
+    )
 
 
 FILE_PATH = typer.Argument(..., exists=True, help="Path to text file")
+LIST_JOURNAL = typer.Option(
+    "--journal", help="Journal of finished checks (default: <file>.journal)"
+)
 
 
 @app.command()
 def check_list(
     file_path: Annotated[Path, FILE_PATH],
+    resume: bool = typer.Option(False, help="Skip names finished by an earlier run"),
+    workers: int = typer.Option(1, min=1, help="Processes to spread checks over"),
+    journal_path: Annotated[Path | None, LIST_JOURNAL] = None,
+    metrics_port: Annotated[int | None, METRICS_PORT] = None,
+    metrics_json: Annotated[Path | None, METRICS_JSON] = None,
+    profile: Annotated[bool, PROFILE] = False,
+    profile_output: Annotated[Path | None, PROFILE_OUTPUT] = None,
+    output: Annotated[Path | None, OUTPUT] = None,
+    output_format: Annotated[str | None, OUTPUT_FORMAT] = None,
+    quiet: Annotated[bool, QUIET] = False,
+    json_progress: Annotated[bool, JSON_PROGRESS] = False,
 ):
     """Check a list of usernames from a file."""
+    import asyncio
+
+    from checkcord.cli.runner import run_checks
+    from checkcord.core.config import load_config
+    from checkcord.core.ingest import UsernameSource
+    from checkcord.core.journal import Journal, JournalMismatchError, file_digest
+
+    output_sink = sink_format(output_format)
+    progress_stream = use_stderr() if json_progress else None
     config = load_config()
     setup_logging()
 
-    if config.token == "YOUR_TOKEN_HERE":
+    if not config.accounts():
         console.print(
             "[bold red]Please configure your token in config.json![/bold red]"
         )
         return
 
-    with open(file_path) as f:
-        usernames = [line.strip() for line in f if line.strip()]
+    # Offsets are line positions, so the journal is only good for the same file
+    run = f"check-list {file_digest(file_path)}"
+    try:
+        journal = Journal(
+            journal_path or Path(f"{file_path}.journal"), resume=resume, run=run
+        )
+    except JournalMismatchError as e:
+        console.print(f"[bold red]Cannot resume: {e}[/bold red]")
+        return
+
+    # Streamed so huge (or gzipped) dumps never sit in memory as a list
+    usernames = UsernameSource(file_path)
+    asyncio.run(
+        run_checks(
+            usernames,
+            config,
+            journal=journal,
+            workers=workers,
+            metrics_port=metrics_port,
+            metrics_json=metrics_json,
+            profile=profile,
+            profile_output=profile_output,
+            output_file=str(output or "valid_usernames.txt"),
+            output_format=output_sink,
+            quiet=quiet,
+            json_progress=progress_stream,
+        )
+    )
+
+    if usernames.duplicates:
+        console.print(f"[cyan]Skipped {usernames.duplicates} duplicate lines[/cyan]")
+
+
+QUEUE_PATH = typer.Option("--queue", help="Queue database shared by every node")
+DEFAULT_QUEUE = Path("checkcord-queue.db")
+
+
+QUEUE_FILE = typer.Argument(exists=True, help="Path to text file")
+
+
+@app.command()
+def coordinate(
+    file_path: Annotated[Path | None, QUEUE_FILE] = None,
+    length: int | None = typer.Option(
+        None, min=1, help="Queue every name of this length instead of a file"
+    ),
+    start: Annotated[int, SWEEP_START] = 0,
+    end: Annotated[int | None, SWEEP_END] = None,
+    queue_path: Annotated[Path | None, QUEUE_PATH] = None,
+    chunk_size: int = typer.Option(500, min=1, help="Usernames per leased chunk"),
+    wait: bool = typer.Option(True, help="Wait for the nodes and merge the results"),
+):
+    """Queue a username file (or a --length keyspace) for `work` nodes on any hosts."""
+    import asyncio
 
-    asyncio.run(run_checks(usernames, config))
+    from checkcord.cli.runner import watch_queue
+    from checkcord.core.coordinator import LeaseQueue
+    from checkcord.core.ingest import UsernameSource
+    from checkcord.core.keyspace import Keyspace
+
+    source: UsernameSource | Keyspace
+    if file_path is None:
+        if length is None:
+            raise typer.BadParameter("Give either a file or --length")
+        source = Keyspace(length)
+    elif length is None:
+        source = UsernameSource(file_path)
+    else:
+        raise typer.BadParameter("Give either a file or --length, not both")
+
+    setup_logging()
+    queue = LeaseQueue(queue_path or DEFAULT_QUEUE)
+    if isinstance(source, Keyspace):
+        added = queue.add_keyspace(source, start, end, chunk_size)
+    else:
+        added = queue.add_lines(source, chunk_size)
+    console.print(f"[bold cyan]Queued {added} usernames in {queue.path}[/bold cyan]")
+
+    if wait:
+        asyncio.run(watch_queue(queue))
+    queue.close()
+
+
+@app.command()
+def work(
+    queue_path: Annotated[Path | None, QUEUE_PATH] = None,
+    worker_id: str | None = typer.Option(None, "--id", help="Name of this node"),
+    lease_time: float = typer.Option(60.0, min=1.0, help="Seconds a lease lasts"),
+    metrics_port: Annotated[int | None, METRICS_PORT] = None,
+    metrics_json: Annotated[Path | None, METRICS_JSON] = None,
+):
+    """Check chunks from a coordinated queue until it is finished."""
+    import asyncio
+
+    from checkcord.core.config import load_config
+    from checkcord.core.coordinator import LeaseQueue, run_node
+
+    config = load_config()
+    setup_logging()
+
+    if not config.accounts():
+        console.print(
+            "[bold red]Please configure your token in config.json![/bold red]"
+        )
+        return
+
+    queue = LeaseQueue(queue_path or DEFAULT_QUEUE)
+    console.print(f"[bold cyan]Working on {queue.path}...[/bold cyan]")
+    _ = asyncio.run(
+        run_node(
+            queue,
+            config,
+            worker_id,
+            lease_time,
+            metrics_port=metrics_port,
+            metrics_json=metrics_json,
+        )
+    )
+    queue.close()
+    console.print("[bold green]Queue finished.[/bold green]")
 
 
 def run():
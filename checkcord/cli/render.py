@@ -0,0 +1,203 @@
+import asyncio
+import json
+import sys
+import time
+from collections import Counter
+from typing import TextIO
+
+from rich.console import Console
+from rich.progress import (
+    BarColumn,
+    Progress,
+    SpinnerColumn,
+    TaskProgressColumn,
+    TextColumn,
+)
+
+from checkcord.core.profiler import NullProfiler
+from checkcord.models import CheckRecord, CheckStatus
+
+# Screen updates per second, however fast results arrive
+RENDER_HZ = 10.0
+# Available names printed one per line each tick before the rest are summed up
+MAX_HIT_LINES = 20
+
+
+class Renderer:
+    """
+    Shows a run's progress. This base class shows nothing (`--quiet`).
+
+    `result` is called for every finished check and only does bookkeeping;
+    drawing happens in `refresh`, which a background task calls every
+    `interval` seconds while the renderer is entered.
+    """
+
+    interval: float = 0.0  # No background refreshes
+
+    def __init__(self, total: int | None = None, completed: int = 0):
+        self.total: int | None = total
+        self.completed: int = completed
+        self.profiler: NullProfiler = NullProfiler()
+        self._ticker: asyncio.Task[None] | None = None
+
+    def result(self, record: CheckRecord):
+        pass
+
+    def refresh(self):
+        pass
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    async def _tick(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            with self.profiler.phase("render"):
+                self.refresh()
+
+    async def __aenter__(self) -> "Renderer":
+        self.start()
+        if self.interval > 0:
+            self._ticker = asyncio.create_task(self._tick())
+        return self
+
+    async def __aexit__(self, *exc: object):
+        if self._ticker is not None:
+            _ = self._ticker.cancel()
+            self._ticker = None
+        self.stop()
+
+
+class RichRenderer(Renderer):
+    """
+    A progress bar with one line per available name.
+
+    Rate limited and errored names are folded into one line per tick (and per
+    error message), so a 429 storm prints a handful of lines a second instead
+    of one per result.
+    """
+
+    interval: float = 1.0 / RENDER_HZ
+
+    def __init__(self, console: Console, total: int | None = None, completed: int = 0):
+        super().__init__(total, completed)
+        self.console: Console = console
+        self.progress: Progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            console=console,
+            auto_refresh=False,
+        )
+        self.task_id = self.progress.add_task(
+            "Checking...", total=total, completed=completed
+        )
+        self._hits: list[str] = []
+        self._rate_limited: list[str] = []
+        # message -> (count, last username)
+        self._errors: dict[str, tuple[int, str]] = {}
+
+    def result(self, record: CheckRecord):
+        self.completed += 1
+        status = record.status
+        if status == CheckStatus.AVAILABLE:
+            self._hits.append(record.username)
+        elif status == CheckStatus.RATE_LIMITED:
+            self._rate_limited.append(record.username)
+        elif status == CheckStatus.ERROR:
+            message = record.message or "Unknown error"
+            count, _ = self._errors.get(message, (0, ""))
+            self._errors[message] = (count + 1, record.username)
+
+    def refresh(self):
+        out = self.console.print
+        hits, self._hits = self._hits, []
+        for name in hits[:MAX_HIT_LINES]:
+            out(f"[green]AVAILABLE: {name}[/green]")
+        if len(hits) > MAX_HIT_LINES:
+            out(f"[green]AVAILABLE: {len(hits) - MAX_HIT_LINES} more[/green]")
+
+        limited, self._rate_limited = self._rate_limited, []
+        if len(limited) == 1:
+            out(f"[yellow]RATE LIMITED: {limited[0]}[/yellow]")
+        elif limited:
+            out(
+                f"[yellow]RATE LIMITED: {len(limited)} usernames "
+                f"(last: {limited[-1]})[/yellow]"
+            )
+
+        errors, self._errors = self._errors, {}
+        for message, (count, last) in errors.items():
+            if count == 1:
+                out(f"[red]ERROR: {last} - {message}[/red]")
+            else:
+                out(f"[red]ERROR x{count}: {message} (last: {last})[/red]")
+
+        self.progress.update(self.task_id, completed=self.completed)
+        self.progress.refresh()
+
+    def start(self):
+        self.progress.start()
+
+    def stop(self):
+        # Whatever arrived since the last tick
+        self.refresh()
+        self.progress.stop()
+
+
+class JsonRenderer(Renderer):
+    """
+    One JSON object per line with running totals (`--json-progress`).
+
+    Lines go out once a second and carry the names found available since the
+    previous one; the last line has `"done": true`.
+    """
+
+    interval: float = 1.0
+
+    def __init__(
+        self,
+        total: int | None = None,
+        completed: int = 0,
+        stream: TextIO | None = None,
+    ):
+        super().__init__(total, completed)
+        self.stream: TextIO = stream if stream is not None else sys.stdout
+        self.statuses: Counter[str] = Counter()
+        self._hits: list[str] = []
+        self._started: float = time.monotonic()
+        self._done: bool = False
+
+    def result(self, record: CheckRecord):
+        self.completed += 1
+        self.statuses[record.status.value] += 1
+        if record.status == CheckStatus.AVAILABLE:
+            self._hits.append(record.username)
+
+    def refresh(self):
+        elapsed = time.monotonic() - self._started
+        hits, self._hits = self._hits, []
+        checked = sum(self.statuses.values())
+        line = {
+            "elapsed": round(elapsed, 3),
+            "completed": self.completed,
+            "total": self.total,
+            "rate": round(checked / elapsed, 1) if elapsed > 0 else 0.0,
+            "statuses": dict(self.statuses),
+            "available": hits,
+        }
+        if self._done:
+            line["done"] = True
+        _ = self.stream.write(json.dumps(line) + "\n")
+        self.stream.flush()
+
+    def start(self):
+        self._started = time.monotonic()
+
+    def stop(self):
+        self._done = True
+        self.refresh()
@@ -1,4 +1,10 @@
 import asyncio
+import cProfile
+from collections import Counter
+from collections.abc import AsyncIterable, Callable, Iterable, Sized
+from contextlib import aclosing
+from pathlib import Path
+from typing import TextIO
 
 from curl_cffi.requests import AsyncSession
 from rich.progress import (
@@ -10,54 +16,26 @@ from rich.progress import (
 )
 from rich.table import Table
 
+from checkcord.cli.render import JsonRenderer, Renderer, RichRenderer
 from checkcord.core.checker import DiscordChecker
+from checkcord.core.coordinator import LeaseQueue
+from checkcord.core.errors import ErrorKind
+from checkcord.core.journal import CONCLUSIVE, Journal
+from checkcord.core.metrics import exporting
+from checkcord.core.profiler import NullProfiler, PhaseProfiler
+from checkcord.core.shards import ShardedChecker
+from checkcord.core.sinks import ResultSink, SinkFormat, open_sink
+from checkcord.core.tokens import NoActiveTokensError
 from checkcord.core.util import get_console
-from checkcord.models import AppConfig, CheckStatus
+from checkcord.models import AppConfig, CheckRecord, CheckStatus
 
 console = get_console()
 
+# Gave up on after every attempt (skipped names were never tried)
+UNRESOLVED = (CheckStatus.RATE_LIMITED, CheckStatus.ERROR)
 
-async def run_checks(usernames: list[str], config: AppConfig):
-    checker = DiscordChecker(config)
 
-    console.print(
-        f"[bold cyan]Starting check for {len(usernames)} usernames...[/bold cyan]"
-    )
-
-    # Mapping results for summary
-    results_summary = {s: 0 for s in CheckStatus}
-    valid_names: list[str] = []
-
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        console=console,
-    ) as progress:
-        task_id = progress.add_task("Checking...", total=len(usernames))
-
-        async with AsyncSession(impersonate="chrome") as session:
-            # Create coroutines
-            coroutines = [checker.check_username(session, u) for u in usernames]
-
-            # Use asyncio.as_completed to update progress bar as they finish
-            for coro in asyncio.as_completed(coroutines):
-                result = await coro
-                progress.advance(task_id)
-                results_summary[result.status] += 1
-
-                if result.status == CheckStatus.AVAILABLE:
-                    console.print(f"[green]AVAILABLE: {result.username}[/green]")
-                    valid_names.append(result.username)
-                elif result.status == CheckStatus.RATE_LIMITED:
-                    console.print(f"[yellow]RATE LIMITED: {result.username}[/yellow]")
-                elif result.status == CheckStatus.ERROR:
-                    console.print(
-                        f"[red]ERROR: {result.username} - {result.message}[/red]"
-                    )
-
-    # Summary Table
+def summary_table(results_summary: dict[CheckStatus, int]) -> Table:
     table = Table(title="Check Summary")
     table.add_column("Status", style="magenta")
     table.add_column("Count", style="cyan")
@@ -72,13 +50,280 @@ async def run_checks(usernames: list[str], config: AppConfig):
         )
         table.add_row(f"[{color}]{status.value}[/{color}]", str(count))
 
-    console.print(table)
+    checked = sum(results_summary[s] for s in CONCLUSIVE)
+    table.add_section()
+    table.add_row("[bold]Checked[/bold]", str(checked))
+    table.add_row(
+        "[bold]Never resolved[/bold]", str(sum(results_summary[s] for s in UNRESOLVED))
+    )
+    return table
+
+
+def profile_table(profiler: PhaseProfiler) -> Table:
+    table = Table(
+        title="Time per Phase",
+        caption=(
+            f"Wall time {profiler.elapsed:.2f}s. Phases of concurrent checks "
+            "overlap, so totals add up to more."
+        ),
+    )
+    table.add_column("Phase", style="magenta")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total", justify="right", style="cyan")
+    table.add_column("Mean", justify="right")
+    table.add_column("Max", justify="right")
+
+    for name, stats in sorted(
+        profiler.phases.items(), key=lambda item: item[1].total, reverse=True
+    ):
+        table.add_row(
+            name,
+            str(stats.calls),
+            f"{stats.total:.2f}s",
+            f"{stats.mean * 1000:.2f} ms",
+            f"{stats.max * 1000:.1f} ms",
+        )
+    return table
+
+
+async def run_checks(
+    usernames: Iterable[str] | AsyncIterable[str],
+    config: AppConfig,
+    total: int | None = None,
+    on_result: Callable[[CheckRecord], None] | None = None,
+    output_file: str | None = "valid_usernames.txt",
+    output_format: SinkFormat | None = None,
+    journal: Journal | None = None,
+    start: int = 0,
+    workers: int = 1,
+    metrics_port: int | None = None,
+    metrics_json: Path | None = None,
+    profile: bool = False,
+    profile_output: Path | None = None,
+    quiet: bool = False,
+    json_progress: TextIO | None = None,
+    until_available: int | None = None,
+):
+    """
+    Check `usernames` with live progress and print a summary at the end.
+
+    With `profile` (or a `profile_output`), time is broken down per phase of
+    the pipeline. A `profile_output` ending in `.json` gets a speedscope trace
+    of those phases; any other path gets a cProfile dump for `pstats`.
+
+    Results go to `output_file` as they arrive, in `output_format` (guessed
+    from the suffix when not given): a plain list of available names, or
+    every result as JSONL, CSV or SQLite rows.
+
+    Progress is redrawn at most `RENDER_HZ` times a second whatever the result
+    rate. `quiet` shows nothing until the summary, and a `json_progress` stream
+    gets running totals as JSON lines instead of the progress bar.
+
+    With `until_available`, the run stops once that many names were found
+    available. Paired with an endless `usernames` stream (a generator's
+    `stream()`), that replaces guessing how many names to check.
+    """
+    checker = ShardedChecker(config, workers) if workers > 1 else DiscordChecker(config)
+
+    profiler: NullProfiler = NullProfiler()
+    cprofile: cProfile.Profile | None = None
+    if profile or profile_output is not None:
+        trace = profile_output is not None and profile_output.suffix == ".json"
+        profiler = checker.profiler = PhaseProfiler(trace=trace)
+        if profile_output is not None and not trace:
+            cprofile = cProfile.Profile()
+
+    if total is None and isinstance(usernames, Sized):
+        total = len(usernames)
+
+    completed = 0
+    if journal is not None and journal.completed:
+        completed = journal.completed
+        console.print(
+            f"[bold cyan]Resuming: {completed} usernames already checked "
+            f"in {journal.path}[/bold cyan]"
+        )
+
+    across = ""
+    if isinstance(checker, ShardedChecker):
+        across = f" across {checker.workers} processes"
+        if checker.workers < checker.requested:
+            console.print(
+                f"[yellow]Using {checker.workers} of {checker.requested} worker "
+                "processes: each needs a token of its own[/yellow]"
+            )
+    if total is not None:
+        console.print(
+            f"[bold cyan]Starting check for {total} usernames{across}...[/bold cyan]"
+        )
+    else:
+        console.print(f"[bold cyan]Starting check{across}...[/bold cyan]")
+
+    # Mapping results for summary
+    results_summary = {s: 0 for s in CheckStatus}
+    errors: Counter[ErrorKind] = Counter()
+    hits = 0
+    stopped = False
+    out_of_tokens = False
+    renderer: Renderer
+    if json_progress is not None:
+        renderer = JsonRenderer(total, completed, json_progress)
+    elif quiet:
+        renderer = Renderer(total, completed)
+    else:
+        renderer = RichRenderer(console, total, completed)
+    renderer.profiler = profiler
+    sink: ResultSink | None = None
+    if output_file:
+        sink = open_sink(output_file, output_format)
+
+    if metrics_port is not None:
+        console.print(
+            f"[cyan]Serving metrics on http://127.0.0.1:{metrics_port}/metrics[/cyan]"
+        )
+
+    if cprofile is not None:
+        cprofile.enable()
+    try:
+        # A settled offset only counts if it holds the same name this time
+        skip = journal.settled if journal is not None else ()
+        async with (
+            renderer,
+            AsyncSession(impersonate="chrome") as session,
+            exporting(checker.metrics, metrics_port, metrics_json),
+        ):
+            # Workers pull from the input lazily and results arrive as they finish
+            results = checker.stream_usernames(
+                usernames, session, start=start, skip=skip
+            )
+            async with aclosing(results):
+                async for result in results:
+                    # Bookkeeping only; the screen is redrawn on the renderer's clock
+                    with profiler.phase("render"):
+                        renderer.result(result)
+                    if journal is not None:
+                        with profiler.phase("journal"):
+                            journal.record(result)
+                    if on_result is not None:
+                        on_result(result)
+                    if sink is not None and not result.cached:
+                        # Buffered here, written off the loop by the sink's thread
+                        with profiler.phase("output"):
+                            await sink.write(result)
+                    results_summary[result.status] += 1
+                    if result.error is not None:
+                        errors[result.error] += 1
+                    if result.status == CheckStatus.AVAILABLE:
+                        hits += 1
+                    if until_available is not None and hits >= until_available:
+                        stopped = True
+                        break
+    except NoActiveTokensError:
+        # Nothing more can be checked, but what was is still worth reporting
+        out_of_tokens = True
+    finally:
+        if cprofile is not None:
+            cprofile.disable()
+        if sink is not None:
+            # Whatever is still buffered, so an interrupted run keeps its results
+            sink.close()
+        if journal is not None:
+            journal.close()
+
+    if out_of_tokens:
+        console.print(
+            "[bold red]All tokens were retired (rejected by Discord); stopping. "
+            "Check the tokens in config.json.[/bold red]"
+        )
+    if stopped:
+        console.print(
+            f"[bold green]Found {hits} available usernames; stopping.[/bold green]"
+        )
+    console.print(summary_table(results_summary))
+    unresolved = sum(results_summary[s] for s in UNRESOLVED)
+
+    if errors:
+        kinds = ", ".join(f"{count} {kind.value}" for kind, count in errors.items())
+        console.print(f"[yellow]Unresolved errors: {kinds}[/yellow]")
+    stats = checker.stats()
+    if stats.retried:
+        console.print(
+            f"[cyan]Retried {stats.retried} checks; {unresolved} "
+            f"usernames still unresolved after {config.max_attempts} attempts[/cyan]"
+        )
+    if checker.validator.saved:
+        reasons = ", ".join(
+            f"{count} {reason}" for reason, count in checker.validator.rejected.items()
+        )
+        console.print(
+            f"[cyan]Skipped {checker.validator.saved} invalid usernames "
+            f"({reasons})[/cyan]"
+        )
+    if stats.cache_hits:
+        console.print(
+            f"[cyan]Skipped {stats.cache_hits} usernames found taken within the "
+            f"last {config.cache_ttl / 3600:.1f}h (cached)[/cyan]"
+        )
+    if stats.known_taken_skipped:
+        console.print(
+            f"[cyan]Skipped {stats.known_taken_skipped} usernames the "
+            "known-taken filter marks as probably taken (not checked)[/cyan]"
+        )
+
+    if sink is not None and sink.written:
+        if sink.format == SinkFormat.TEXT:
+            console.print(
+                f"[bold green]Saved {hits} valid usernames to {sink.path}[/bold green]"
+            )
+        else:
+            console.print(
+                f"[bold green]Saved {sink.written} results ({hits} available) "
+                f"to {sink.path}[/bold green]"
+            )
+
+    if isinstance(profiler, PhaseProfiler):
+        console.print(profile_table(profiler))
+        if profile_output is not None:
+            if cprofile is not None:
+                cprofile.dump_stats(profile_output)
+            else:
+                profiler.write_speedscope(profile_output)
+            console.print(f"[cyan]Wrote profile to {profile_output}[/cyan]")
+
+
+async def watch_queue(
+    queue: LeaseQueue,
+    output_file: str | None = "valid_usernames.txt",
+    poll_interval: float = 2.0,
+):
+    """Follow a coordinated run until every chunk is done, then merge the results."""
+    counts = queue.progress()
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=console,
+    ) as progress:
+        task_id = progress.add_task("Waiting for nodes...", total=sum(counts.values()))
+        while True:
+            counts = queue.progress()
+            progress.update(
+                task_id,
+                completed=counts["done"],
+                description=f"Chunks leased: {counts['leased']}",
+            )
+            if queue.finished:
+                break
+            await asyncio.sleep(poll_interval)
+
+    console.print(summary_table(queue.status_counts()))
 
-    if valid_names:
-        with open("valid_usernames.txt", "a") as f:
-            for name in valid_names:
-                _ = f.write(f"{name}\n")
-        count = len(valid_names)
+    available = queue.available()
+    if available and output_file:
+        with open(output_file, "a") as f:
+            _ = f.writelines(f"{name}\n" for name in available)
         console.print(
-            f"[bold green]Saved {count} valid usernames to valid_usernames.txt[/green]"
+            f"[bold green]Saved {len(available)} valid usernames to "
+            f"{output_file}[/bold green]"
         )
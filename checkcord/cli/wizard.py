@@ -13,6 +13,7 @@ from checkcord.core.generator import (
     RandomCharGenerator,
     RemoteListGenerator,
 )
+from checkcord.core.ingest import UsernameSource
 
 console = Console()
 
@@ -122,20 +123,18 @@ class Wizard:
             console.print(
                 f"[green]Generating {count} usernames using {generator.name}...[/green]"
             )
-            usernames = await generator.generate(count)
-
-            if not usernames:
-                console.print("[red]No usernames generated![/red]")
-                return
-
-            await run_checks(usernames, self.config)
+            # Names are made as the checks ask for them
+            await run_checks(generator.stream(count), self.config, total=count)
 
     def check_file_wizard(self):
         path = Prompt.ask("Enter the path to the username file")
         try:
-            with open(path) as f:
-                usernames = [line.strip() for line in f if line.strip()]
+            usernames = UsernameSource(path)
             asyncio.run(run_checks(usernames, self.config))
+            if usernames.duplicates:
+                console.print(
+                    f"[cyan]Skipped {usernames.duplicates} duplicate lines[/cyan]"
+                )
         except FileNotFoundError:
             console.print("[red]File not found![/red]")
         except Exception as e:
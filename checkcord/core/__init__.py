@@ -1,3 +1,15 @@
-from checkcord.core.util import get_console, setup_logging
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from checkcord.core.util import get_console, setup_logging
 
 __all__ = ["get_console", "setup_logging"]
+
+
+def __getattr__(name: str) -> object:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module("checkcord.core.util"), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,96 @@
+import math
+import mmap
+import struct
+from contextlib import suppress
+from hashlib import blake2b
+from pathlib import Path
+
+MAGIC = b"CCBLOOM1"
+# magic, number of bits, number of hash functions, items added
+HEADER = struct.Struct("<8sQIQ")
+
+
+class KnownTakenFilter:
+    """
+    Memory-mapped Bloom filter of usernames known to be taken.
+
+    False positives are possible (a free name may be reported as taken at
+    roughly `error_rate`), false negatives are not.
+
+    Only one process may add to a file at a time: setting a bit is a plain
+    read-modify-write of its byte, so two writers can lose each other's
+    bits. Any number of `readonly` instances may map it alongside the writer
+    and see its names as they are added; a sharded run's workers check
+    through those while the parent adds what they find taken.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        capacity: int = 5_000_000,
+        error_rate: float = 0.01,
+        readonly: bool = False,
+    ):
+        self.path: Path = Path(path)
+        self.readonly: bool = readonly
+        if not readonly and not self.path.exists():
+            bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+            bits = (bits + 7) // 8 * 8
+            hashes = max(1, round(bits / capacity * math.log(2)))
+            # Exclusive, so a filter another process just created is never wiped
+            with suppress(FileExistsError), open(self.path, "xb") as f:
+                _ = f.write(HEADER.pack(MAGIC, bits, hashes, 0))
+                _ = f.truncate(HEADER.size + bits // 8)
+
+        # Lives as long as the map
+        self._file = open(self.path, "rb" if readonly else "r+b")  # noqa: SIM115
+        self.mm: mmap.mmap = mmap.mmap(
+            self._file.fileno(),
+            0,
+            access=mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE,
+        )
+        if len(self.mm) < HEADER.size or self.mm[:8] != MAGIC:
+            self.mm.close()
+            self._file.close()
+            raise ValueError(f"{self.path} is not a known-taken filter")
+        _, self.bits, self.hashes, self.count = HEADER.unpack_from(self.mm, 0)
+
+    def _positions(self, username: str) -> list[int]:
+        digest = blake2b(username.lower().encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [HEADER.size * 8 + (h1 + i * h2) % self.bits for i in range(self.hashes)]
+
+    def __contains__(self, username: str) -> bool:
+        mm = self.mm
+        return all(mm[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(username))
+
+    def add(self, username: str):
+        if self.readonly:
+            raise PermissionError(f"{self.path} is open read-only")
+        mm = self.mm
+        added = False
+        for pos in self._positions(username):
+            byte = mm[pos >> 3]
+            bit = 1 << (pos & 7)
+            if not byte & bit:
+                mm[pos >> 3] = byte | bit
+                added = True
+        if added:
+            self.count += 1
+
+    def __len__(self) -> int:
+        """Approximate number of distinct names added."""
+        return self.count
+
+    def flush(self):
+        if self.readonly:
+            return
+        HEADER.pack_into(self.mm, 0, MAGIC, self.bits, self.hashes, self.count)
+        self.mm.flush()
+
+    def close(self):
+        if not self.mm.closed:
+            self.flush()
+            self.mm.close()
+        self._file.close()
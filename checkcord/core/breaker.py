@@ -0,0 +1,83 @@
+import math
+from enum import Enum
+
+from checkcord.core.errors import ErrorKind
+
+
+class BreakerState(str, Enum):
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitBreaker:
+    """
+    Stops sending traffic through something that keeps failing.
+
+    Opens after `threshold` failures in a row (at once for error kinds that
+    trip it), stays open for a cooldown that doubles every time it re-opens,
+    then half-opens to let a single probe through. Fatal errors open it for
+    good.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 3,
+        reset_timeout: float = 30.0,
+        max_reset_timeout: float = 600.0,
+    ):
+        self.threshold: int = threshold
+        self.reset_timeout: float = reset_timeout
+        self.max_reset_timeout: float = max_reset_timeout
+        self.state: BreakerState = BreakerState.CLOSED
+        self.failures: int = 0  # In a row
+        self.trips: int = 0  # Times opened in a row
+        self.retry_at: float = 0.0
+        self.last_error: ErrorKind | None = None
+
+    @property
+    def dead(self) -> bool:
+        return self.retry_at == math.inf
+
+    def ready(self, now: float) -> bool:
+        """Whether a request may go out now (without committing to one)."""
+        if self.state is BreakerState.CLOSED:
+            return True
+        # Half open means the probe is already out
+        return self.state is BreakerState.OPEN and now >= self.retry_at
+
+    def begin(self, now: float):
+        """A request is going out; past the cooldown that makes it the probe."""
+        if self.state is BreakerState.OPEN and now >= self.retry_at:
+            self.state = BreakerState.HALF_OPEN
+
+    def record_success(self):
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.last_error = None
+
+    def record_failure(self, now: float, kind: ErrorKind | None = None) -> bool:
+        """Count a failure, returning True if it opened the breaker."""
+        self.failures += 1
+        self.last_error = kind
+        if kind is not None and kind.fatal:
+            self.state = BreakerState.OPEN
+            self.retry_at = math.inf
+            return True
+
+        if self.state is BreakerState.OPEN:
+            return False  # Requests sent before it opened are still landing
+
+        tripped = kind is not None and kind.trips
+        if (
+            self.state is BreakerState.HALF_OPEN
+            or tripped
+            or self.failures >= self.threshold
+        ):
+            cooldown = min(self.reset_timeout * 2**self.trips, self.max_reset_timeout)
+            self.trips += 1
+            self.state = BreakerState.OPEN
+            self.retry_at = now + cooldown
+            return True
+        return False
@@ -0,0 +1,124 @@
+import asyncio
+import sqlite3
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from checkcord.models import CheckRecord, CheckStatus
+
+# Only definitive answers are worth remembering
+CACHEABLE = frozenset({CheckStatus.AVAILABLE, CheckStatus.TAKEN})
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    username TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    checked_at REAL NOT NULL,
+    token TEXT,
+    proxy TEXT
+)
+"""
+
+
+def cache_key(username: str) -> str:
+    return username.strip().lower()
+
+
+class ResultCache:
+    """
+    On-disk store of previous check results, keyed by normalized username.
+
+    Writes are buffered and committed in batches so recording a result costs
+    a list append on the hot path. The connection belongs to one thread, which
+    runs the batches and the lookups in the order they were asked for, so the
+    event loop never waits on SQLite and a lookup sees every batch before it.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        ttl: float = 0.0,
+        batch_size: int = 500,
+        flush_interval: float = 5.0,
+    ):
+        self.path: Path = Path(path)
+        self.ttl: float = ttl
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self._pending: list[tuple[str, str, float, str | None, str | None]] = []
+        self._last_flush: float = time.monotonic()
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="checkcord-cache"
+        )
+
+        # Opened here, then only used by the executor's thread
+        self.conn: sqlite3.Connection = sqlite3.connect(
+            self.path, check_same_thread=False
+        )
+        _ = self.conn.execute("PRAGMA journal_mode=WAL")
+        _ = self.conn.execute("PRAGMA synchronous=NORMAL")
+        _ = self.conn.execute(SCHEMA)
+        self.conn.commit()
+
+    async def lookup(self, username: str) -> CheckRecord | None:
+        """Return the stored result if it is younger than the TTL."""
+        if self.ttl <= 0:
+            return None
+
+        loop = asyncio.get_running_loop()
+        row = await loop.run_in_executor(self._executor, self._select, username)
+        if row is None:
+            return None
+
+        status, checked_at = row
+        age = time.time() - checked_at
+        if age > self.ttl:
+            return None
+
+        return CheckRecord(
+            username=username,
+            status=CheckStatus(status),
+            message=f"Cached ({age / 60:.0f}m ago)",
+            cached=True,
+        )
+
+    def _select(self, username: str) -> tuple[str, float] | None:
+        return self.conn.execute(
+            "SELECT status, checked_at FROM results WHERE username = ?",
+            (cache_key(username),),
+        ).fetchone()
+
+    def record(
+        self, result: CheckRecord, token: str | None = None, proxy: str | None = None
+    ):
+        if result.status not in CACHEABLE:
+            return
+
+        self._pending.append(
+            (cache_key(result.username), result.status.value, time.time(), token, proxy)
+        )
+        if (
+            len(self._pending) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            _ = self.flush()
+
+    def flush(self) -> Future[None]:
+        """Hand the buffered results to the cache's thread to commit."""
+        self._last_flush = time.monotonic()
+        batch, self._pending = self._pending, []
+        return self._executor.submit(self._insert, batch)
+
+    def _insert(self, batch: list[tuple[str, str, float, str | None, str | None]]):
+        if not batch:
+            return
+
+        with self.conn:
+            _ = self.conn.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)", batch
+            )
+
+    def close(self):
+        _ = self.flush()
+        self._executor.shutdown(wait=True)
+        self.conn.close()
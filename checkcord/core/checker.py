@@ -1,151 +1,639 @@
 import asyncio
-import itertools
-from collections.abc import Iterator
+import time
+from collections import deque
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    Callable,
+    Container,
+    Iterable,
+)
+from contextlib import aclosing
+from dataclasses import dataclass, fields
+from functools import partial
 from typing import cast
 
 from curl_cffi.requests import AsyncSession, Response
 
-from checkcord.core.ratelimiter import GlobalRateLimiter
+from checkcord.core.bloom import KnownTakenFilter
+from checkcord.core.cache import ResultCache
+from checkcord.core.errors import ErrorKind, classify_exception, classify_response
+from checkcord.core.metrics import MetricsRegistry
+from checkcord.core.pool import WorkerPool, numbered
+from checkcord.core.profiler import NullProfiler
+from checkcord.core.proxies import ProxyPool, ProxyState
+from checkcord.core.ratelimiter import GlobalRateLimiter, RateLimitInfo
+from checkcord.core.retry import RetryScheduler
+from checkcord.core.tokens import TokenPool, TokenState
 from checkcord.core.util import logger
-from checkcord.models import (
-    AppConfig,
-    CheckResult,
-    CheckStatus,
-    WebhookEmbed,
-    WebhookPayload,
-)
+from checkcord.core.validator import UsernameValidator
+from checkcord.core.webhook import WebhookDispatcher
+from checkcord.models import AppConfig, CheckRecord, CheckResult, CheckStatus
+
+API_BASE = "https://discord.com/api/v9"
+POMELO_PATH = "/users/@me/pomelo-attempt"
 
 # URL for non-destructive username availability check
-URL = "https://discord.com/api/v9/users/@me/pomelo-attempt"
+URL = API_BASE + POMELO_PATH
+
+ERROR_MESSAGES = {
+    ErrorKind.AUTH: "Unauthorized (Check Token)",
+    ErrorKind.FORBIDDEN: "Forbidden (Check Account)",
+    ErrorKind.CLOUDFLARE: "Blocked by Cloudflare",
+}
+
+# How long to hold everything when Cloudflare blocks a direct connection
+CLOUDFLARE_BACKOFF = 60.0
+
+# Recent hits kept on the checker; every hit is streamed out as it is found
+RECENT_HITS = 1000
+
+
+@dataclass(slots=True)
+class CheckerStats:
+    """Counts for the run summary beyond the per-status totals."""
+
+    cache_hits: int = 0
+    known_taken_skipped: int = 0
+    retried: int = 0
+
+    def add(self, other: "CheckerStats"):
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
+
+
+class CheckerMetrics:
+    """The checker's metric families, registered on `registry`."""
+
+    def __init__(self, registry: MetricsRegistry):
+        self.requests = registry.counter(
+            "checkcord_requests_total", "Check requests made, by outcome", ["outcome"]
+        )
+        self.errors = registry.counter(
+            "checkcord_errors_total", "Failed check requests, by cause", ["kind"]
+        )
+        self.rate_limits = registry.counter(
+            "checkcord_rate_limits_total",
+            "429 responses, by the scope that was backed off",
+            ["scope"],
+        )
+        self.results = registry.counter(
+            "checkcord_results_total", "Usernames finished, by final status", ["status"]
+        )
+        self.retries = registry.counter(
+            "checkcord_retries_total", "Checks scheduled for another attempt"
+        )
+        self.skipped = registry.counter(
+            "checkcord_skipped_total",
+            "Usernames answered without a request",
+            ["reason"],
+        )
+        self.token_latency = registry.histogram(
+            "checkcord_token_latency_seconds", "Request round trip, by token", ["token"]
+        )
+        self.proxy_latency = registry.histogram(
+            "checkcord_proxy_latency_seconds", "Request round trip, by proxy", ["proxy"]
+        )
+        self.in_flight = registry.gauge(
+            "checkcord_in_flight", "Requests waiting on a response"
+        )
+        self.queue_depth = registry.gauge(
+            "checkcord_queue_depth", "Items waiting, by queue", ["queue"]
+        )
+        self.limiter_wait = registry.counter(
+            "checkcord_limiter_wait_seconds_total",
+            "Time requests spent held by the global limiter, by reason",
+            ["reason"],
+        )
+        self.cooldown_wait = registry.counter(
+            "checkcord_cooldown_wait_seconds_total",
+            "Time requests spent waiting on resting tokens or proxies",
+            ["pool"],
+        )
+        self.tokens_active = registry.gauge(
+            "checkcord_tokens_active", "Tokens not retired"
+        )
+        self.proxies_healthy = registry.gauge(
+            "checkcord_proxies_healthy", "Proxies not quarantined"
+        )
+        self.webhook_hits = registry.counter(
+            "checkcord_webhook_hits_total", "Hits posted to the webhook", ["outcome"]
+        )
+        self.webhook_lag = registry.histogram(
+            "checkcord_webhook_lag_seconds",
+            "Time from finding a hit to its webhook delivery",
+            buckets=(0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 300.0),
+        )
 
 
 class DiscordChecker:
-    def __init__(self, config: AppConfig):
+    def __init__(self, config: AppConfig, shard: tuple[int, int] | None = None):
         self.config: AppConfig = config
-        self.valid_usernames: list[str] = []
-        self.headers: dict[str, str] = {
-            "Authorization": config.token,
-            "Content-Type": "application/json",
-        }
+        # (index, count): this process only uses its share of proxies.txt
+        self.shard: tuple[int, int] | None = shard
+        self.url: str = config.api_base.rstrip("/") + POMELO_PATH
+        self.valid_usernames: deque[str] = deque(maxlen=RECENT_HITS)
+        self.token_pool: TokenPool = TokenPool(config.accounts())
         self.semaphore: asyncio.Semaphore = asyncio.Semaphore(config.thread_count)
         self.rate_limiter: GlobalRateLimiter = GlobalRateLimiter(
-            initial_delay=config.retry_delay
+            initial_delay=config.request_interval(),
+            burst=config.burst,
+            recovery_after=config.recovery_after,
         )
 
-        self.proxies: list[str] = []
-        self.proxy_cycle: Iterator[str] | None = None
+        self.proxy_pool: ProxyPool = ProxyPool([])
         self._load_proxies()
 
+        self.cache: ResultCache | None = (
+            ResultCache(config.cache_path, ttl=config.cache_ttl)
+            if config.cache_path
+            else None
+        )
+        # A shard only reads the filter; the parent adds what its workers find
+        self.known_taken: KnownTakenFilter | None = (
+            KnownTakenFilter(
+                config.known_taken_path,
+                capacity=config.known_taken_capacity,
+                readonly=shard is not None,
+            )
+            if config.known_taken_path
+            else None
+        )
+        self.cache_hits: int = 0
+        self.known_taken_skipped: int = 0
+        self.validator: UsernameValidator = UsernameValidator()
+        self.retries: RetryScheduler[tuple[int, str]] = RetryScheduler(
+            max_attempts=config.max_attempts,
+            base_delay=config.retry_backoff,
+            max_delay=config.retry_backoff_max,
+        )
+
+        self.metrics: MetricsRegistry = MetricsRegistry()
+        self._metrics: CheckerMetrics = CheckerMetrics(self.metrics)
+        self.metrics.on_collect(self._collect_metrics)
+        self._pool: WorkerPool[tuple[int, str], CheckRecord] | None = None
+        # Swapped for a PhaseProfiler by --profile
+        self.profiler: NullProfiler = NullProfiler()
+
+        # Pydantic HttpUrl needs str() conversion
+        self.webhooks: WebhookDispatcher | None = (
+            WebhookDispatcher(str(config.webhook_url), lag=self._metrics.webhook_lag)
+            if config.webhook_url
+            else None
+        )
+
     def _load_proxies(self):
-        try:
-            with open("proxies.txt") as f:
-                self.proxies = [line.strip() for line in f if line.strip()]
-            if self.proxies:
-                self.proxy_cycle = itertools.cycle(self.proxies)
-                logger.info(f"Loaded {len(self.proxies)} proxies.")
-        except FileNotFoundError:
-            logger.info("No proxies.txt found, running directly.")
-
-    async def check_username(self, session: AsyncSession, username: str) -> CheckResult:
-        async with self.semaphore:
-            # Global Rate Limit Wait
-            await self.rate_limiter.wait_for_token()
+        self.proxy_pool = ProxyPool.from_file()
+        if self.shard is not None:
+            self.proxy_pool.shard(*self.shard)
+        # Proxies pinned to a token are scheduled like any other
+        for token in self.token_pool.tokens:
+            for url in token.proxies:
+                self.proxy_pool.add(url)
 
-            payload = {"username": username}
-            proxy = next(self.proxy_cycle) if self.proxy_cycle else None
+    @property
+    def proxies(self) -> list[str]:
+        return [p.url for p in self.proxy_pool.proxies]
 
+    async def check_username(self, session: AsyncSession, username: str) -> CheckRecord:
+        profiler = self.profiler
+        # Global Rate Limit Wait (before taking a slot, so pacing never idles one)
+        with profiler.phase("limiter"):
+            await self.rate_limiter.wait_for_token()
+
+        with profiler.phase("slot"):
+            await self.semaphore.acquire()
+        try:
+            with profiler.phase("token"):
+                token = await self.token_pool.acquire()
             try:
-                # Use proxy if available
-                # Explicit type for strict mode
+                with profiler.phase("proxy"):
+                    proxy_state = await self.proxy_pool.acquire(token.proxies or None)
+                proxy = proxy_state.url if proxy_state else None
+                self._metrics.in_flight.inc()
+                try:
+                    result = await self._attempt(session, token, proxy_state, username)
+                finally:
+                    self._metrics.in_flight.inc(amount=-1)
+            finally:
+                self.token_pool.release(token)
+        finally:
+            self.semaphore.release()
+
+        if proxy_state is not None:
+            result.proxy = proxy_state.label
+        self._metrics.requests.inc(result.status.value.lower())
+        if result.error is not None:
+            self._metrics.errors.inc(result.error.value)
+
+        with profiler.phase("cache"):
+            if self.cache is not None:
+                self.cache.record(result, token.label, proxy)
+            if (
+                self.known_taken is not None
+                and not self.known_taken.readonly
+                and result.status == CheckStatus.TAKEN
+            ):
+                self.known_taken.add(username)
+        return result
+
+    async def _check_or_cached(
+        self, session: AsyncSession, username: str
+    ) -> CheckRecord:
+        """Answer a name found taken from the result cache, otherwise check it."""
+        with self.profiler.phase("cache"):
+            cached = (
+                await self.cache.lookup(username) if self.cache is not None else None
+            )
+            if cached is not None and cached.status == CheckStatus.TAKEN:
+                self.cache_hits += 1
+                self._metrics.skipped.inc("cached")
+                return cached
+        # An available name may have been claimed since, so it is always checked
+        return await self.check_username(session, username)
+
+    async def _known_taken(self, item: tuple[int, str]) -> CheckRecord | None:
+        """
+        Settle a name the known-taken filter has seen before it is queued.
+
+        The filter never forgets and has false positives, so a hit is only a
+        reason not to spend a request, never a TAKEN answer. A fresh cache
+        entry is still preferred: a cached available name goes on to be
+        checked again, since the filter's verdict is older.
+        """
+        offset, username = item
+        assert self.known_taken is not None
+        if username not in self.known_taken:
+            return None
+        with self.profiler.phase("cache"):
+            cached = (
+                await self.cache.lookup(username) if self.cache is not None else None
+            )
+        if cached is None:
+            self.known_taken_skipped += 1
+            self._metrics.skipped.inc("known_taken")
+            cached = CheckRecord(
+                username=username,
+                status=CheckStatus.SKIPPED,
+                message="Probably taken (known-taken filter), not checked",
+            )
+        elif cached.status == CheckStatus.TAKEN:
+            self.cache_hits += 1
+            self._metrics.skipped.inc("cached")
+        else:
+            return None
+        cached.offset = offset
+        return cached
+
+    async def _check_numbered(
+        self, session: AsyncSession, item: tuple[int, str]
+    ) -> CheckRecord:
+        offset, username = item
+        with self.profiler.phase("check"):
+            result = await self._check_or_cached(session, username)
+        result.offset = offset
+        return result
+
+    async def _attempt(
+        self,
+        session: AsyncSession,
+        token: TokenState,
+        proxy_state: ProxyState | None,
+        username: str,
+    ) -> CheckRecord:
+        payload = {"username": username}
+        proxy = proxy_state.url if proxy_state else None
+        started = time.monotonic()
+
+        try:
+            # Use proxy if available
+            # Explicit type for strict mode
+            with self.profiler.phase("request"):
                 response: Response = await session.post(  # type: ignore
-                    URL, headers=self.headers, json=payload, proxy=proxy
+                    self.url, headers=token.headers, json=payload, proxy=proxy
                 )
+        except Exception as e:
+            kind = classify_exception(e)
+            if proxy_state:
+                self.proxy_pool.mark_failure(proxy_state, kind)
+            else:
+                # Direct requests have no proxy breaker; the token's rests them
+                self.token_pool.mark_failure(token, kind, f"{kind.value}: {e}")
+            logger.error(f"Error checking {username}: {kind.value}: {e}")
+            return CheckRecord(
+                username=username, status=CheckStatus.ERROR, message=str(e), error=kind
+            )
 
-                # Handle Rate Limits Globally
-                if response.status_code == 429:
-                    try:
-                        # json() returns Any, cast it
-                        limit_data = cast(dict[str, object], response.json())  # type: ignore
-                        # safe cast
-                        ra_val = limit_data.get("retry_after", 5.0)
-                        retry_after: float = (
-                            float(ra_val)
-                            if isinstance(ra_val, (int, float, str))
-                            else 5.0
-                        )
-                    except Exception:
-                        retry_after = 5.0
-
-                    # Trigger Global Backoff
-                    await self.rate_limiter.trigger_backoff(retry_after)
-
-                    return CheckResult(
-                        username=username,
-                        status=CheckStatus.RATE_LIMITED,
-                        message=f"Rate limited, pausing for {retry_after}s",
-                    )
+        latency = time.monotonic() - started
+        self._metrics.token_latency.observe(latency, token.label)
+        if proxy_state:
+            self._metrics.proxy_latency.observe(latency, proxy_state.label)
+        with self.profiler.phase("parse"):
+            result = await self._parse(
+                session, token, proxy_state, response, username, latency
+            )
+        result.latency = latency
+        return result
 
-                if response.status_code in (401, 403):
-                    return CheckResult(
-                        username=username,
-                        status=CheckStatus.ERROR,
-                        message="Unauthorized (Check Token)",
-                    )
+    async def _parse(
+        self,
+        session: AsyncSession,
+        token: TokenState,
+        proxy_state: ProxyState | None,
+        response: Response,
+        username: str,
+        latency: float,
+    ) -> CheckRecord:
 
-                if response.status_code != 200:
-                    return CheckResult(
-                        username=username,
-                        status=CheckStatus.ERROR,
-                        message=f"HTTP {response.status_code}",
+        try:
+            # Track the bucket budget from every response, not just 429s
+            rl_info = RateLimitInfo.from_headers(response.headers)
+            if rl_info is not None:
+                token.limiter.update(rl_info)
+                if proxy_state:
+                    proxy_state.limiter.update(rl_info)
+
+            kind = classify_response(response.status_code, response.headers)
+            if kind is not None:
+                if await self._handle_error(token, proxy_state, kind, response):
+                    proxy_state = None
+                return CheckRecord(
+                    username=username,
+                    status=CheckStatus.ERROR,
+                    message=ERROR_MESSAGES.get(kind, f"HTTP {response.status_code}"),
+                    error=kind,
+                )
+
+            # Handle Rate Limits
+            if response.status_code == 429:
+                is_global = rl_info is not None and rl_info.is_global
+                try:
+                    # json() returns Any, cast it
+                    limit_data = cast(dict[str, object], response.json())  # type: ignore
+                    # safe cast
+                    ra_val = limit_data.get("retry_after", 5.0)
+                    retry_after: float = (
+                        float(ra_val) if isinstance(ra_val, (int, float, str)) else 5.0
+                    )
+                    is_global = is_global or bool(limit_data.get("global"))
+                except Exception:
+                    retry_after = (
+                        rl_info.retry_after
+                        if rl_info and rl_info.retry_after is not None
+                        else 5.0
                     )
 
+                if await self._handle_rate_limit(
+                    token, proxy_state, rl_info, retry_after, is_global
+                ):
+                    proxy_state = None
+
+                return CheckRecord(
+                    username=username,
+                    status=CheckStatus.RATE_LIMITED,
+                    message=f"Rate limited, pausing for {retry_after}s",
+                )
+
+            if response.status_code != 200:
+                return CheckRecord(
+                    username=username,
+                    status=CheckStatus.ERROR,
+                    message=f"HTTP {response.status_code}",
+                    error=ErrorKind.UNKNOWN,
+                )
+
+            if token.breaker.failures:
+                # Failures only open the breaker when they come in a row
+                token.breaker.record_success()
+            with self.profiler.phase("json"):
                 success_data = cast(dict[str, object], response.json())  # type: ignore
 
-                if success_data.get("taken"):
-                    return CheckResult(
+            if success_data.get("taken"):
+                with self.profiler.phase("result"):
+                    return CheckRecord(
                         username=username,
                         status=CheckStatus.TAKEN,
                         message="Taken",
                     )
-                else:
-                    # "taken": false (or missing) means available!
-                    self.valid_usernames.append(username)
-                    await self.send_webhook(session, username)
-                    return CheckResult(
+            else:
+                # "taken": false (or missing) means available!
+                self.valid_usernames.append(username)
+                with self.profiler.phase("webhook"):
+                    self.send_webhook(session, username)
+                with self.profiler.phase("result"):
+                    return CheckRecord(
                         username=username,
                         status=CheckStatus.AVAILABLE,
                         message="Available!",
                     )
 
-            except Exception as e:
-                logger.error(f"Error checking {username}: {e}")
-                return CheckResult(
-                    username=username, status=CheckStatus.ERROR, message=str(e)
-                )
+        except Exception as e:
+            logger.error(f"Error checking {username}: {e}")
+            return CheckRecord(
+                username=username,
+                status=CheckStatus.ERROR,
+                message=str(e),
+                error=ErrorKind.UNKNOWN,
+            )
+        finally:
+            if proxy_state:
+                # The proxy delivered a response, so it is healthy
+                self.proxy_pool.mark_success(proxy_state, latency)
+
+    @staticmethod
+    def _retryable(result: CheckRecord) -> bool:
+        if result.status is CheckStatus.RATE_LIMITED:
+            return True
+        return result.status is CheckStatus.ERROR and (
+            result.error is None or result.error.retryable
+        )
+
+    async def _handle_error(
+        self,
+        token: TokenState,
+        proxy_state: ProxyState | None,
+        kind: ErrorKind,
+        response: Response,
+    ) -> bool:
+        """
+        Open the breaker of whatever caused `kind`.
+
+        Returns True when the proxy was marked failed (and so already released).
+        """
+        reason = f"HTTP {response.status_code} ({kind.value})"
+        if kind.fatal:
+            # Every later request on this token would fail the same way
+            self.token_pool.mark_failure(token, kind, reason)
+            return False
+        if kind.blames_connection and proxy_state:
+            self.proxy_pool.mark_failure(proxy_state, kind)
+            return True
+        if kind.retryable:
+            # Discord or our own connection is failing: a streak rests the
+            # token and a single probe tells when to carry on
+            self.token_pool.mark_failure(token, kind, reason)
+        if kind is ErrorKind.CLOUDFLARE:
+            # Our own IP is blocked; hammering it only extends the block
+            await self.rate_limiter.trigger_backoff(CLOUDFLARE_BACKOFF)
+        return False
+
+    async def _handle_rate_limit(
+        self,
+        token: TokenState,
+        proxy_state: ProxyState | None,
+        rl_info: RateLimitInfo | None,
+        retry_after: float,
+        is_global: bool,
+    ) -> bool:
+        """
+        Back off only the scope Discord limited.
+
+        Returns True when the proxy was cooled down (and so already released).
+        """
+        if is_global:
+            if len(self.token_pool.active) > 1:
+                # Another token can keep going while this one rests
+                self._metrics.rate_limits.inc("token")
+                self.token_pool.cool_down(token, retry_after)
+            else:
+                # Trigger Global Backoff
+                self._metrics.rate_limits.inc("global")
+                await self.rate_limiter.trigger_backoff(retry_after)
+            return False
+
+        scope = rl_info.scope if rl_info else None
+        if proxy_state and scope != "user":
+            # Only this proxy is limited; keep the rest running
+            self._metrics.rate_limits.inc("proxy")
+            self.proxy_pool.mark_rate_limited(proxy_state, retry_after)
+            return True
+
+        if rl_info and rl_info.bucket:
+            self._metrics.rate_limits.inc("bucket")
+            await token.limiter.trigger_backoff(retry_after, rl_info.bucket)
+        elif len(self.token_pool.active) > 1:
+            self._metrics.rate_limits.inc("token")
+            self.token_pool.cool_down(token, retry_after)
+        else:
+            self._metrics.rate_limits.inc("global")
+            await self.rate_limiter.trigger_backoff(retry_after)
+        return False
+
+    def send_webhook(self, session: AsyncSession, username: str):
+        """Queue a hit for the webhook without waiting on delivery."""
+        if self.webhooks is not None:
+            self.webhooks.submit(session, username)
 
-    async def send_webhook(self, session: AsyncSession, username: str):
-        if not self.config.webhook_url:
+    async def stream_usernames(
+        self,
+        usernames: Iterable[str] | AsyncIterable[str],
+        session: AsyncSession | None = None,
+        start: int = 0,
+        skip: Container[int] | Callable[[int, str], bool] = (),
+    ) -> AsyncGenerator[CheckRecord, None]:
+        """
+        Check usernames lazily with a fixed worker pool, yielding as they finish.
+
+        Names Discord would reject are dropped before they are queued. Each
+        result carries its input offset among the valid names (counted from
+        `start`); offsets in `skip` (or names it says to skip, see
+        `numbered`) are left out, which is how a journal resumes a run.
+
+        Rate limited and failed checks are retried with backoff; a name is
+        only yielded with one of those statuses once it ran out of attempts.
+
+        Only a few names are pulled ahead of the workers, so an async
+        `usernames` (such as `GeneratorStrategy.stream`) is paused while the
+        checks catch up. Close the stream (or leave an `aclosing` block) to
+        stop a run early.
+        """
+        if session is None:
+            async with (
+                AsyncSession(impersonate="chrome") as own_session,
+                aclosing(
+                    self.stream_usernames(usernames, own_session, start, skip)
+                ) as results,
+            ):
+                async for result in results:
+                    yield result
             return
 
-        embed = WebhookEmbed(
-            title=f"**{username}**",
-            description="Username is available!",
-            color=0x00FF00,
-        )
-        payload = WebhookPayload(embeds=[embed])
+        # Closed as soon as the consumer stops early, not whenever it is collected
+        valid = self.validator.filter(usernames)
+        items = numbered(valid, start, skip)
+        async with aclosing(self.stream_numbered(items, session)) as results:
+            async for result in results:
+                yield result
 
+    async def stream_numbered(
+        self,
+        items: Iterable[tuple[int, str]] | AsyncIterable[tuple[int, str]],
+        session: AsyncSession,
+    ) -> AsyncGenerator[CheckRecord, None]:
+        """Check already validated `(offset, username)` pairs, retrying failures."""
+        pool: WorkerPool[tuple[int, str], CheckRecord] = WorkerPool(
+            partial(self._check_numbered, session), self.config.thread_count
+        )
+        self._pool = pool
+        attempts: dict[int, int] = {}  # Failures so far, for names awaiting retry
+        # Names the filter settles never take a worker's place in the queue
+        shortcut = self._known_taken if self.known_taken is not None else None
         try:
-            # Pydantic HttpUrl needs str() conversion
-            # curl_cffi supports json parameter
-            _ = await session.post(
-                str(self.config.webhook_url), json=payload.model_dump()
-            )  # type: ignore
-        except Exception as e:
-            logger.error(f"Failed to send webhook for {username}: {e}")
-
-    async def process_usernames(self, usernames: list[str]) -> list[CheckResult]:
-        # Using AsyncSession with impersonate='chrome'
-        async with AsyncSession(impersonate="chrome") as session:
-            tasks = [self.check_username(session, user) for user in usernames]
-            results = await asyncio.gather(*tasks)
-            return results
+            async with aclosing(
+                pool.imap_unordered(items, self.retries, shortcut)
+            ) as results:
+                async for result in results:
+                    offset = cast(int, result.offset)
+                    if self._retryable(result):
+                        attempt = attempts.get(offset, 1)
+                        if self.retries.schedule((offset, result.username), attempt):
+                            attempts[offset] = attempt + 1
+                            self._metrics.retries.inc()
+                            continue
+                    result.attempts = attempts.pop(offset, 1)
+                    self._metrics.results.inc(result.status.value.lower())
+                    yield result
+        finally:
+            if self.webhooks is not None:
+                await self.webhooks.aclose()
+            if self.cache is not None:
+                _ = self.cache.flush()
+            if self.known_taken is not None:
+                self.known_taken.flush()
+
+    def _collect_metrics(self):
+        """Refresh the metrics that mirror state kept elsewhere."""
+        m = self._metrics
+        m.queue_depth.set(self._pool.queued if self._pool else 0, "input")
+        m.queue_depth.set(len(self.retries), "retry")
+        m.queue_depth.set(self.webhooks.pending if self.webhooks else 0, "webhook")
+        for reason, seconds in self.rate_limiter.waited.items():
+            m.limiter_wait.set_total(seconds, reason)
+        m.cooldown_wait.set_total(self.token_pool.waited, "token")
+        m.cooldown_wait.set_total(self.proxy_pool.waited, "proxy")
+        m.tokens_active.set(len(self.token_pool.active))
+        m.proxies_healthy.set(self.proxy_pool.healthy)
+        if self.webhooks is not None:
+            m.webhook_hits.set_total(self.webhooks.sent, "sent")
+            m.webhook_hits.set_total(self.webhooks.failed, "failed")
+
+    def stats(self) -> CheckerStats:
+        return CheckerStats(
+            cache_hits=self.cache_hits,
+            known_taken_skipped=self.known_taken_skipped,
+            retried=self.retries.scheduled,
+        )
+
+    async def process_usernames(
+        self, usernames: Iterable[str] | AsyncIterable[str]
+    ) -> list[CheckResult]:
+        """
+        Check all usernames and collect the results in completion order.
+
+        Keeps every result in memory; long runs should consume
+        `stream_usernames` instead.
+        """
+        return [
+            CheckResult.from_record(record)
+            async for record in self.stream_usernames(usernames)
+        ]
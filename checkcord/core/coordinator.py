@@ -0,0 +1,287 @@
+import asyncio
+import contextlib
+import os
+import socket
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from curl_cffi.requests import AsyncSession
+
+from checkcord.core.checker import CheckerStats, DiscordChecker
+from checkcord.core.keyspace import Keyspace
+from checkcord.core.metrics import exporting
+from checkcord.core.util import logger
+from checkcord.models import AppConfig, CheckRecord, CheckStatus
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    id INTEGER PRIMARY KEY,
+    start INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    keyspace TEXT,
+    state TEXT NOT NULL DEFAULT 'pending',
+    owner TEXT,
+    lease_until REAL NOT NULL DEFAULT 0,
+    leases INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS chunks_state ON chunks (state, lease_until);
+CREATE TABLE IF NOT EXISTS results (
+    offset INTEGER PRIMARY KEY,
+    username TEXT NOT NULL,
+    status TEXT NOT NULL,
+    message TEXT,
+    worker TEXT,
+    checked_at REAL NOT NULL
+);
+"""
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+@dataclass(slots=True)
+class Chunk:
+    id: int
+    start: int  # Input offset of the first username
+    usernames: list[str]
+
+    def items(self) -> Iterator[tuple[int, str]]:
+        return enumerate(self.usernames, self.start)
+
+
+class LeaseQueue:
+    """
+    Work queue in a SQLite file shared by every node of a run.
+
+    Input is split into chunks that nodes lease for a limited time and keep
+    renewing while they work. A lease that runs out (its node died or hung)
+    puts the chunk back up for grabs, and results from a node that lost its
+    lease are ignored, so every name ends up checked by exactly one node.
+
+    Leases use wall-clock time, so nodes on different hosts need roughly
+    synchronised clocks. SQLite locking is unreliable on some network file
+    systems; share the file over one that supports it.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path: Path = Path(path)
+        # Autocommit, with explicit transactions where several statements must agree
+        self.conn: sqlite3.Connection = sqlite3.connect(
+            self.path, timeout=30.0, isolation_level=None
+        )
+        _ = self.conn.execute("PRAGMA journal_mode=WAL")
+        _ = self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # IMMEDIATE takes the write lock up front, so two nodes can never
+        # both see a chunk as free and lease it
+        _ = self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except BaseException:
+            _ = self.conn.execute("ROLLBACK")
+            raise
+        _ = self.conn.execute("COMMIT")
+
+    def add_lines(self, usernames: Iterable[str], chunk_size: int = 500) -> int:
+        """Append `usernames` as chunks after any existing input; returns the count."""
+        with self._transaction() as conn:
+            row = conn.execute("SELECT MAX(start + size) FROM chunks").fetchone()
+            offset = start = row[0] or 0
+
+            def insert(batch: list[str]):
+                _ = conn.execute(
+                    "INSERT INTO chunks (start, size, payload) VALUES (?, ?, ?)",
+                    (offset, len(batch), "\n".join(batch)),
+                )
+
+            batch: list[str] = []
+            for name in usernames:
+                batch.append(name)
+                if len(batch) >= chunk_size:
+                    insert(batch)
+                    offset += len(batch)
+                    batch = []
+            if batch:
+                insert(batch)
+                offset += len(batch)
+        return offset - start
+
+    def add_keyspace(
+        self,
+        keyspace: Keyspace,
+        start: int = 0,
+        end: int | None = None,
+        chunk_size: int = 500,
+    ) -> int:
+        """
+        Append keyspace indices `[start, end)` as chunks; returns the count.
+
+        Chunks only hold the first index, and nodes list their names when
+        they lease them, so queueing a whole sweep stays small.
+        """
+        end = keyspace.size if end is None else min(end, keyspace.size)
+        with self._transaction() as conn:
+            row = conn.execute("SELECT MAX(start + size) FROM chunks").fetchone()
+            offset = row[0] or 0
+            _ = conn.executemany(
+                "INSERT INTO chunks (start, size, payload, keyspace) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    (
+                        offset + first - start,
+                        min(chunk_size, end - first),
+                        str(first),
+                        keyspace.spec,
+                    )
+                    for first in range(start, end, chunk_size)
+                ),
+            )
+        return max(end - start, 0)
+
+    def lease(self, owner: str, lease_time: float = 60.0) -> Chunk | None:
+        """Take the next free or abandoned chunk, or None if there is none now."""
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT id, start, size, payload, keyspace FROM chunks "
+                "WHERE state = 'pending' OR (state = 'leased' AND lease_until < ?) "
+                "ORDER BY id LIMIT 1",
+                (now,),
+            ).fetchone()
+            if row is None:
+                return None
+            chunk_id, start, size, payload, spec = row
+            _ = conn.execute(
+                "UPDATE chunks SET state = 'leased', owner = ?, lease_until = ?, "
+                "leases = leases + 1 WHERE id = ?",
+                (owner, now + lease_time, chunk_id),
+            )
+        if spec is None:
+            return Chunk(chunk_id, start, payload.split("\n"))
+        first = int(payload)
+        names = Keyspace.from_spec(spec).names(first, first + size)
+        return Chunk(chunk_id, start, list(names))
+
+    def renew(self, chunk: Chunk, owner: str, lease_time: float = 60.0) -> bool:
+        """Extend a lease; False means it was lost to another node."""
+        cursor = self.conn.execute(
+            "UPDATE chunks SET lease_until = ? "
+            "WHERE id = ? AND owner = ? AND state = 'leased'",
+            (time.time() + lease_time, chunk.id, owner),
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, chunk: Chunk, owner: str, results: list[CheckRecord]) -> bool:
+        """Store a chunk's results, unless its lease went to another node."""
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE chunks SET state = 'done', lease_until = 0 "
+                "WHERE id = ? AND owner = ? AND state = 'leased'",
+                (chunk.id, owner),
+            )
+            if cursor.rowcount != 1:
+                return False
+            _ = conn.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (r.offset, r.username, r.status.value, r.message, owner, now)
+                    for r in results
+                ],
+            )
+        return True
+
+    def release(self, chunk: Chunk, owner: str):
+        """Give a chunk back unfinished so another node can take it at once."""
+        _ = self.conn.execute(
+            "UPDATE chunks SET state = 'pending', owner = NULL, lease_until = 0 "
+            "WHERE id = ? AND owner = ? AND state = 'leased'",
+            (chunk.id, owner),
+        )
+
+    def progress(self) -> dict[str, int]:
+        """Chunks per state ('pending', 'leased', 'done')."""
+        rows = self.conn.execute("SELECT state, COUNT(*) FROM chunks GROUP BY state")
+        counts = {"pending": 0, "leased": 0, "done": 0}
+        counts.update({state: n for state, n in rows})
+        return counts
+
+    @property
+    def finished(self) -> bool:
+        counts = self.progress()
+        return counts["pending"] == 0 and counts["leased"] == 0
+
+    def status_counts(self) -> dict[CheckStatus, int]:
+        rows = self.conn.execute("SELECT status, COUNT(*) FROM results GROUP BY status")
+        counts = {s: 0 for s in CheckStatus}
+        counts.update({CheckStatus(status): n for status, n in rows})
+        return counts
+
+    def available(self) -> list[str]:
+        rows = self.conn.execute(
+            "SELECT username FROM results WHERE status = ? ORDER BY offset",
+            (CheckStatus.AVAILABLE.value,),
+        )
+        return [name for (name,) in rows]
+
+
+async def run_node(
+    queue: LeaseQueue,
+    config: AppConfig,
+    worker_id: str | None = None,
+    lease_time: float = 60.0,
+    poll_interval: float = 5.0,
+    metrics_port: int | None = None,
+    metrics_json: Path | None = None,
+) -> CheckerStats:
+    """
+    Lease and check chunks until the whole queue is done.
+
+    While other nodes still hold leases this node keeps polling, since a
+    lease that runs out comes back to the queue.
+    """
+    owner = worker_id or default_worker_id()
+    checker = DiscordChecker(config)
+
+    async def heartbeat(chunk: Chunk):
+        while True:
+            await asyncio.sleep(lease_time / 3)
+            if not queue.renew(chunk, owner, lease_time):
+                logger.warning(f"Lost the lease on chunk {chunk.id}")
+                return
+
+    async with (
+        AsyncSession(impersonate="chrome") as session,
+        exporting(checker.metrics, metrics_port, metrics_json),
+    ):
+        while True:
+            chunk = queue.lease(owner, lease_time)
+            if chunk is None:
+                if queue.finished:
+                    break
+                await asyncio.sleep(poll_interval)
+                continue
+
+            keeper = asyncio.create_task(heartbeat(chunk))
+            try:
+                items = [(o, n) for o, n in chunk.items() if checker.validator.check(n)]
+                results = [r async for r in checker.stream_numbered(items, session)]
+            except BaseException:
+                queue.release(chunk, owner)
+                raise
+            finally:
+                _ = keeper.cancel()
+
+            if not queue.complete(chunk, owner, results):
+                logger.warning(f"Discarded results of chunk {chunk.id}: lease lost")
+    return checker.stats()
@@ -0,0 +1,78 @@
+import asyncio
+from collections.abc import Mapping
+from enum import Enum
+
+
+class ErrorKind(str, Enum):
+    """Why a check failed, which decides who is blamed and whether to retry."""
+
+    AUTH = "AUTH"  # 401: the token is invalid
+    FORBIDDEN = "FORBIDDEN"  # 403 from Discord: the account may not do this
+    CLOUDFLARE = "CLOUDFLARE"  # Challenge or block page in front of the API
+    SERVER = "SERVER"  # 5xx from Discord
+    TIMEOUT = "TIMEOUT"
+    PROXY = "PROXY"  # The proxy refused or broke the connection
+    NETWORK = "NETWORK"  # DNS, TLS or connection failures
+    CLIENT = "CLIENT"  # Any other 4xx: this request will never succeed
+    UNKNOWN = "UNKNOWN"
+
+    @property
+    def fatal(self) -> bool:
+        """The token will fail the same way on every later request."""
+        return self in (ErrorKind.AUTH, ErrorKind.FORBIDDEN)
+
+    @property
+    def trips(self) -> bool:
+        """Opens the connection's breaker at once instead of after a streak."""
+        return self in (ErrorKind.CLOUDFLARE, ErrorKind.PROXY)
+
+    @property
+    def blames_connection(self) -> bool:
+        """Caused by the route (proxy or our IP) rather than Discord or the token."""
+        return self in (
+            ErrorKind.CLOUDFLARE,
+            ErrorKind.TIMEOUT,
+            ErrorKind.PROXY,
+            ErrorKind.NETWORK,
+            ErrorKind.UNKNOWN,
+        )
+
+    @property
+    def retryable(self) -> bool:
+        """Worth checking the name again, possibly with another token or proxy."""
+        return self is not ErrorKind.CLIENT
+
+
+def classify_response(status: int, headers: Mapping[str, str]) -> ErrorKind | None:
+    """Error class of an HTTP response, or None for success and plain 429s."""
+    if status < 400:
+        return None
+    h = {k.lower(): v for k, v in headers.items()}
+    # Discord itself always answers in JSON; HTML is Cloudflare's doing
+    if "cf-mitigated" in h or (
+        status in (403, 429, 503) and "text/html" in h.get("content-type", "")
+    ):
+        return ErrorKind.CLOUDFLARE
+    if status == 429:
+        return None
+    if status == 401:
+        return ErrorKind.AUTH
+    if status == 403:
+        return ErrorKind.FORBIDDEN
+    if status >= 500:
+        return ErrorKind.SERVER
+    return ErrorKind.CLIENT
+
+
+def classify_exception(error: BaseException) -> ErrorKind:
+    # Here rather than at the top, so the models can use ErrorKind without
+    # loading the HTTP client
+    from curl_cffi.requests.exceptions import ProxyError, Timeout
+
+    if isinstance(error, ProxyError):
+        return ErrorKind.PROXY
+    if isinstance(error, (Timeout, TimeoutError, asyncio.TimeoutError)):
+        return ErrorKind.TIMEOUT
+    if isinstance(error, OSError):
+        return ErrorKind.NETWORK
+    return ErrorKind.UNKNOWN
@@ -1,7 +1,10 @@
+import asyncio
+import math
 import random
 import string
 import sys
 from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator, Iterator
 from typing import cast
 
 if sys.version_info >= (3, 12):
@@ -11,17 +14,42 @@ else:
 
 from rich.console import Console
 
+from checkcord.core.keyspace import Keyspace
+from checkcord.core.permutation import Permutation
+from checkcord.core.validator import is_valid
+
 console = Console()
 
+# DictionaryGenerator appends 0-999 when asked for numbers
+NUMBER_SUFFIXES = 1000
+# Candidates a stream may pass over before giving the event loop a turn
+YIELD_EVERY = 1000
+
 
 class GeneratorStrategy(ABC):
-    def __init__(self):
-        self.seen: set[str] = set()
+    def __init__(self, seed: int | None = None):
+        # Fixes the order names come in; see KeyspaceGenerator
+        self.seed: int = random.getrandbits(63) if seed is None else seed
 
     @abstractmethod
+    def stream(self, count: int | None = None) -> AsyncGenerator[str, None]:
+        """
+        Yield up to `count` usernames (no limit when None) as they are asked for.
+
+        Nothing is built ahead of the consumer, so a checker pulling names
+        from its worker queue sets the pace and an unbounded run holds no
+        more than the name being handed over.
+        """
+
     async def generate(self, count: int) -> list[str]:
         """Generate a list of usernames."""
-        pass
+        usernames = [name async for name in self.stream(count)]
+
+        if len(usernames) < count:
+            msg = f"Could only generate {len(usernames)} unique names"
+            console.print(f"[yellow]Warning: {msg}[/yellow]")
+
+        return usernames
 
     @property
     @abstractmethod
@@ -30,48 +58,80 @@ class GeneratorStrategy(ABC):
         pass
 
 
-class RandomCharGenerator(GeneratorStrategy):
-    def __init__(self, length: int = 4, dictionary_mode: bool = False):
-        super().__init__()
+class KeyspaceGenerator(GeneratorStrategy):
+    """
+    A generator whose candidate names can be numbered `0 .. size - 1`.
+
+    Candidates are visited in the order of a seeded permutation, so each one
+    comes up exactly once, shuffled, without remembering which were handed
+    out. `position` counts the candidates visited: a generator with the same
+    seed and position carries on where another stopped.
+    """
+
+    def __init__(self, seed: int | None = None, position: int = 0):
+        super().__init__(seed)
+        self.position: int = position
+
+    @property
+    @abstractmethod
+    def size(self) -> int:
+        """How many candidates there are."""
+
+    @abstractmethod
+    def candidate(self, index: int) -> str:
+        """The candidate numbered `index`."""
+
+    @override
+    async def stream(self, count: int | None = None) -> AsyncGenerator[str, None]:
+        """Valid candidates from `position` on, in shuffled order."""
+        order = Permutation(self.size, self.seed)
+        produced = 0
+        while self.position < self.size and (count is None or produced < count):
+            name = self.candidate(order[self.position])
+            self.position += 1
+            if is_valid(name):
+                produced += 1
+                yield name
+            elif self.position % YIELD_EVERY == 0:
+                # Long stretches of invalid candidates must not stall the loop
+                await asyncio.sleep(0)
+
+
+class RandomCharGenerator(KeyspaceGenerator):
+    def __init__(
+        self,
+        length: int = 4,
+        dictionary_mode: bool = False,
+        seed: int | None = None,
+        position: int = 0,
+    ):
+        super().__init__(seed, position)
         self.length: int = length
         self.dictionary_mode: bool = dictionary_mode  # Placeholder for future
+        self.keyspace: Keyspace = Keyspace(length)
 
     @property
     @override
     def name(self) -> str:
         return "Random Characters"
 
+    @property
     @override
-    async def generate(self, count: int) -> list[str]:
-        usernames: list[str] = []
-        chars = string.ascii_lowercase + "._"
-        attempts = 0
-        max_attempts = count * 50  # Avoid infinite loops
-
-        while len(usernames) < count and attempts < max_attempts:
-            attempts += 1
-            name = "".join(random.choices(chars, k=self.length))
-
-            # Basic validation
-            if (
-                ".." in name
-                or "__" in name
-                or name.startswith(".")
-                or name.endswith(".")
-            ):
-                continue
-
-            if name in self.seen:
-                continue
-
-            self.seen.add(name)
-            usernames.append(name)
+    def size(self) -> int:
+        return self.keyspace.size
 
-        if len(usernames) < count:
-            msg = f"Could only generate {len(usernames)} unique names"
-            console.print(f"[yellow]Warning: {msg}[/yellow]")
+    @override
+    def candidate(self, index: int) -> str:
+        return self.keyspace.name(index)
 
-        return usernames
+    def sweep(self, start: int = 0, end: int | None = None) -> Iterator[str]:
+        """
+        Every valid name of the length, in keyspace order.
+
+        Covers keyspace indices `[start, end)` without remembering anything,
+        so a full sweep can be split into ranges or picked up from an index.
+        """
+        return (name for name in self.keyspace.names(start, end) if is_valid(name))
 
 
 class RemoteListGenerator(GeneratorStrategy):
@@ -88,7 +148,12 @@ class RemoteListGenerator(GeneratorStrategy):
         return "Remote Wordlist (Xsyncio Gist)"
 
     @override
-    async def generate(self, count: int) -> list[str]:
+    async def stream(self, count: int | None = None) -> AsyncGenerator[str, None]:
+        # The whole list comes in one response, so it is handed out from memory
+        for name in (await self._fetch())[:count]:
+            yield name
+
+    async def _fetch(self) -> list[str]:
         try:
             from curl_cffi.requests import AsyncSession, Response
 
@@ -121,52 +186,50 @@ class RemoteListGenerator(GeneratorStrategy):
                         line.strip() for line in text.splitlines() if line.strip()
                     ]
 
-            random.shuffle(all_names)
-            return all_names[:count]
+            all_names = [n for n in all_names if is_valid(n)]
+            random.Random(self.seed).shuffle(all_names)
+            return all_names
 
         except Exception as e:
             console.print(f"[red]Error fetching remote list: {e}[/red]")
             return []
 
 
-class PatternGenerator(GeneratorStrategy):
-    def __init__(self, pattern: str = "user_{random}"):
-        super().__init__()
+class PatternGenerator(KeyspaceGenerator):
+    def __init__(
+        self,
+        pattern: str = "user_{random}",
+        seed: int | None = None,
+        position: int = 0,
+    ):
+        super().__init__(seed, position)
         self.pattern: str = pattern
+        self.keyspace: Keyspace = Keyspace(4, string.ascii_lowercase + "0123456789")
 
     @property
     @override
     def name(self) -> str:
         return "Pattern Based"
 
+    @property
     @override
-    async def generate(self, count: int) -> list[str]:
-        usernames: list[str] = []
-        chars = string.ascii_lowercase + "0123456789"
-        attempts = 0
-        max_attempts = count * 50
-
-        while len(usernames) < count and attempts < max_attempts:
-            attempts += 1
-            rand_str = "".join(random.choices(chars, k=4))
-            name = self.pattern.replace("{random}", rand_str)
-
-            if name in self.seen:
-                continue
-
-            self.seen.add(name)
-            usernames.append(name)
-
-        if len(usernames) < count:
-            msg = f"Could only generate {len(usernames)} unique names"
-            console.print(f"[yellow]Warning: {msg}[/yellow]")
+    def size(self) -> int:
+        # Without a placeholder the pattern is the only candidate
+        return self.keyspace.size if "{random}" in self.pattern else 1
 
-        return usernames
+    @override
+    def candidate(self, index: int) -> str:
+        return self.pattern.replace("{random}", self.keyspace.name(index))
 
 
-class DictionaryGenerator(GeneratorStrategy):
-    def __init__(self, add_numbers: bool = False):
-        super().__init__()
+class DictionaryGenerator(KeyspaceGenerator):
+    def __init__(
+        self,
+        add_numbers: bool = False,
+        seed: int | None = None,
+        position: int = 0,
+    ):
+        super().__init__(seed, position)
         self.add_numbers: bool = add_numbers
         self.adjectives: list[str] = [
             "Cool",
@@ -222,46 +285,34 @@ class DictionaryGenerator(GeneratorStrategy):
     def name(self) -> str:
         return "Dictionary (Adjective + Noun)"
 
+    @property
     @override
-    async def generate(self, count: int) -> list[str]:
-        usernames: list[str] = []
-        attempts = 0
-        max_attempts = count * 50
-
-        while len(usernames) < count and attempts < max_attempts:
-            attempts += 1
-            adj = random.choice(self.adjectives)
-            noun = random.choice(self.nouns)
-            name = f"{adj}{noun}"
-
-            if self.add_numbers:
-                name += str(random.randint(0, 999))
-
-            name = name.lower()  # Discord usernames are lowercase
-
-            if name in self.seen:
-                continue
+    def size(self) -> int:
+        numbers = NUMBER_SUFFIXES if self.add_numbers else 1
+        return len(self.adjectives) * len(self.nouns) * numbers
 
-            self.seen.add(name)
-            usernames.append(name)
-
-        if len(usernames) < count:
-            msg = f"Could only generate {len(usernames)} unique names"
-            console.print(f"[yellow]Warning: {msg}[/yellow]")
-
-        return usernames
-
-
-class LeetGenerator(GeneratorStrategy):
-    def __init__(self, base_word: str):
-        super().__init__()
+    @override
+    def candidate(self, index: int) -> str:
+        suffix = ""
+        if self.add_numbers:
+            index, number = divmod(index, NUMBER_SUFFIXES)
+            suffix = str(number)
+        adj, noun = divmod(index, len(self.nouns))
+        # Discord usernames are lowercase
+        return f"{self.adjectives[adj]}{self.nouns[noun]}{suffix}".lower()
+
+
+class LeetGenerator(KeyspaceGenerator):
+    def __init__(self, base_word: str, seed: int | None = None, position: int = 0):
+        super().__init__(seed, position)
         self.base_word: str = base_word
         self.subs: dict[str, list[str]] = {
-            "a": ["4", "@"],
+            # Only substitutes allowed in usernames
+            "a": ["4"],
             "e": ["3"],
-            "i": ["1", "!"],
+            "i": ["1"],
             "o": ["0"],
-            "s": ["5", "$"],
+            "s": ["5"],
             "t": ["7"],
             "l": ["1"],
             "b": ["8"],
@@ -272,34 +323,19 @@ class LeetGenerator(GeneratorStrategy):
     def name(self) -> str:
         return f"Leet Speak ({self.base_word})"
 
-    @override
-    async def generate(self, count: int) -> list[str]:
-        usernames: list[str] = []
-        attempts = 0
-        max_attempts = count * 100
-
-        while len(usernames) < count and attempts < max_attempts:
-            attempts += 1
-            # Simple probabilistic substitution
-            name_chars: list[str] = []
-            for char in self.base_word.lower():
-                if (
-                    char in self.subs and random.random() > 0.3
-                ):  # 70% chance to substitute
-                    name_chars.append(random.choice(self.subs[char]))
-                else:
-                    name_chars.append(char)
-
-            name = "".join(name_chars)
-
-            if name in self.seen:
-                continue
-
-            self.seen.add(name)
-            usernames.append(name)
+    def _options(self) -> list[list[str]]:
+        # Each character as written, then each of its substitutes
+        return [[char, *self.subs.get(char, [])] for char in self.base_word.lower()]
 
-        if len(usernames) < count:
-            msg = f"Could only generate {len(usernames)} unique names"
-            console.print(f"[yellow]Warning: {msg}[/yellow]")
+    @property
+    @override
+    def size(self) -> int:
+        return math.prod(len(options) for options in self._options())
 
-        return usernames
+    @override
+    def candidate(self, index: int) -> str:
+        chars: list[str] = []
+        for options in reversed(self._options()):
+            index, choice = divmod(index, len(options))
+            chars.append(options[choice])
+        return "".join(reversed(chars))
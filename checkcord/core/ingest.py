@@ -0,0 +1,118 @@
+import gzip
+import mmap
+from array import array
+from collections.abc import Iterator
+from pathlib import Path
+
+GZIP_MAGIC = b"\x1f\x8b"
+MASK = (1 << 64) - 1
+
+
+def normalize(line: str) -> str:
+    """Usernames are case-insensitive, so compare and check them lowercased."""
+    return line.strip().lower()
+
+
+class CompactHashSet:
+    """
+    Set of 64-bit fingerprints in a flat open-addressing table.
+
+    Costs about 16 bytes per name instead of the ~100 a `set[str]` needs.
+    Two different names sharing a fingerprint would make the second look
+    like a duplicate; with 64 bits that stays negligible even at 100M names.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        size = 1 << max(4, (capacity * 2 - 1).bit_length())
+        self._slots: array[int] = array("Q", bytes(8 * size))
+        self._mask: int = size - 1
+        self._len: int = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    @staticmethod
+    def _fingerprint(item: str) -> int:
+        # 0 marks an empty slot
+        return (hash(item) & MASK) or 1
+
+    def _find(self, fp: int) -> int:
+        slots, mask = self._slots, self._mask
+        i = fp & mask
+        while slots[i] and slots[i] != fp:
+            i = (i + 1) & mask
+        return i
+
+    def __contains__(self, item: object) -> bool:
+        if not isinstance(item, str):
+            return False
+        fp = self._fingerprint(item)
+        return self._slots[self._find(fp)] == fp
+
+    def add(self, item: str) -> bool:
+        """Add `item`, returning False if it was already present."""
+        fp = self._fingerprint(item)
+        i = self._find(fp)
+        if self._slots[i]:
+            return False
+        self._slots[i] = fp
+        self._len += 1
+        # Keep the table at most half full so probe runs stay short
+        if self._len * 2 > len(self._slots):
+            self._grow()
+        return True
+
+    def _grow(self):
+        old = self._slots
+        self._slots = array("Q", bytes(16 * len(old)))
+        self._mask = len(self._slots) - 1
+        for fp in old:
+            if fp:
+                self._slots[self._find(fp)] = fp
+
+
+def read_lines(path: Path | str) -> Iterator[bytes]:
+    """Yield raw lines from a plain or gzip-compressed file without loading it."""
+    with open(path, "rb") as f:
+        if f.read(2) == GZIP_MAGIC:
+            _ = f.seek(0)
+            with gzip.open(f) as gz:
+                yield from gz
+            return
+
+        _ = f.seek(0, 2)
+        if f.tell() == 0:
+            return  # Empty files cannot be mapped
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b"")
+
+
+class UsernameSource:
+    """
+    Lazily read, normalize and dedupe usernames from a file.
+
+    Iterating streams the file, so only the dedupe fingerprints grow with
+    its size. Counters are filled in as the source is consumed.
+    """
+
+    def __init__(self, path: Path | str, dedupe: bool = True):
+        self.path: Path = Path(path)
+        # Fail up front rather than once the checker starts pulling names
+        if not self.path.is_file():
+            raise FileNotFoundError(f"No such file: {self.path}")
+        self.dedupe: bool = dedupe
+        self.lines: int = 0
+        self.blank: int = 0
+        self.duplicates: int = 0
+
+    def __iter__(self) -> Iterator[str]:
+        seen = CompactHashSet() if self.dedupe else None
+        for raw in read_lines(self.path):
+            self.lines += 1
+            name = normalize(raw.decode("utf-8", errors="replace"))
+            if not name:
+                self.blank += 1
+            elif seen is not None and not seen.add(name):
+                self.duplicates += 1
+            else:
+                yield name
@@ -0,0 +1,158 @@
+import hashlib
+import zlib
+from array import array
+from collections import Counter
+from collections.abc import Iterator
+from pathlib import Path
+
+from checkcord.models import CheckRecord, CheckStatus
+
+# Results that settle a name; anything else is checked again on resume
+CONCLUSIVE = frozenset({CheckStatus.AVAILABLE, CheckStatus.TAKEN})
+
+# First line of a journal: what run it belongs to
+RUN_PREFIX = "#run\t"
+
+
+class JournalMismatchError(ValueError):
+    """Raised when resuming a journal that was written by a different run."""
+
+
+def file_digest(path: Path | str) -> str:
+    """Short hash of a file's contents, to tell inputs apart in a run id."""
+    digest = hashlib.blake2b(digest_size=8)
+    with open(path, "rb") as f:
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def fingerprint(username: str) -> int:
+    # Never 0, which marks an offset with no name recorded
+    return zlib.crc32(username.encode()) | 1
+
+
+class _Fingerprints:
+    """A name fingerprint per offset, 4 bytes each in one flat array."""
+
+    def __init__(self):
+        self.base: int = 0
+        self.values: array[int] = array("I")
+
+    def __setitem__(self, offset: int, value: int):
+        if not self.values:
+            self.base = offset
+        elif offset < self.base:
+            self.values[:0] = array("I", bytes(4 * (self.base - offset)))
+            self.base = offset
+        index = offset - self.base
+        if index >= len(self.values):
+            self.values.extend(array("I", bytes(4 * (index + 1 - len(self.values)))))
+        self.values[index] = value
+
+    def get(self, offset: int) -> int:
+        index = offset - self.base
+        return self.values[index] if 0 <= index < len(self.values) else 0
+
+
+class Journal:
+    """
+    Append-only log of finished checks, one `offset<TAB>status<TAB>username` line each.
+
+    Offsets are positions in the input stream. Since workers finish out of
+    order, the journal keeps a watermark below which every offset is done
+    plus the (small) set of offsets finished above it. A 4-byte fingerprint
+    of the name at each offset lets `settled` tell a resumed run's name from
+    whatever an unrelated run put at the same offset.
+
+    `run` identifies the run (its parameters, or a digest of its input) and
+    is written as the first line; resuming a journal whose first line names a
+    different run raises JournalMismatchError.
+    """
+
+    def __init__(self, path: Path | str, resume: bool = False, run: str | None = None):
+        self.path: Path = Path(path)
+        self.run: str | None = run
+        self.watermark: int = 0
+        self.end: int = 0  # One past the highest offset recorded
+        self.counts: Counter[CheckStatus] = Counter()
+        self._ahead: set[int] = set()
+        self._unresolved: set[int] = set()
+        self._names: _Fingerprints = _Fingerprints()
+
+        resuming = resume and self.path.exists() and self.path.stat().st_size > 0
+        if resuming:
+            recorded = self._recorded_run()
+            if run is not None and recorded is not None and recorded != run:
+                raise JournalMismatchError(
+                    f"{self.path} belongs to another run ({recorded}), not {run}"
+                )
+            for offset, status, username in self._read():
+                self._mark(offset, status, username)
+                self.counts[status] += 1
+
+        # Line buffered so a crash loses at most the line being written
+        self._file = open(self.path, "a" if resuming else "w", buffering=1)  # noqa: SIM115
+        if not resuming and run is not None:
+            _ = self._file.write(f"{RUN_PREFIX}{run}\n")
+
+    def _recorded_run(self) -> str | None:
+        with open(self.path) as f:
+            first = f.readline().rstrip("\n")
+        return first.removeprefix(RUN_PREFIX) if first.startswith(RUN_PREFIX) else None
+
+    def _read(self) -> Iterator[tuple[int, CheckStatus, str]]:
+        with open(self.path) as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t", 2)
+                # A torn last line from a crash is simply redone
+                if len(parts) != 3 or parts[1] not in CheckStatus.__members__:
+                    continue
+                yield int(parts[0]), CheckStatus(parts[1]), parts[2]
+
+    def _mark(self, offset: int, status: CheckStatus, username: str):
+        self._names[offset] = fingerprint(username)
+        if status in CONCLUSIVE:
+            self._unresolved.discard(offset)
+        else:
+            self._unresolved.add(offset)
+
+        self.end = max(self.end, offset + 1)
+        if offset >= self.watermark:
+            self._ahead.add(offset)
+            while self.watermark in self._ahead:
+                self._ahead.remove(self.watermark)
+                self.watermark += 1
+
+    def __contains__(self, offset: object) -> bool:
+        """Whether the input at `offset` was settled by an earlier run."""
+        if not isinstance(offset, int) or offset in self._unresolved:
+            return False
+        return offset < self.watermark or offset in self._ahead
+
+    def settled(self, offset: int, username: str) -> bool:
+        """Whether `username`, at input `offset`, was settled by an earlier run."""
+        return offset in self and self._names.get(offset) == fingerprint(username)
+
+    @property
+    def completed(self) -> int:
+        """Names settled so far (available or taken)."""
+        return sum(self.counts[s] for s in CONCLUSIVE)
+
+    def usernames(self) -> Iterator[str]:
+        """Every username in the journal, settled or not."""
+        self._file.flush()
+        for _, _, username in self._read():
+            yield username
+
+    def record(self, result: CheckRecord):
+        if result.offset is None:
+            return
+        _ = self._file.write(
+            f"{result.offset}\t{result.status.value}\t{result.username}\n"
+        )
+        self._mark(result.offset, result.status, result.username)
+        self.counts[result.status] += 1
+
+    def close(self):
+        self._file.close()
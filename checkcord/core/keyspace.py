@@ -0,0 +1,135 @@
+from collections.abc import Iterator
+from functools import cached_property
+from itertools import pairwise
+
+from checkcord.core.validator import CHARSET
+
+# Every character the validator accepts, the ones RandomCharGenerator draws from
+ALPHABET = CHARSET
+
+# Class of the previous character while building a name
+_START, _PLAIN, _DOT = range(3)
+
+
+class Keyspace:
+    """
+    Every name of `length` characters over `alphabet`, numbered from 0.
+
+    Periods are placed by the validator's rule rather than filtered out:
+    never two in a row. The number of names that fit is counted per position
+    up front, so `name(i)` and `index(name)` are O(length) and `size` is
+    exact without listing anything. A sweep is a range of indices, which can
+    be split between workers or resumed from wherever it stopped.
+
+    Names come in alphabet order, with every other character of `alphabet`
+    before `.`. Reserved names and banned words are left to the validator.
+    """
+
+    def __init__(self, length: int, alphabet: str = ALPHABET):
+        if length < 1:
+            raise ValueError("length must be at least 1")
+        if len(set(alphabet)) != len(alphabet):
+            raise ValueError("alphabet has repeated characters")
+        self.length: int = length
+        self.alphabet: str = alphabet
+        self.plain: str = alphabet.replace(".", "")
+        self.dot: bool = "." in alphabet
+
+        # _ways[r][prev]: completions of the last r characters after `prev`
+        self._ways: list[list[int]] = [[1, 1, 1]]
+        for _ in range(length):
+            below = self._ways[-1]
+            self._ways.append(
+                [
+                    sum(count * below[kind] for count, kind in self._choices(prev))
+                    for prev in range(3)
+                ]
+            )
+
+    def _choices(self, prev: int) -> list[tuple[int, int]]:
+        """(characters, class) that may come next, in index order."""
+        choices = [(len(self.plain), _PLAIN)]
+        if self.dot and prev != _DOT:
+            choices.append((1, _DOT))
+        return choices
+
+    @cached_property
+    def size(self) -> int:
+        """How many names there are (may exceed what `len()` can return)."""
+        return self._ways[self.length][_START]
+
+    @property
+    def spec(self) -> str:
+        """Compact description `from_spec` turns back into this keyspace."""
+        return f"{self.length}:{self.alphabet}"
+
+    @classmethod
+    def from_spec(cls, spec: str) -> "Keyspace":
+        length, alphabet = spec.split(":", 1)
+        return cls(int(length), alphabet)
+
+    def name(self, index: int) -> str:
+        """The name numbered `index`."""
+        if not 0 <= index < self.size:
+            raise IndexError(f"index {index} outside keyspace of {self.size}")
+
+        number = index
+        chars: list[str] = []
+        prev = _START
+        for remaining in range(self.length, 0, -1):
+            below = self._ways[remaining - 1]
+            for count, kind in self._choices(prev):
+                block = count * below[kind]
+                if index < block:
+                    break
+                index -= block
+            else:
+                raise IndexError(f"index {number} outside keyspace of {self.size}")
+
+            if kind == _PLAIN:
+                position, index = divmod(index, below[kind])
+                chars.append(self.plain[position])
+            else:
+                chars.append(".")
+            prev = kind
+        return "".join(chars)
+
+    def index(self, name: str) -> int:
+        """The number of `name`; ValueError if it is not in the keyspace."""
+        if len(name) != self.length:
+            raise ValueError(f"{name!r} is not {self.length} characters long")
+
+        index = 0
+        prev = _START
+        for position, char in enumerate(name):
+            remaining = self.length - position
+            below = self._ways[remaining - 1]
+            kind = _DOT if char == "." else _PLAIN
+            for count, option in self._choices(prev):
+                if option == kind:
+                    break
+                index += count * below[option]
+            else:
+                raise ValueError(f"{name!r} breaks the placement rules")
+
+            if kind == _PLAIN:
+                plain = self.plain.find(char)
+                if plain < 0:
+                    raise ValueError(f"{char!r} is not in the alphabet")
+                index += plain * below[kind]
+            prev = kind
+        return index
+
+    def names(self, start: int = 0, end: int | None = None) -> Iterator[str]:
+        """Names numbered `start` up to (not including) `end`, in order."""
+        end = self.size if end is None else min(end, self.size)
+        for index in range(start, end):
+            yield self.name(index)
+
+    def ranges(self, parts: int) -> list[tuple[int, int]]:
+        """Split the keyspace into `parts` contiguous `[start, end)` ranges."""
+        step, extra = divmod(self.size, parts)
+        bounds = [0]
+        for part in range(parts):
+            bounds.append(bounds[-1] + step + (part < extra))
+        return [(lo, hi) for lo, hi in pairwise(bounds) if lo < hi]
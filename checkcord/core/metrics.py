@@ -0,0 +1,289 @@
+import asyncio
+import contextlib
+import copy
+import json
+import math
+from bisect import bisect_left
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from pathlib import Path
+from typing import TypeVar
+
+# Seconds; sized for API round trips through proxies
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Labels = tuple[str, ...]
+M = TypeVar("M", bound="Metric")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric:
+    """A named family of samples, one per combination of label values."""
+
+    kind: str = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+        self.name: str = name
+        self.help: str = help
+        self.labels: Labels = tuple(labels)
+        self.values: dict[Labels, float] = {}
+
+    def _key(self, labels: Labels) -> Labels:
+        if len(labels) != len(self.labels):
+            raise ValueError(f"{self.name} takes labels {self.labels}, got {labels}")
+        return labels
+
+    def _label_text(self, key: Labels, extra: dict[str, str] | None = None) -> str:
+        pairs = dict(zip(self.labels, key, strict=True))
+        pairs.update(extra or {})
+        if not pairs:
+            return ""
+        text = ",".join(f'{k}="{_escape(v)}"' for k, v in pairs.items())
+        return "{" + text + "}"
+
+    def get(self, *labels: str) -> float:
+        return self.values.get(self._key(labels), 0.0)
+
+    def merge(self, other: "Metric"):
+        """Add another process's samples of the same family into this one."""
+        for key, value in other.values.items():
+            self.values[key] = self.values.get(key, 0.0) + value
+
+    def lines(self) -> Iterator[str]:
+        for key, value in self.values.items():
+            yield f"{self.name}{self._label_text(key)} {_number(value)}"
+
+    def snapshot(self) -> list[dict[str, object]]:
+        return [
+            {"labels": dict(zip(self.labels, key, strict=True)), "value": value}
+            for key, value in self.values.items()
+        ]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0.0) + amount
+
+    def set_total(self, value: float, *labels: str):
+        """Mirror a running total that is kept elsewhere."""
+        self.values[self._key(labels)] = value
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def set(self, value: float, *labels: str):
+        self.values[self._key(labels)] = value
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        key = self._key(labels)
+        self.values[key] = self.values.get(key, 0.0) + amount
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labels)
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        # Per label set: observations per bucket (the last one is +Inf)
+        self.counts: dict[Labels, list[int]] = {}
+        self.sums: dict[Labels, float] = {}
+
+    def observe(self, value: float, *labels: str):
+        key = self._key(labels)
+        counts = self.counts.get(key)
+        if counts is None:
+            counts = self.counts[key] = [0] * (len(self.buckets) + 1)
+            self.sums[key] = 0.0
+        counts[bisect_left(self.buckets, value)] += 1
+        self.sums[key] += value
+
+    def count(self, *labels: str) -> int:
+        return sum(self.counts.get(self._key(labels), ()))
+
+    def merge(self, other: Metric):
+        assert isinstance(other, Histogram)
+        for key, counts in other.counts.items():
+            mine = self.counts.setdefault(key, [0] * len(counts))
+            for i, n in enumerate(counts):
+                mine[i] += n
+            self.sums[key] = self.sums.get(key, 0.0) + other.sums[key]
+
+    def lines(self) -> Iterator[str]:
+        for key, counts in self.counts.items():
+            total = 0
+            for bound, n in zip((*self.buckets, math.inf), counts, strict=True):
+                total += n
+                labels = self._label_text(key, {"le": _number(bound)})
+                yield f"{self.name}_bucket{labels} {total}"
+            labels = self._label_text(key)
+            yield f"{self.name}_sum{labels} {_number(self.sums[key])}"
+            yield f"{self.name}_count{labels} {total}"
+
+    def snapshot(self) -> list[dict[str, object]]:
+        return [
+            {
+                "labels": dict(zip(self.labels, key, strict=True)),
+                "buckets": dict(
+                    zip(map(_number, (*self.buckets, math.inf)), counts, strict=True)
+                ),
+                "sum": self.sums[key],
+                "count": sum(counts),
+            }
+            for key, counts in self.counts.items()
+        ]
+
+
+class MetricsRegistry:
+    """
+    The metric families of one run.
+
+    Values that are cheaper to read than to track (queue sizes, totals kept by
+    other objects) are refreshed by `on_collect` hooks whenever the registry is
+    scraped. Worker processes send their collected families back to the
+    parent, which keeps the latest per worker in `children` and adds them in.
+    """
+
+    def __init__(self):
+        self.metrics: dict[str, Metric] = {}
+        self.children: dict[object, list[Metric]] = {}
+        self._hooks: list[Callable[[], None]] = []
+
+    def _register(self, metric: M) -> M:
+        if metric.name in self.metrics:
+            raise ValueError(f"Duplicate metric {metric.name}")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labels, buckets))
+
+    def on_collect(self, hook: Callable[[], None]):
+        self._hooks.append(hook)
+
+    def collect(self) -> list[Metric]:
+        """Refresh and copy every family, children included (safe to pickle)."""
+        for hook in self._hooks:
+            hook()
+        families = {name: copy.deepcopy(m) for name, m in self.metrics.items()}
+        for child in self.children.values():
+            for metric in child:
+                mine = families.get(metric.name)
+                if mine is None:
+                    families[metric.name] = copy.deepcopy(metric)
+                else:
+                    mine.merge(metric)
+        return list(families.values())
+
+    def render(self) -> str:
+        """Prometheus text exposition format."""
+        out: list[str] = []
+        for metric in self.collect():
+            out.append(f"# HELP {metric.name} {metric.help}")
+            out.append(f"# TYPE {metric.name} {metric.kind}")
+            out.extend(metric.lines())
+        return "\n".join(out) + "\n"
+
+    def snapshot(self) -> dict[str, object]:
+        return {
+            metric.name: {
+                "type": metric.kind,
+                "help": metric.help,
+                "samples": metric.snapshot(),
+            }
+            for metric in self.collect()
+        }
+
+    def write_snapshot(self, path: Path | str):
+        with open(path, "w") as f:
+            json.dump(self.snapshot(), f, indent=2)
+
+
+async def serve_metrics(
+    registry: MetricsRegistry, port: int, host: str = "127.0.0.1"
+) -> asyncio.Server:
+    """Answer `GET /metrics` (Prometheus) and `GET /metrics.json` on `port`."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await reader.readline()
+            while await reader.readline() not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request_line.decode().split()
+            path = parts[1].split("?")[0] if len(parts) > 1 else ""
+
+            if path == "/metrics":
+                status, content_type = "200 OK", PROMETHEUS_CONTENT_TYPE
+                body = registry.render().encode()
+            elif path == "/metrics.json":
+                status, content_type = "200 OK", "application/json"
+                body = json.dumps(registry.snapshot()).encode()
+            else:
+                status, content_type, body = "404 Not Found", "text/plain", b""
+
+            head = [
+                f"HTTP/1.1 {status}",
+                f"Content-Type: {content_type}",
+                f"Content-Length: {len(body)}",
+                "Connection: close",
+            ]
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + body)
+            await writer.drain()
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
+
+
+@contextlib.asynccontextmanager
+async def exporting(
+    registry: MetricsRegistry,
+    port: int | None = None,
+    snapshot_path: Path | None = None,
+) -> AsyncIterator[None]:
+    """Serve `registry` while the block runs and save a snapshot when it ends."""
+    server = await serve_metrics(registry, port) if port is not None else None
+    try:
+        yield
+    finally:
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+        if snapshot_path is not None:
+            registry.write_snapshot(snapshot_path)
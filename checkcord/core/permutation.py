@@ -0,0 +1,60 @@
+import hashlib
+from collections.abc import Iterator
+
+ROUNDS = 4
+
+
+class Permutation:
+    """
+    A seeded shuffle of `range(size)`, computed one position at a time.
+
+    A balanced Feistel network with keyed BLAKE2b as its round function is a
+    bijection on the smallest even number of bits covering `size`. Values it
+    maps outside `range(size)` are fed through again (cycle walking) until
+    one lands inside, which keeps it a bijection on `range(size)`. That
+    domain is under 4x `size`, so a lookup needs a few passes at most and
+    nothing is stored but the round keys: the same seed always gives the
+    same order, and any position can be looked up directly.
+    """
+
+    def __init__(self, size: int, seed: int):
+        if size < 1:
+            raise ValueError("size must be at least 1")
+        self.size: int = size
+        self.seed: int = seed
+
+        bits = max(2, (size - 1).bit_length())
+        self._half: int = (bits + 1) // 2
+        self._mask: int = (1 << self._half) - 1
+        self._bytes: int = (self._half + 7) // 8
+        # One keyed hash per round, copied for each use (cheaper than rekeying)
+        self._rounds: list[hashlib.blake2b] = [
+            hashlib.blake2b(
+                key=hashlib.blake2b(f"{seed}:{r}".encode()).digest(),
+                digest_size=self._bytes,
+            )
+            for r in range(ROUNDS)
+        ]
+
+    def _encrypt(self, value: int) -> int:
+        half, mask, size = self._half, self._mask, self._bytes
+        left, right = value >> half, value & mask
+        for keyed in self._rounds:
+            h = keyed.copy()
+            h.update(right.to_bytes(size, "little"))
+            left, right = right, left ^ (int.from_bytes(h.digest(), "little") & mask)
+        return (left << half) | right
+
+    def __getitem__(self, position: int) -> int:
+        """The value shuffled to `position`."""
+        if not 0 <= position < self.size:
+            raise IndexError(f"position {position} outside permutation of {self.size}")
+        value = self._encrypt(position)
+        while value >= self.size:
+            value = self._encrypt(value)
+        return value
+
+    def values(self, start: int = 0) -> Iterator[int]:
+        """Every value from `start` on, in shuffled order."""
+        for position in range(start, self.size):
+            yield self[position]
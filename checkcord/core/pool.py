@@ -0,0 +1,197 @@
+import asyncio
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Container,
+    Iterable,
+)
+from typing import Generic, TypeVar
+
+from checkcord.core.retry import RetryScheduler
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class _Done:
+    """Sentinel marking the end of the input (inbox) or a finished worker (outbox)."""
+
+
+class _Failure:
+    def __init__(self, error: BaseException):
+        self.error: BaseException = error
+
+
+_DONE = _Done()
+
+
+async def numbered(
+    items: Iterable[T] | AsyncIterable[T],
+    start: int = 0,
+    skip: Container[int] | Callable[[int, T], bool] = (),
+) -> AsyncIterator[tuple[int, T]]:
+    """
+    Pair every item with its input offset, leaving out the ones in `skip`.
+
+    `skip` holds offsets, or is a predicate given each offset and item (a
+    journal checking that the name it settled there is the same one).
+    """
+    if callable(skip):
+        skipped = skip
+    else:
+        offsets = skip
+
+        def skipped(offset: int, item: T) -> bool:
+            return offset in offsets
+
+    offset = start
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            if not skipped(offset, item):
+                yield offset, item
+            offset += 1
+    else:
+        for item in items:
+            if not skipped(offset, item):
+                yield offset, item
+            offset += 1
+
+
+class WorkerPool(Generic[T, R]):
+    """
+    A fixed set of long-lived workers fed from a bounded queue.
+
+    Only `queue_size` items are pulled from the input ahead of the workers, so
+    memory stays flat regardless of how large (or endless) the input is.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[T], Awaitable[R]],
+        workers: int,
+        queue_size: int | None = None,
+    ):
+        self.handler: Callable[[T], Awaitable[R]] = handler
+        self.workers: int = max(1, workers)
+        self.queue_size: int = queue_size or self.workers * 2
+        self._inbox: asyncio.Queue[T | _Done] | None = None
+
+    @property
+    def queued(self) -> int:
+        """Items pulled from the input that no worker has started on yet."""
+        return self._inbox.qsize() if self._inbox is not None else 0
+
+    async def imap_unordered(
+        self,
+        items: Iterable[T] | AsyncIterable[T],
+        retries: RetryScheduler[T] | None = None,
+        shortcut: Callable[[T], Awaitable[R | None]] | None = None,
+    ) -> AsyncGenerator[R, None]:
+        """
+        Yield handler results in completion order.
+
+        With `shortcut`, every new item is offered to it first, as it is
+        pulled from the input: an item it returns a result for is never
+        queued for the workers, and the result is yielded like theirs.
+
+        With `retries`, items the consumer schedules there (before asking for
+        the next result) are fed back to the workers once ready, even while
+        the input has nothing new, and the pool only finishes when none are
+        left waiting.
+        """
+        inbox: asyncio.Queue[T | _Done] = asyncio.Queue(self.queue_size)
+        self._inbox = inbox
+        outbox: asyncio.Queue[R | _Done | _Failure] = asyncio.Queue(self.queue_size)
+        # Items handed to the workers whose result the consumer has not taken
+        in_flight = 0
+        settled = asyncio.Event()
+        input_done = False
+
+        async def put(item: T):
+            nonlocal in_flight
+            in_flight += 1
+            await inbox.put(item)
+
+        async def submit(item: T):
+            nonlocal in_flight
+            if shortcut is not None:
+                result = await shortcut(item)
+                if result is not None:
+                    in_flight += 1
+                    await outbox.put(result)
+                    return
+            await put(item)
+
+        async def feed_retries():
+            assert retries is not None
+            while True:
+                if len(retries):
+                    await put(await retries.get())
+                elif in_flight or not input_done:
+                    # A result still out may yet be scheduled for a retry
+                    settled.clear()
+                    _ = await settled.wait()
+                else:
+                    return
+
+        async def feed():
+            nonlocal input_done
+            # Alongside the input, so a slow or idle input never holds retries up
+            retrying = (
+                asyncio.create_task(feed_retries()) if retries is not None else None
+            )
+            try:
+                if isinstance(items, AsyncIterable):
+                    async for item in items:
+                        await submit(item)
+                else:
+                    for item in items:
+                        await submit(item)
+                input_done = True
+                settled.set()
+                if retrying is not None:
+                    await retrying
+            except Exception as e:
+                await outbox.put(_Failure(e))
+                return
+            finally:
+                if retrying is not None:
+                    _ = retrying.cancel()
+            for _ in range(self.workers):
+                await inbox.put(_DONE)
+
+        async def work():
+            while True:
+                item = await inbox.get()
+                if isinstance(item, _Done):
+                    await outbox.put(_DONE)
+                    return
+                try:
+                    result = await self.handler(item)
+                except Exception as e:
+                    await outbox.put(_Failure(e))
+                    return
+                await outbox.put(result)
+
+        tasks = [asyncio.create_task(feed())]
+        tasks.extend(asyncio.create_task(work()) for _ in range(self.workers))
+
+        try:
+            running = self.workers
+            while running:
+                out = await outbox.get()
+                if isinstance(out, _Done):
+                    running -= 1
+                elif isinstance(out, _Failure):
+                    raise out.error
+                else:
+                    yield out
+                    in_flight -= 1
+                    settled.set()
+        finally:
+            for task in tasks:
+                _ = task.cancel()
+            _ = await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,164 @@
+import asyncio
+import json
+import time
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+
+# Spans kept for a trace; enough for ~100k checks, then only totals are kept
+MAX_TRACE_SPANS = 1_000_000
+
+SPEEDSCOPE_SCHEMA = "https://www.speedscope.app/file-format-schema.json"
+
+
+@dataclass(slots=True)
+class PhaseStats:
+    calls: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def add(self, seconds: float):
+        self.calls += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: "PhaseStats"):
+        self.calls += other.calls
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+
+_NOOP: AbstractContextManager[None] = nullcontext()
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off; every phase is a shared no-op."""
+
+    enabled: bool = False
+
+    def phase(self, name: str) -> AbstractContextManager[None]:
+        return _NOOP
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "started")
+
+    def __init__(self, profiler: "PhaseProfiler", name: str):
+        self.profiler: PhaseProfiler = profiler
+        self.name: str = name
+        self.started: float = 0.0
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.profiler.record(self.name, self.started, time.perf_counter())
+
+
+class PhaseProfiler(NullProfiler):
+    """
+    Wall-clock time per named phase of the check pipeline.
+
+    Phases of concurrent checks overlap, so their totals add up to more than
+    the run took; compare them with each other (and with the call counts)
+    rather than with the elapsed time. With `trace`, every span is also kept
+    per asyncio task so the run can be opened in speedscope.
+    """
+
+    enabled = True
+
+    def __init__(self, trace: bool = False):
+        self.phases: dict[str, PhaseStats] = {}
+        self.trace: bool = trace
+        self.started: float = time.perf_counter()
+        # (task id, phase, start, end)
+        self.spans: list[tuple[int, str, float, float]] = []
+        self.lanes: dict[int, str] = {}
+
+    def phase(self, name: str) -> AbstractContextManager[None]:
+        return _Span(self, name)
+
+    def record(self, name: str, started: float, ended: float):
+        stats = self.phases.get(name)
+        if stats is None:
+            stats = self.phases[name] = PhaseStats()
+        stats.add(ended - started)
+
+        if self.trace and len(self.spans) < MAX_TRACE_SPANS:
+            task = asyncio.current_task()
+            lane = id(task)
+            if lane not in self.lanes:
+                self.lanes[lane] = task.get_name() if task is not None else "main"
+            self.spans.append((lane, name, started, ended))
+
+    def merge(self, phases: dict[str, PhaseStats]):
+        """Add the phase totals of another process."""
+        for name, stats in phases.items():
+            self.phases.setdefault(name, PhaseStats()).merge(stats)
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def speedscope(self) -> dict[str, object]:
+        """The trace as a speedscope evented profile, one lane per task."""
+        frames: dict[str, int] = {}
+        lanes: dict[int, list[tuple[str, float, float]]] = {}
+        for lane, name, start, end in self.spans:
+            _ = frames.setdefault(name, len(frames))
+            lanes.setdefault(lane, []).append((name, start, end))
+
+        profiles: list[dict[str, object]] = []
+        end_value = (time.perf_counter() - self.started) * 1000
+        for lane, spans in lanes.items():
+            # Parents open before, and close after, the phases nested in them
+            spans.sort(key=lambda s: (s[1], -s[2]))
+            events: list[dict[str, object]] = []
+            open_spans: list[tuple[int, float]] = []
+            for name, start, end in spans:
+                at = (start - self.started) * 1000
+                while open_spans and open_spans[-1][1] <= at:
+                    frame, closed = open_spans.pop()
+                    events.append({"type": "C", "frame": frame, "at": closed})
+                close = max((end - self.started) * 1000, at)
+                if open_spans:
+                    # Clamp to the parent so the events stay well nested
+                    close = min(close, open_spans[-1][1])
+                events.append({"type": "O", "frame": frames[name], "at": at})
+                open_spans.append((frames[name], close))
+            while open_spans:
+                frame, closed = open_spans.pop()
+                events.append({"type": "C", "frame": frame, "at": closed})
+            profiles.append(
+                {
+                    "type": "evented",
+                    "name": self.lanes[lane],
+                    "unit": "milliseconds",
+                    "startValue": 0,
+                    "endValue": end_value,
+                    "events": events,
+                }
+            )
+
+        return {
+            "$schema": SPEEDSCOPE_SCHEMA,
+            "name": "checkcord",
+            "exporter": "checkcord",
+            "shared": {"frames": [{"name": name} for name in frames]},
+            "profiles": profiles,
+        }
+
+    def write_speedscope(self, path: Path | str):
+        with open(path, "w") as f:
+            json.dump(self.speedscope(), f)
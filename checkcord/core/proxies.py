@@ -0,0 +1,201 @@
+import asyncio
+import math
+import time
+from collections.abc import Collection
+from pathlib import Path
+
+from checkcord.core.breaker import BreakerState, CircuitBreaker
+from checkcord.core.errors import ErrorKind
+from checkcord.core.ratelimiter import GlobalRateLimiter
+from checkcord.core.util import logger
+
+PROXY_FILE = Path("proxies.txt")
+
+
+class ProxyState:
+    """Health and rate limit bookkeeping for a single proxy."""
+
+    def __init__(self, url: str, breaker: CircuitBreaker | None = None):
+        self.url: str = url
+        # Per-proxy bucket tracking; pacing itself is left to the global limiter
+        self.limiter: GlobalRateLimiter = GlobalRateLimiter(initial_delay=0.0)
+        self.breaker: CircuitBreaker = breaker or CircuitBreaker()
+        self.latency: float | None = None  # EWMA of round-trip time in seconds
+        self.error_rate: float = 0.0  # EWMA of failures (0.0 - 1.0)
+        self.requests: int = 0
+        self.failures: int = 0
+        self.cooldown_until: float = 0.0  # Rate limit cooldown
+        self.in_flight: int = 0
+
+    @property
+    def label(self) -> str:
+        """The URL without credentials, safe for logs and metrics."""
+        scheme, sep, rest = self.url.rpartition("://")
+        return scheme + sep + rest.rpartition("@")[2]
+
+    @property
+    def quarantined(self) -> bool:
+        return self.breaker.state is not BreakerState.CLOSED
+
+    def is_available(self, now: float) -> bool:
+        # A quarantined proxy gets a single probe request once its cooldown ends
+        return now >= self.cooldown_until and self.breaker.ready(now)
+
+    def score(self, now: float) -> float:
+        """Lower is better: fast, reliable proxies with budget to spare."""
+        latency = self.latency if self.latency is not None else 0.0
+        cost = (latency + 0.01) * (1 + self.in_flight) * (1 + 4 * self.error_rate)
+
+        state = self.limiter.bucket_for()
+        if state is not None and state.limit and now < state.reset_at:
+            cost /= max(state.remaining, 0) / state.limit + 0.01
+        return cost
+
+
+class ProxyPool:
+    """
+    Schedules requests across proxies by health instead of plain rotation.
+
+    Proxies that keep failing are quarantined with an exponentially growing
+    cooldown, then re-tested with a single probe request.
+    """
+
+    def __init__(
+        self,
+        proxies: list[str],
+        max_failures: int = 3,
+        quarantine_time: float = 30.0,
+        max_quarantine_time: float = 600.0,
+        alpha: float = 0.2,
+    ):
+        self.max_failures: int = max_failures
+        self.quarantine_time: float = quarantine_time
+        self.max_quarantine_time: float = max_quarantine_time
+        self.alpha: float = alpha
+        self.proxies: list[ProxyState] = [self._state(url) for url in proxies]
+        # Seconds requests spent waiting for a proxy to come off cooldown
+        self.waited: float = 0.0
+
+    @classmethod
+    def from_file(cls, path: Path = PROXY_FILE) -> "ProxyPool":
+        try:
+            with open(path) as f:
+                proxies = [line.strip() for line in f if line.strip()]
+        except FileNotFoundError:
+            logger.info(f"No {path} found, running directly.")
+            return cls([])
+
+        if proxies:
+            logger.info(f"Loaded {len(proxies)} proxies.")
+        return cls(proxies)
+
+    def __len__(self) -> int:
+        return len(self.proxies)
+
+    def __bool__(self) -> bool:
+        return bool(self.proxies)
+
+    def _state(self, url: str) -> ProxyState:
+        breaker = CircuitBreaker(
+            self.max_failures, self.quarantine_time, self.max_quarantine_time
+        )
+        return ProxyState(url, breaker)
+
+    def shard(self, index: int, count: int):
+        """
+        Keep only worker `index`'s share of the proxies, out of `count` workers.
+
+        With fewer proxies than workers they are shared round-robin instead,
+        so no worker is left sending requests from the host's own address.
+        """
+        if len(self.proxies) >= count:
+            self.proxies = self.proxies[index::count]
+        elif self.proxies:
+            self.proxies = [self.proxies[index % len(self.proxies)]]
+
+    def add(self, url: str):
+        if all(p.url != url for p in self.proxies):
+            self.proxies.append(self._state(url))
+
+    def _pick(
+        self, now: float, only: Collection[str] | None = None
+    ) -> ProxyState | None:
+        best: ProxyState | None = None
+        best_score = float("inf")
+        for proxy in self.proxies:
+            if only and proxy.url not in only:
+                continue
+            if not proxy.is_available(now):
+                continue
+            score = proxy.score(now)
+            if score < best_score:
+                best, best_score = proxy, score
+        return best
+
+    async def acquire(self, only: Collection[str] | None = None) -> ProxyState | None:
+        """Reserve the best proxy (out of `only`), waiting if all are cooling down."""
+        if not self.proxies:
+            return None
+
+        started = time.monotonic()
+        while True:
+            now = time.monotonic()
+            proxy = self._pick(now, only)
+            if proxy is not None:
+                break
+            waits = [
+                max(p.cooldown_until, p.breaker.retry_at) - now for p in self.proxies
+            ]
+            finite = (w for w in waits if 0 < w < math.inf)
+            await asyncio.sleep(min(finite, default=0.05))
+
+        proxy.breaker.begin(now)
+        proxy.in_flight += 1
+        try:
+            await proxy.limiter.wait_for_token()
+        except BaseException:
+            proxy.in_flight -= 1
+            raise
+        finally:
+            self.waited += time.monotonic() - started
+        return proxy
+
+    def _finish(self, proxy: ProxyState, failed: bool):
+        proxy.in_flight -= 1
+        proxy.requests += 1
+        proxy.error_rate += self.alpha * (float(failed) - proxy.error_rate)
+
+    def mark_success(self, proxy: ProxyState, latency: float):
+        self._finish(proxy, failed=False)
+        if proxy.latency is None:
+            proxy.latency = latency
+        else:
+            proxy.latency += self.alpha * (latency - proxy.latency)
+
+        if proxy.quarantined:
+            logger.info(f"Proxy {proxy.label} recovered.")
+        proxy.breaker.record_success()
+
+    def mark_failure(self, proxy: ProxyState, kind: ErrorKind | None = None):
+        self._finish(proxy, failed=True)
+        proxy.failures += 1
+
+        # A failed probe goes straight back into quarantine
+        now = time.monotonic()
+        if proxy.breaker.record_failure(now, kind):
+            cooldown = proxy.breaker.retry_at - now
+            reason = f" ({kind.value})" if kind else ""
+            logger.warning(
+                f"Quarantined proxy {proxy.label} for {cooldown:.0f}s{reason}."
+            )
+
+    def mark_rate_limited(self, proxy: ProxyState, retry_after: float):
+        """Cool down just this proxy instead of pausing every request."""
+        self._finish(proxy, failed=False)
+        # It did deliver a response, so a probe counts as passed
+        proxy.breaker.record_success()
+        proxy.cooldown_until = max(proxy.cooldown_until, time.monotonic() + retry_after)
+
+    @property
+    def healthy(self) -> int:
+        return sum(1 for p in self.proxies if not p.quarantined)
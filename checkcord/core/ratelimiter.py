@@ -1,49 +1,316 @@
 import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass
 
 from rich.console import Console
 
 console = Console()
 
+# Floor for the spacing after a 429 before any request gave a rate to start from
+MIN_BACKOFF_DELAY = 0.1
+# However many 429s come in, the spacing stays within this multiple of the floor
+MAX_BACKOFF_FACTOR = 8.0
+# Weight of the newest gap in the running average of time between requests
+GAP_SMOOTHING = 0.05
+
+# Route key used when the caller does not distinguish endpoints
+DEFAULT_ROUTE = "default"
+
+
+def _header_float(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
+class RateLimitInfo:
+    """The `X-RateLimit-*` headers Discord attaches to every response."""
+
+    bucket: str | None
+    limit: int | None
+    remaining: int | None
+    reset_after: float | None
+    retry_after: float | None
+    is_global: bool
+    scope: str | None = None
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, str]) -> "RateLimitInfo | None":
+        h = {k.lower(): v for k, v in headers.items()}
+        bucket = h.get("x-ratelimit-bucket")
+        remaining = _header_float(h.get("x-ratelimit-remaining"))
+        retry_after = _header_float(h.get("retry-after"))
+        scope = h.get("x-ratelimit-scope")
+        is_global = h.get("x-ratelimit-global", "").lower() == "true" or (
+            scope == "global"
+        )
+        if bucket is None and remaining is None and not is_global:
+            return None
+
+        limit = _header_float(h.get("x-ratelimit-limit"))
+        return cls(
+            bucket=bucket,
+            limit=int(limit) if limit is not None else None,
+            remaining=int(remaining) if remaining is not None else None,
+            reset_after=_header_float(h.get("x-ratelimit-reset-after")),
+            retry_after=retry_after,
+            is_global=is_global,
+            scope=scope,
+        )
+
+
+@dataclass(slots=True)
+class BucketState:
+    """Our running estimate of a Discord rate limit bucket."""
+
+    remaining: int
+    reset_at: float
+    limit: int | None = None
+    window: float = 0.0
+
 
 class GlobalRateLimiter:
-    def __init__(self, initial_delay: float = 0.5):
+    """
+    GCRA (token bucket) limiter shared by every request.
+
+    `current_delay` is the emission interval between requests and `burst` how
+    many may go out back to back. Every caller reserves its own slot, so
+    waiters are released one interval apart instead of all at once.
+
+    On top of that, the `X-RateLimit-*` headers of every response are tracked
+    per bucket so requests slow down before Discord would answer with a 429.
+
+    A global 429 multiplies the interval by `backoff_factor`, starting from a
+    floor of the configured interval (or, unthrottled, the average gap between
+    requests so far) and never going past `MAX_BACKOFF_FACTOR` times it. Every
+    `recovery_after` seconds without one divides it by the factor again,
+    smoothly, until it is back at the floor and then the configured rate.
+    """
+
+    def __init__(
+        self,
+        initial_delay: float = 0.5,
+        burst: int = 1,
+        recovery_after: float = 30.0,
+        backoff_factor: float = 1.5,
+    ):
         self.lock = asyncio.Lock()
-        self.current_delay = initial_delay
+        self.base_delay: float = initial_delay
+        self.current_delay: float = initial_delay
+        self.burst: int = max(1, burst)
+        self.recovery_after: float = recovery_after
+        self.backoff_factor: float = backoff_factor
         self.paused_until: float = 0
         self.is_paused = False
         self._pause_event = asyncio.Event()
         self._pause_event.set()  # Initially set, meaning "go"
+        self._tat: float = 0.0  # Theoretical arrival time of the next request
+        self._epoch: int = 0  # Bumped on every backoff to invalidate old slots
+        self._last_backoff: float = 0.0
+        self._backoff_floor: float = 0.0
+        self._backoff_delay: float = 0.0  # Interval right after the last 429
+        self._gap: float = 0.0  # Running average of the time between requests
+        self._last_request: float | None = None
+        self._buckets: dict[str, BucketState] = {}
+        self._route_buckets: dict[str, str] = {}
+        # Seconds callers spent waiting, summed over callers, by reason
+        self.waited: dict[str, float] = {"backoff": 0.0, "bucket": 0.0, "pacing": 0.0}
+
+    @property
+    def rate(self) -> float:
+        """Current sustained requests per second (inf when unthrottled)."""
+        return 1.0 / self.current_delay if self.current_delay > 0 else float("inf")
+
+    def _now(self) -> float:
+        return asyncio.get_running_loop().time()
+
+    def _recover(self, now: float):
+        """Ease the delay back towards the configured rate as time passes."""
+        if self.current_delay <= self.base_delay:
+            return
+        if self.recovery_after <= 0:
+            self.current_delay = self.base_delay
+            return
+
+        steps = (now - self._last_backoff) / self.recovery_after
+        delay = self._backoff_delay / self.backoff_factor**steps
+        # Below the floor the backoff is over, even for an unthrottled limiter
+        self.current_delay = delay if delay > self._backoff_floor else self.base_delay
+
+    def _bucket_interval(self, route: str, now: float) -> float:
+        """Spacing that stretches the bucket's remaining budget to its reset."""
+        state = self.bucket_for(route)
+        if state is None or now >= state.reset_at:
+            return 0.0
+        return (state.reset_at - now) / (state.remaining + 1)
+
+    def _reserve(self, now: float, route: str = DEFAULT_ROUTE) -> float:
+        """Claim the next slot and return how long to wait for it."""
+        if self._last_request is not None:
+            self._gap += GAP_SMOOTHING * (now - self._last_request - self._gap)
+        self._last_request = now
+        self._recover(now)
+        interval = max(self.current_delay, self._bucket_interval(route, now))
+        tolerance = self.current_delay * (self.burst - 1)
+        tat = max(self._tat, now)
+        self._tat = tat + interval
+        return max(0.0, tat - tolerance - now)
 
-    async def wait_for_token(self):
+    def bucket_for(self, route: str = DEFAULT_ROUTE) -> BucketState | None:
+        bucket = self._route_buckets.get(route)
+        return self._buckets.get(bucket) if bucket is not None else None
+
+    def budget(self, route: str = DEFAULT_ROUTE) -> int | None:
+        """Requests left in the route's current window, if the API told us."""
+        state = self.bucket_for(route)
+        if state is None or self._now() >= state.reset_at:
+            return state.limit if state else None
+        return state.remaining
+
+    def _bucket_delay(self, route: str, now: float) -> float:
+        """Claim one request from the route's bucket, or say how long to wait."""
+        state = self.bucket_for(route)
+        if state is None:
+            return 0.0
+
+        if now >= state.reset_at:
+            # The window rolled over; assume a full budget until headers say otherwise
+            if state.limit is None:
+                return 0.0
+            state.remaining = state.limit
+            state.reset_at = now + state.window
+
+        if state.remaining <= 0:
+            return state.reset_at - now
+
+        state.remaining -= 1
+        return 0.0
+
+    def update_from_headers(
+        self, headers: Mapping[str, str], route: str = DEFAULT_ROUTE
+    ) -> RateLimitInfo | None:
+        """Record the rate limit state reported by a response."""
+        info = RateLimitInfo.from_headers(headers)
+        if info is not None:
+            self.update(info, route)
+        return info
+
+    def update(self, info: RateLimitInfo, route: str = DEFAULT_ROUTE):
+        """Record already parsed rate limit state."""
+        if info.bucket is None or info.remaining is None:
+            return
+
+        self._route_buckets[route] = info.bucket
+        window = info.reset_after or 0.0
+        reset_at = self._now() + window
+        state = self._buckets.get(info.bucket)
+        if state is None:
+            self._buckets[info.bucket] = BucketState(
+                remaining=info.remaining,
+                reset_at=reset_at,
+                limit=info.limit,
+                window=window,
+            )
+            return
+
+        state.limit = info.limit or state.limit
+        state.window = max(state.window, window)
+        # Responses arrive out of order; within a window the lowest count wins
+        if reset_at > state.reset_at + 0.5:
+            state.remaining = info.remaining
+            state.reset_at = reset_at
+        else:
+            state.remaining = min(state.remaining, info.remaining)
+            state.reset_at = max(state.reset_at, reset_at)
+
+    async def wait_for_token(self, route: str = DEFAULT_ROUTE):
         """Wait for permission to make a request."""
-        # Check if we are globally paused
-        await self._pause_event.wait()
+        while True:
+            # Check if we are globally paused
+            if not self._pause_event.is_set():
+                paused_at = self._now()
+                await self._pause_event.wait()
+                self.waited["backoff"] += self._now() - paused_at
 
-        # Apply the current delay
-        await asyncio.sleep(self.current_delay)
+            # Hold off until the bucket refills rather than spending a 429 on it
+            bucket_delay = self._bucket_delay(route, self._now())
+            if bucket_delay > 0:
+                await asyncio.sleep(bucket_delay)
+                self.waited["bucket"] += bucket_delay
+                continue
 
-    async def trigger_backoff(self, retry_after: float):
-        """Trigger a global pause and increase delay."""
+            epoch = self._epoch
+            delay = self._reserve(self._now(), route)
+            if delay > 0:
+                await asyncio.sleep(delay)
+                self.waited["pacing"] += delay
+
+            # A backoff started while we slept; queue again behind it
+            if epoch == self._epoch and self._pause_event.is_set():
+                return
+
+    async def trigger_backoff(self, retry_after: float, bucket: str | None = None):
+        """Trigger a global pause and increase delay.
+
+        A 429 scoped to a single bucket only drains that bucket instead.
+        """
         async with self.lock:
-            # If already paused, check if we need to extend it
+            now = self._now()
+            resume_at = now + retry_after
+
+            if bucket is not None:
+                state = self._buckets.setdefault(
+                    bucket, BucketState(remaining=0, reset_at=resume_at)
+                )
+                state.remaining = 0
+                state.reset_at = max(state.reset_at, resume_at)
+                return
+
+            # If already paused, only extend it
             if not self._pause_event.is_set():
-                if retry_after > self.current_delay:
-                    # Log only if significantly longer
-                    pass
+                if resume_at > self.paused_until:
+                    self.paused_until = resume_at
+                    self._restart_slots(resume_at)
                 return
 
             msg = f"⚠️ Global Rate Limit! Pausing for {retry_after:.2f}s..."
             console.print(f"[bold yellow]{msg}[/bold yellow]")
             self._pause_event.clear()
-            self.current_delay = max(
-                self.current_delay * 1.5, 1.0
-            )  # Increase base delay
+            self.is_paused = True
+            self.paused_until = resume_at
+            self._slow_down(now)
+            self._restart_slots(resume_at)
 
             # Spin up a task to clear the pause after duration
-            asyncio.create_task(self._reset_pause(retry_after))
+            _ = asyncio.create_task(self._reset_pause())
+
+    def _slow_down(self, now: float):
+        self._recover(now)
+        if self.current_delay <= self.base_delay:
+            # A fresh backoff starts from the rate requests were going out at
+            self._backoff_floor = max(self.base_delay, self._gap) or MIN_BACKOFF_DELAY
+        floor = self._backoff_floor
+        self.current_delay = min(
+            max(self.current_delay, floor) * self.backoff_factor,
+            floor * MAX_BACKOFF_FACTOR,
+        )
+        self._backoff_delay = self.current_delay
+        self._last_backoff = now
 
-    async def _reset_pause(self, duration: float):
-        await asyncio.sleep(duration)
+    def _restart_slots(self, resume_at: float):
+        # Start the schedule at the resume time without a burst allowance so
+        # blocked waiters leave one interval apart rather than stampeding
+        self._epoch += 1
+        self._tat = resume_at + self.current_delay * (self.burst - 1)
+
+    async def _reset_pause(self):
+        while (remaining := self.paused_until - self._now()) > 0:
+            await asyncio.sleep(remaining)
+        self.is_paused = False
         self._pause_event.set()
         msg = f"✅ Resuming requests (Delay: {self.current_delay:.2f}s)"
         console.print(f"[bold green]{msg}[/bold green]")
@@ -0,0 +1,84 @@
+import asyncio
+import contextlib
+import heapq
+import itertools
+import random
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class RetryScheduler(Generic[T]):
+    """
+    Items waiting for another attempt, in a heap ordered by ready time.
+
+    The wait before attempt `n + 1` grows as `base_delay * 2**(n - 1)`, capped
+    at `max_delay`, and is shortened by up to `jitter` of itself so names
+    that failed together do not all come back at once.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        jitter: float = 0.5,
+    ):
+        self.max_attempts: int = max_attempts
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+        self.jitter: float = jitter
+        self.scheduled: int = 0
+        self.exhausted: int = 0
+        self._heap: list[tuple[float, int, T]] = []
+        self._seq: itertools.count[int] = itertools.count()
+        self._changed: asyncio.Event = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    @staticmethod
+    def _now() -> float:
+        return asyncio.get_running_loop().time()
+
+    def delay(self, attempt: int) -> float:
+        capped = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return capped * (1 - self.jitter * random.random())
+
+    def schedule(self, item: T, attempt: int, not_before: float = 0.0) -> bool:
+        """
+        Queue `item` after its `attempt`-th failure.
+
+        Returns False once it has used up `max_attempts`. `not_before` is a
+        minimum wait, such as a server supplied Retry-After.
+        """
+        if attempt >= self.max_attempts:
+            self.exhausted += 1
+            return False
+        ready_at = self._now() + max(self.delay(attempt), not_before)
+        heapq.heappush(self._heap, (ready_at, next(self._seq), item))
+        self.scheduled += 1
+        self._changed.set()
+        return True
+
+    def pop_ready(self) -> list[T]:
+        """Take every item whose wait is over."""
+        now = self._now()
+        ready: list[T] = []
+        while self._heap and self._heap[0][0] <= now:
+            ready.append(heapq.heappop(self._heap)[2])
+        return ready
+
+    async def get(self) -> T:
+        """Wait for the earliest item to become ready and take it."""
+        while True:
+            self._changed.clear()
+            if not self._heap:
+                _ = await self._changed.wait()
+                continue
+            wait = self._heap[0][0] - self._now()
+            if wait <= 0:
+                return heapq.heappop(self._heap)[2]
+            # Woken early if something sooner is scheduled meanwhile
+            with contextlib.suppress(asyncio.TimeoutError):
+                _ = await asyncio.wait_for(self._changed.wait(), wait)
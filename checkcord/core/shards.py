@@ -0,0 +1,345 @@
+import asyncio
+import contextlib
+import multiprocessing as mp
+import queue
+import traceback
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Container,
+    Iterable,
+)
+from multiprocessing.queues import Queue
+from typing import TypeVar, cast
+
+from curl_cffi.requests import AsyncSession
+
+from checkcord.core.bloom import KnownTakenFilter
+from checkcord.core.cache import ResultCache
+from checkcord.core.checker import CheckerStats, DiscordChecker
+from checkcord.core.metrics import Metric, MetricsRegistry
+from checkcord.core.pool import numbered
+from checkcord.core.profiler import NullProfiler, PhaseProfiler, PhaseStats
+from checkcord.core.tokens import NoActiveTokensError
+from checkcord.core.util import logger
+from checkcord.core.validator import UsernameValidator
+from checkcord.models import AppConfig, CheckRecord, CheckStatus
+
+T = TypeVar("T")
+
+Batch = list[tuple[int, str]]
+# ("results", index, list[CheckRecord]) | ("metrics", index, list[Metric])
+# | ("profile", index, dict[str, PhaseStats]) | ("done", index, CheckerStats)
+# | ("exhausted", index, Batch it never settled) | ("error", index, traceback)
+Message = tuple[str, int, object]
+
+# Seconds a worker holds finished results before sending a partial batch
+FLUSH_INTERVAL = 0.2
+# Seconds between a worker's metrics reports
+METRICS_INTERVAL = 1.0
+# How often blocked queue calls wake up to notice cancellation
+POLL_INTERVAL = 0.5
+
+
+def shard_config(config: AppConfig, index: int, count: int) -> AppConfig:
+    """Config for worker `index` of `count`: its own tokens and share of the rate."""
+    accounts = config.accounts()[index::count]
+    interval = config.request_interval()
+    return config.model_copy(
+        update={
+            "token": accounts[0].token,
+            "tokens": accounts,
+            # Together the workers keep to the configured global rate
+            "requests_per_second": 1 / (interval * count) if interval else None,
+        }
+    )
+
+
+def prepare_shared_files(config: AppConfig):
+    """
+    Create the cache and known-taken filter every worker opens, once.
+
+    Done in the parent before any worker starts, so the workers only ever
+    open existing files and never race each other to create them.
+    """
+    if config.cache_path:
+        ResultCache(config.cache_path, ttl=config.cache_ttl).close()
+    if config.known_taken_path:
+        KnownTakenFilter(
+            config.known_taken_path, capacity=config.known_taken_capacity
+        ).close()
+
+
+async def _get(q: "Queue[T]") -> T:
+    """
+    `q.get()` off the event loop, without pinning a thread once cancelled.
+
+    The thread still waits out its poll after a cancel, and whatever it takes
+    then goes back on the queue for another worker instead of being lost.
+    """
+    while True:
+        getter = asyncio.ensure_future(asyncio.to_thread(q.get, True, POLL_INTERVAL))
+        try:
+            return await asyncio.shield(getter)
+        except queue.Empty:
+            continue
+        except asyncio.CancelledError:
+            with contextlib.suppress(queue.Empty):
+                await _put(q, await getter)
+            raise
+
+
+async def _put(q: "Queue[T]", item: T):
+    while True:
+        try:
+            return await asyncio.to_thread(q.put, item, True, POLL_INTERVAL)
+        except queue.Full:
+            continue
+
+
+async def _run_worker(
+    index: int,
+    count: int,
+    config: AppConfig,
+    inbox: "Queue[Batch | None]",
+    outbox: "Queue[Message]",
+    profile: bool = False,
+) -> CheckerStats:
+    checker = DiscordChecker(config, shard=(index, count))
+    profiler = PhaseProfiler() if profile else None
+    if profiler is not None:
+        checker.profiler = profiler
+    finished: list[CheckRecord] = []
+    # Taken from the inbox but not finished yet, retries included
+    unsettled: dict[int, str] = {}
+
+    async def items() -> AsyncIterator[tuple[int, str]]:
+        while (batch := await _get(inbox)) is not None:
+            for offset, username in batch:
+                unsettled[offset] = username
+                yield offset, username
+
+    def flush():
+        if finished:
+            outbox.put(("results", index, finished.copy()))
+            finished.clear()
+
+    def report():
+        outbox.put(("metrics", index, checker.metrics.collect()))
+
+    async def flush_periodically():
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL)
+            flush()
+
+    async def report_periodically():
+        while True:
+            await asyncio.sleep(METRICS_INTERVAL)
+            report()
+
+    async with AsyncSession(impersonate="chrome") as session:
+        tasks = [
+            asyncio.create_task(flush_periodically()),
+            asyncio.create_task(report_periodically()),
+        ]
+        try:
+            async for result in checker.stream_numbered(items(), session):
+                if result.offset is not None:
+                    del unsettled[result.offset]
+                finished.append(result)
+                if len(finished) >= config.thread_count:
+                    flush()
+        except NoActiveTokensError:
+            # The other workers may still have tokens; hand the names back
+            outbox.put(("exhausted", index, list(unsettled.items())))
+        finally:
+            for task in tasks:
+                _ = task.cancel()
+    flush()
+    report()
+    if profiler is not None:
+        outbox.put(("profile", index, profiler.phases))
+    return checker.stats()
+
+
+def _worker_main(
+    index: int,
+    count: int,
+    config: AppConfig,
+    inbox: "Queue[Batch | None]",
+    outbox: "Queue[Message]",
+    profile: bool = False,
+):
+    try:
+        stats = asyncio.run(_run_worker(index, count, config, inbox, outbox, profile))
+    except BaseException:
+        outbox.put(("error", index, traceback.format_exc()))
+    else:
+        outbox.put(("done", index, stats))
+
+
+class ShardedChecker:
+    """
+    Runs checks in `workers` processes, each with its own event loop, session
+    and disjoint share of tokens and proxies.
+
+    The parent validates and numbers the input and hands it out in batches
+    from one shared queue, so faster workers simply take more. Results stream
+    back to the parent for progress, journaling and the summary, and the
+    parent is the one process adding the names found taken to the
+    known-taken filter, which the workers only read. A worker
+    whose tokens are all retired hands its unfinished names back for the
+    others; the run only stops short once every worker is out of tokens.
+    """
+
+    def __init__(self, config: AppConfig, workers: int):
+        self.config: AppConfig = config
+        self.requested: int = workers
+        # Every worker needs at least one token of its own
+        self.workers: int = max(1, min(workers, len(config.accounts())))
+        self.batch_size: int = config.thread_count
+        self.validator: UsernameValidator = UsernameValidator()
+        # Holds no families of its own; the workers' latest reports are summed
+        self.metrics: MetricsRegistry = MetricsRegistry()
+        # A PhaseProfiler here makes every worker profile and report back
+        self.profiler: NullProfiler = NullProfiler()
+        self._stats: CheckerStats = CheckerStats()
+        # Names handed to the workers whose results have not come back yet
+        self._unsettled: int = 0
+
+    def stats(self) -> CheckerStats:
+        return self._stats
+
+    async def _feed(
+        self,
+        items: AsyncIterator[tuple[int, str]],
+        inbox: "Queue[Batch | None]",
+    ):
+        batch: Batch = []
+        async for item in items:
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                self._unsettled += len(batch)
+                await _put(inbox, batch)
+                batch = []
+        if batch:
+            self._unsettled += len(batch)
+            await _put(inbox, batch)
+
+    async def stream_usernames(
+        self,
+        usernames: Iterable[str] | AsyncIterable[str],
+        session: AsyncSession | None = None,
+        start: int = 0,
+        skip: Container[int] | Callable[[int, str], bool] = (),
+    ) -> AsyncGenerator[CheckRecord, None]:
+        """Same contract as `DiscordChecker.stream_usernames`; `session` is unused."""
+        ctx = mp.get_context("spawn")
+        inbox: Queue[Batch | None] = ctx.Queue(maxsize=self.workers * 2)
+        outbox: Queue[Message] = ctx.Queue()
+        procs = [
+            ctx.Process(
+                target=_worker_main,
+                args=(
+                    i,
+                    self.workers,
+                    shard_config(self.config, i, self.workers),
+                    inbox,
+                    outbox,
+                    self.profiler.enabled,
+                ),
+                daemon=True,
+            )
+            for i in range(self.workers)
+        ]
+        prepare_shared_files(self.config)
+        known_taken = (
+            KnownTakenFilter(
+                self.config.known_taken_path,
+                capacity=self.config.known_taken_capacity,
+            )
+            if self.config.known_taken_path
+            else None
+        )
+        for proc in procs:
+            proc.start()
+
+        items = numbered(self.validator.filter(usernames), start, skip)
+        self._unsettled = 0
+        feeder = asyncio.create_task(self._feed(items, inbox))
+        running = len(procs)
+        exhausted = 0
+        closing = False
+        # Names handed back by exhausted workers, queued without holding up
+        # the results of the others
+        requeues: list[asyncio.Task[None]] = []
+        try:
+            while running:
+                if not closing and feeder.done() and not self._unsettled:
+                    # Only now: until every name is settled, names handed back
+                    # by an exhausted worker may still need the others
+                    feeder.result()
+                    for _ in range(running):
+                        await _put(inbox, None)
+                    closing = True
+                try:
+                    kind, index, payload = await asyncio.to_thread(
+                        outbox.get, True, POLL_INTERVAL
+                    )
+                except queue.Empty:
+                    error = feeder.exception() if feeder.done() else None
+                    if error is not None:
+                        raise error from None
+                    crashed = [p for p in procs if p.exitcode not in (None, 0)]
+                    if crashed:
+                        raise RuntimeError(
+                            f"Worker process exited with code {crashed[0].exitcode}"
+                        ) from None
+                    continue
+
+                if kind == "results":
+                    results = cast(list[CheckRecord], payload)
+                    self._unsettled -= len(results)
+                    for result in results:
+                        if (
+                            known_taken is not None
+                            and result.status == CheckStatus.TAKEN
+                            and not result.cached
+                        ):
+                            known_taken.add(result.username)
+                        yield result
+                elif kind == "metrics":
+                    self.metrics.children[index] = cast(list[Metric], payload)
+                elif kind == "profile":
+                    if isinstance(self.profiler, PhaseProfiler):
+                        self.profiler.merge(cast(dict[str, PhaseStats], payload))
+                elif kind == "done":
+                    running -= 1
+                    self._stats.add(cast(CheckerStats, payload))
+                elif kind == "exhausted":
+                    exhausted += 1
+                    if exhausted == len(procs):
+                        raise NoActiveTokensError("All tokens have been retired")
+                    logger.warning(
+                        f"Worker {index} has no tokens left; the others take over"
+                    )
+                    leftovers = cast(Batch, payload)
+                    if leftovers:
+                        requeues.append(asyncio.create_task(_put(inbox, leftovers)))
+                else:
+                    raise RuntimeError(f"Worker {index} failed:\n{payload}")
+        finally:
+            for task in (feeder, *requeues):
+                _ = task.cancel()
+            _ = await asyncio.gather(feeder, *requeues, return_exceptions=True)
+            for proc in procs:
+                if proc.is_alive():
+                    proc.terminate()
+                proc.join(timeout=5)
+            # Don't block interpreter exit on undelivered batches
+            inbox.cancel_join_thread()
+            outbox.cancel_join_thread()
+            if known_taken is not None:
+                known_taken.close()
@@ -0,0 +1,310 @@
+import asyncio
+import contextlib
+import csv
+import json
+import sqlite3
+import sys
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Collection
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum
+from pathlib import Path
+from typing import TextIO
+
+if sys.version_info >= (3, 12):
+    from typing import override
+else:
+    from typing_extensions import override
+
+from checkcord.models import CheckRecord, CheckStatus
+
+# Columns of the structured formats, in order
+FIELDS = (
+    "username",
+    "status",
+    "message",
+    "latency",
+    "proxy",
+    "attempts",
+    "error",
+    "offset",
+    "checked_at",
+)
+
+# Batches handed to the writer thread but not yet on disk. Past this the run
+# waits for the disk instead of buffering without bound.
+MAX_QUEUED_BATCHES = 8
+
+# Not `results`, so the output can share a file with the result cache
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS check_results (
+    username TEXT NOT NULL,
+    status TEXT NOT NULL,
+    message TEXT,
+    latency REAL,
+    proxy TEXT,
+    attempts INTEGER NOT NULL,
+    error TEXT,
+    offset INTEGER,
+    checked_at REAL NOT NULL
+)
+"""
+
+Row = tuple[
+    str, str, str | None, float | None, str | None, int, str | None, int | None, float
+]
+
+
+class SinkFormat(str, Enum):
+    TEXT = "txt"
+    JSONL = "jsonl"
+    CSV = "csv"
+    SQLITE = "sqlite"
+
+
+SUFFIXES = {
+    ".jsonl": SinkFormat.JSONL,
+    ".ndjson": SinkFormat.JSONL,
+    ".csv": SinkFormat.CSV,
+    ".db": SinkFormat.SQLITE,
+    ".sqlite": SinkFormat.SQLITE,
+    ".sqlite3": SinkFormat.SQLITE,
+}
+
+
+def to_row(record: CheckRecord, checked_at: float) -> Row:
+    return (
+        record.username,
+        record.status.value,
+        record.message,
+        record.latency,
+        record.proxy,
+        record.attempts,
+        record.error.value if record.error is not None else None,
+        record.offset,
+        checked_at,
+    )
+
+
+class ResultSink(ABC):
+    """
+    Appends finished checks to a file as they arrive.
+
+    `write` only buffers a row on the event loop. Full batches, and any rows
+    left waiting for `flush_interval` seconds, are written and flushed by a
+    single writer thread, so output keeps up with the run without the loop
+    ever blocking on the disk. When the thread falls behind, `write` awaits
+    it, so memory stays bounded however long the run goes.
+    """
+
+    format: SinkFormat
+
+    def __init__(
+        self,
+        path: Path | str,
+        statuses: Collection[CheckStatus] | None = None,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+    ):
+        self.path: Path = Path(path)
+        # None keeps every result
+        self.statuses: frozenset[CheckStatus] | None = (
+            frozenset(statuses) if statuses is not None else None
+        )
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self.written: int = 0
+        self._buffer: list[Row] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="checkcord-sink"
+        )
+        self._futures: list[Future[None]] = []
+        self._opened: bool = False
+        self._closed: bool = False
+
+    async def write(self, record: CheckRecord):
+        if self.statuses is not None and record.status not in self.statuses:
+            return
+
+        self._buffer.append(to_row(record, time.time()))
+        self.written += 1
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+        elif self._timer is None:
+            # Rows trickling in during a slow stretch still reach the disk soon
+            with contextlib.suppress(RuntimeError):
+                loop = asyncio.get_running_loop()
+                self._timer = loop.call_later(self.flush_interval, self._submit)
+
+    async def flush(self):
+        """Hand buffered rows to the writer thread, waiting while it is behind."""
+        self._submit()
+        self._check_errors()
+        while len(self._futures) > MAX_QUEUED_BATCHES:
+            # Awaited, so the rest of the run goes on while the disk catches up
+            _ = await asyncio.wait([asyncio.wrap_future(self._futures[0])])
+            self._check_errors()
+
+    def _submit(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._buffer:
+            batch, self._buffer = self._buffer, []
+            self._futures.append(self._executor.submit(self._write_batch, batch))
+
+    def close(self):
+        """Write everything still buffered and wait for it to reach the file."""
+        if self._closed:
+            return
+        self._closed = True
+        self._submit()
+        self._futures.append(self._executor.submit(self._finish))
+        self._executor.shutdown(wait=True)
+        self._check_errors()
+
+    def _check_errors(self):
+        # A failed write surfaces on the next flush rather than being lost
+        pending: list[Future[None]] = []
+        for future in self._futures:
+            if not future.done():
+                pending.append(future)
+            elif (error := future.exception()) is not None:
+                raise error
+        self._futures = pending
+
+    def _write_batch(self, batch: list[Row]):
+        if not self._opened:
+            self._open()
+            self._opened = True
+        self._write(batch)
+
+    def _finish(self):
+        if self._opened:
+            self._close()
+
+    # Called on the writer thread only
+    @abstractmethod
+    def _open(self) -> None:
+        """Open the file, before the first batch is written."""
+
+    @abstractmethod
+    def _write(self, batch: list[Row]) -> None:
+        """Append `batch` and flush it to the file."""
+
+    @abstractmethod
+    def _close(self) -> None:
+        """Close the file, after the last batch was written."""
+
+
+class FileSink(ResultSink):
+    """A sink writing lines to a text file opened for appending."""
+
+    _file: TextIO
+
+    @override
+    def _open(self):
+        self._file = open(self.path, "a", newline="")  # noqa: SIM115
+
+    @override
+    def _close(self):
+        self._file.close()
+
+
+class TextSink(FileSink):
+    """One username per line, the format `valid_usernames.txt` has always had."""
+
+    format = SinkFormat.TEXT
+
+    @override
+    def _write(self, batch: list[Row]):
+        _ = self._file.write("".join(f"{row[0]}\n" for row in batch))
+        self._file.flush()
+
+
+class JsonlSink(FileSink):
+    """One JSON object per result."""
+
+    format = SinkFormat.JSONL
+
+    @override
+    def _write(self, batch: list[Row]):
+        _ = self._file.write(
+            "".join(
+                json.dumps(dict(zip(FIELDS, row, strict=True))) + "\n" for row in batch
+            )
+        )
+        self._file.flush()
+
+
+class CsvSink(FileSink):
+    """Comma separated results, with a header when the file starts out empty."""
+
+    format = SinkFormat.CSV
+
+    @override
+    def _open(self):
+        super()._open()
+        self._writer = csv.writer(self._file)
+        if self._file.tell() == 0:
+            _ = self._writer.writerow(FIELDS)
+
+    @override
+    def _write(self, batch: list[Row]):
+        self._writer.writerows(batch)
+        self._file.flush()
+
+
+class SqliteSink(ResultSink):
+    """A `check_results` table with one row per result, committed per batch."""
+
+    format = SinkFormat.SQLITE
+
+    @override
+    def _open(self):
+        self.conn: sqlite3.Connection = sqlite3.connect(self.path)
+        _ = self.conn.execute("PRAGMA journal_mode=WAL")
+        _ = self.conn.execute("PRAGMA synchronous=NORMAL")
+        _ = self.conn.execute(SCHEMA)
+        self.conn.commit()
+
+    @override
+    def _write(self, batch: list[Row]):
+        with self.conn:
+            _ = self.conn.executemany(
+                "INSERT INTO check_results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", batch
+            )
+
+    @override
+    def _close(self):
+        self.conn.close()
+
+
+SINKS: dict[SinkFormat, type[ResultSink]] = {
+    SinkFormat.TEXT: TextSink,
+    SinkFormat.JSONL: JsonlSink,
+    SinkFormat.CSV: CsvSink,
+    SinkFormat.SQLITE: SqliteSink,
+}
+
+
+def open_sink(
+    path: Path | str,
+    format: SinkFormat | None = None,
+    statuses: Collection[CheckStatus] | None = None,
+    batch_size: int = 500,
+    flush_interval: float = 1.0,
+) -> ResultSink:
+    """
+    Open the sink for `path`, picking the format from its suffix when not given.
+
+    Plain text lists only available names unless `statuses` says otherwise;
+    the structured formats keep every result by default.
+    """
+    if format is None:
+        format = SUFFIXES.get(Path(path).suffix.lower(), SinkFormat.TEXT)
+    if statuses is None and format == SinkFormat.TEXT:
+        statuses = (CheckStatus.AVAILABLE,)
+    return SINKS[format](path, statuses, batch_size, flush_interval)
@@ -0,0 +1,129 @@
+import asyncio
+import math
+import time
+
+from checkcord.core.breaker import BreakerState, CircuitBreaker
+from checkcord.core.errors import ErrorKind
+from checkcord.core.ratelimiter import GlobalRateLimiter
+from checkcord.core.util import logger
+from checkcord.models import TokenConfig
+
+# How often requests waiting on a token's probe check whether it came back
+PROBE_POLL = 0.05
+
+
+class NoActiveTokensError(RuntimeError):
+    """Raised once every configured token has been retired."""
+
+
+class TokenState:
+    """Rate limit budget and status of a single account token."""
+
+    def __init__(self, account: TokenConfig):
+        self.token: str = account.token
+        self.proxies: list[str] = account.proxies
+        self.headers: dict[str, str] = {
+            "Authorization": account.token,
+            "Content-Type": "application/json",
+        }
+        # Tracks this account's buckets; pacing is left to the global limiter
+        self.limiter: GlobalRateLimiter = GlobalRateLimiter(initial_delay=0.0)
+        self.breaker: CircuitBreaker = CircuitBreaker()
+        self.cooldown_until: float = 0.0
+        self.in_flight: int = 0
+        self.requests: int = 0
+
+    @property
+    def retired(self) -> bool:
+        return self.breaker.dead
+
+    @property
+    def label(self) -> str:
+        """Short, log-safe identifier for the token."""
+        return f"...{self.token[-6:]}"
+
+    @property
+    def ready_at(self) -> float:
+        """When the next request may go out (inf while a probe is out)."""
+        if self.breaker.state is BreakerState.HALF_OPEN and self.in_flight:
+            # One probe at a time; the rest wait for its verdict
+            return math.inf
+        return max(self.cooldown_until, self.breaker.retry_at)
+
+    def score(self, now: float) -> tuple[float, float, int]:
+        """Lower is better: ready soonest, most budget left, least busy."""
+        ready_at = self.ready_at
+        budget = 1.0
+        state = self.limiter.bucket_for()
+        if state is not None and now < state.reset_at:
+            if state.remaining <= 0:
+                ready_at = max(ready_at, state.reset_at)
+            if state.limit:
+                budget = state.remaining / state.limit
+        return (max(ready_at - now, 0.0), -budget, self.in_flight)
+
+
+class TokenPool:
+    """Spreads requests over several tokens, each with its own rate budget."""
+
+    def __init__(self, accounts: list[TokenConfig]):
+        self.tokens: list[TokenState] = [TokenState(a) for a in accounts]
+        # Seconds requests spent waiting for a resting or drained token
+        self.waited: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self.tokens)
+
+    @property
+    def active(self) -> list[TokenState]:
+        return [t for t in self.tokens if not t.retired]
+
+    async def acquire(self) -> TokenState:
+        """Reserve the token with the most budget, waiting for it if needed."""
+        started = time.monotonic()
+        try:
+            while True:
+                active = self.active
+                if not active:
+                    raise NoActiveTokensError("All tokens have been retired")
+
+                now = time.monotonic()
+                token = min(active, key=lambda t: t.score(now))
+                wait = token.ready_at - now
+                if wait <= 0:
+                    break
+                # Picked again after the wait: another request may have taken
+                # the probe of a half open token in the meantime
+                await asyncio.sleep(wait if wait < math.inf else PROBE_POLL)
+
+            token.breaker.begin(now)
+            token.in_flight += 1
+            try:
+                await token.limiter.wait_for_token()
+            except BaseException:
+                token.in_flight -= 1
+                raise
+        finally:
+            self.waited += time.monotonic() - started
+        return token
+
+    def release(self, token: TokenState):
+        token.in_flight -= 1
+        token.requests += 1
+
+    def cool_down(self, token: TokenState, seconds: float):
+        """Rest a rate limited token while the others keep working."""
+        token.cooldown_until = max(token.cooldown_until, time.monotonic() + seconds)
+
+    def mark_failure(self, token: TokenState, kind: ErrorKind, reason: str):
+        """Feed a failure to the token's breaker; fatal kinds retire it."""
+        if token.retired:
+            return
+        if token.breaker.record_failure(time.monotonic(), kind):
+            if token.retired:
+                logger.warning(f"Retired token {token.label}: {reason}")
+            else:
+                logger.warning(f"Paused token {token.label}: {reason}")
+
+    def retire(self, token: TokenState, reason: str):
+        self.mark_failure(token, ErrorKind.AUTH, reason)
@@ -1,10 +1,12 @@
 import logging
 
 from rich.console import Console
-from rich.logging import RichHandler
 
 
 def setup_logging(debug: bool = False):
+    # Deferred: rich.logging pulls in tracebacks and pretty printing
+    from rich.logging import RichHandler
+
     level = logging.DEBUG if debug else logging.INFO
     logging.basicConfig(
         level=level,
@@ -0,0 +1,78 @@
+import re
+import string
+from collections import Counter
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from typing import overload
+
+MIN_LENGTH = 2
+MAX_LENGTH = 32
+RESERVED = frozenset({"everyone", "here"})
+BANNED_SUBSTRINGS = ("discord",)
+# Every character a username may use, periods last
+CHARSET = string.ascii_lowercase + string.digits + "_."
+
+_CHARSET = re.compile(f"[{re.escape(CHARSET)}]+")
+
+
+def invalid_reason(username: str) -> str | None:
+    """
+    Why Discord would refuse `username` as a unique username, or None.
+
+    Mirrors the pomelo rules: 2-32 characters of `a-z 0-9 _ .`, no two
+    periods in a row, and none of the reserved names or banned substrings.
+    Case is ignored since Discord lowercases usernames itself.
+    """
+    name = username.lower()
+    if not MIN_LENGTH <= len(name) <= MAX_LENGTH:
+        return "length"
+    if not _CHARSET.fullmatch(name):
+        return "charset"
+    if ".." in name:
+        return "consecutive periods"
+    if name in RESERVED:
+        return "reserved"
+    if any(word in name for word in BANNED_SUBSTRINGS):
+        return "banned word"
+    return None
+
+
+def is_valid(username: str) -> bool:
+    return invalid_reason(username) is None
+
+
+class UsernameValidator:
+    """Drops names Discord can never accept and counts why, before any request."""
+
+    def __init__(self):
+        self.accepted: int = 0
+        self.rejected: Counter[str] = Counter()
+
+    @property
+    def saved(self) -> int:
+        """Requests not spent on invalid names."""
+        return sum(self.rejected.values())
+
+    def check(self, username: str) -> bool:
+        reason = invalid_reason(username)
+        if reason is None:
+            self.accepted += 1
+            return True
+        self.rejected[reason] += 1
+        return False
+
+    @overload
+    def filter(self, usernames: AsyncIterable[str]) -> AsyncIterator[str]: ...
+    @overload
+    def filter(self, usernames: Iterable[str]) -> Iterator[str]: ...
+    def filter(
+        self, usernames: Iterable[str] | AsyncIterable[str]
+    ) -> Iterator[str] | AsyncIterator[str]:
+        """Lazily pass through the valid names, keeping the input's flavour."""
+        if isinstance(usernames, AsyncIterable):
+            return self._afilter(usernames)
+        return (name for name in usernames if self.check(name))
+
+    async def _afilter(self, usernames: AsyncIterable[str]) -> AsyncIterator[str]:
+        async for name in usernames:
+            if self.check(name):
+                yield name
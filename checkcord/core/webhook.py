@@ -0,0 +1,135 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import cast
+
+from curl_cffi.requests import AsyncSession, Response
+
+from checkcord.core.metrics import Histogram
+from checkcord.core.util import logger
+
+# Discord accepts at most 10 embeds per webhook message
+MAX_EMBEDS = 10
+
+
+def available_embed(username: str) -> dict[str, object]:
+    # Plain dict with the same shape as models.WebhookEmbed, minus validation
+    return {
+        "title": f"**{username}**",
+        "description": "Username is available!",
+        "url": "https://github.com/xsyncio/CheckCord",
+        "color": 0x00FF00,
+        "footer": {"text": "CheckCord"},
+        "timestamp": str(datetime.now()),
+    }
+
+
+class WebhookDispatcher:
+    """
+    Background queue delivering hits to a Discord webhook.
+
+    Submitting never waits on the network: hits are grouped into messages of
+    up to 10 embeds and sent by a single task that honours the webhook's own
+    rate limits.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        batch_window: float = 1.0,
+        max_retries: int = 5,
+        lag: Histogram | None = None,
+    ):
+        self.url: str = url
+        self.batch_window: float = batch_window
+        self.max_retries: int = max_retries
+        self.sent: int = 0
+        self.failed: int = 0
+        # Observes the seconds from submitting a hit to its delivery
+        self.lag: Histogram | None = lag
+        self._queue: asyncio.Queue[tuple[str, float] | None] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    def submit(self, session: AsyncSession, username: str):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(session))
+        self._queue.put_nowait((username, time.monotonic()))
+
+    async def aclose(self):
+        """Deliver everything still queued, then stop the sender."""
+        if self._task is None:
+            return
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+
+    async def _run(self, session: AsyncSession):
+        closing = False
+        while not closing:
+            first = await self._queue.get()
+            if first is None:
+                return
+
+            batch = [first]
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self.batch_window
+            # Give a burst of hits a moment to share one message
+            while len(batch) < MAX_EMBEDS:
+                timeout = deadline - loop.time()
+                try:
+                    if timeout > 0:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    else:
+                        item = self._queue.get_nowait()
+                except (asyncio.TimeoutError, asyncio.QueueEmpty):
+                    break
+                if item is None:
+                    closing = True
+                    break
+                batch.append(item)
+
+            await self._send(session, batch)
+
+    async def _send(self, session: AsyncSession, batch: list[tuple[str, float]]):
+        usernames = [username for username, _ in batch]
+        payload = {"embeds": [available_embed(u) for u in usernames]}
+
+        for attempt in range(self.max_retries):
+            delay = 2.0**attempt
+            try:
+                response: Response = await session.post(self.url, json=payload)  # type: ignore
+                if response.status_code == 429:
+                    delay = self._retry_after(response, delay)
+                elif response.status_code < 500:
+                    if response.status_code >= 400:
+                        logger.error(
+                            f"Webhook rejected {len(usernames)} hits: "
+                            f"HTTP {response.status_code}"
+                        )
+                        break
+                    self.sent += len(usernames)
+                    if self.lag is not None:
+                        now = time.monotonic()
+                        for _, submitted in batch:
+                            self.lag.observe(now - submitted)
+                    return
+            except Exception as e:
+                logger.error(f"Failed to send webhook: {e}")
+
+            await asyncio.sleep(delay)
+
+        self.failed += len(usernames)
+        logger.error(f"Dropped webhook for {', '.join(usernames)}")
+
+    @staticmethod
+    def _retry_after(response: Response, default: float) -> float:
+        try:
+            data = cast(dict[str, object], response.json())  # type: ignore
+            value = data.get("retry_after", default)
+            return float(value) if isinstance(value, (int, float, str)) else default
+        except Exception:
+            return default
@@ -1,7 +1,11 @@
+from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from typing import cast
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, field_validator
+
+from checkcord.core.errors import ErrorKind
 
 
 class WebhookEmbedFooter(BaseModel):
@@ -22,8 +26,22 @@ class WebhookPayload(BaseModel):
     content: str | None = None
 
 
+class TokenConfig(BaseModel):
+    token: str = Field(..., description="Discord User Token")
+    proxies: list[str] = Field(
+        default_factory=list, description="Proxies this token is pinned to"
+    )
+
+
+# Values load_config writes when no real token is configured
+PLACEHOLDER_TOKENS = frozenset({"YOUR_TOKEN_HERE", "INVALID_TOKEN_LOAD_FAILED"})
+
+
 class AppConfig(BaseModel):
     token: str = Field(..., description="Discord User Token")
+    tokens: list[TokenConfig] = Field(
+        default_factory=list, description="Additional tokens to spread checks over"
+    )
     webhook_url: HttpUrl | None = Field(
         None, description="Discord Webhook URL for notifications"
     )
@@ -31,6 +49,75 @@ class AppConfig(BaseModel):
     retry_delay: float = Field(
         2.0, ge=0.0, description="Delay between checks in seconds"
     )
+    requests_per_second: float | None = Field(
+        None,
+        gt=0.0,
+        description="Sustained request rate (defaults to thread_count / retry_delay)",
+    )
+    burst: int = Field(1, ge=1, description="Requests allowed back to back")
+    recovery_after: float = Field(
+        30.0,
+        ge=0.0,
+        description="Seconds without a global 429 to win back one backoff step "
+        "(0 recovers at once)",
+    )
+    max_attempts: int = Field(
+        4, ge=1, description="Tries per username before giving up on it"
+    )
+    retry_backoff: float = Field(
+        1.0, ge=0.0, description="Wait before the first retry, doubled each time"
+    )
+    retry_backoff_max: float = Field(
+        60.0, ge=0.0, description="Longest wait between retries"
+    )
+    api_base: str = Field(
+        "https://discord.com/api/v9", description="Discord API base URL"
+    )
+    cache_path: str | None = Field(
+        "checkcord.db", description="SQLite file remembering past results"
+    )
+    cache_ttl: float = Field(
+        86400.0, ge=0.0, description="Skip names found taken within this many seconds"
+    )
+    known_taken_path: str | None = Field(
+        None, description="Bloom filter skipping names found taken before (opt-in)"
+    )
+    known_taken_capacity: int = Field(
+        5_000_000, ge=1000, description="Names the filter is sized for"
+    )
+
+    @field_validator("tokens", mode="before")
+    @classmethod
+    def _coerce_tokens(cls, value: object) -> object:
+        # Allow plain strings in config.json for tokens without pinned proxies
+        if isinstance(value, list):
+            return [
+                {"token": item} if isinstance(item, str) else item
+                for item in cast(list[object], value)
+            ]
+        return value
+
+    def accounts(self) -> list[TokenConfig]:
+        """Every configured token, the primary one first, without duplicates."""
+        accounts: dict[str, TokenConfig] = {}
+        for account in [TokenConfig(token=self.token), *self.tokens]:
+            if account.token in PLACEHOLDER_TOKENS:
+                continue
+            if account.token in accounts:
+                # A repeated token keeps the proxies pinned to either entry
+                merged = accounts[account.token]
+                merged.proxies = merged.proxies + [
+                    p for p in account.proxies if p not in merged.proxies
+                ]
+                continue
+            accounts[account.token] = account.model_copy()
+        return list(accounts.values())
+
+    def request_interval(self) -> float:
+        """Seconds between requests for the global limiter."""
+        if self.requests_per_second:
+            return 1.0 / self.requests_per_second
+        return self.retry_delay / self.thread_count
 
 
 class CheckStatus(str, Enum):
@@ -38,9 +125,41 @@ class CheckStatus(str, Enum):
     TAKEN = "TAKEN"
     RATE_LIMITED = "RATE_LIMITED"
     ERROR = "ERROR"
+    # Not checked: the known-taken filter says it was probably taken before
+    SKIPPED = "SKIPPED"
+
+
+@dataclass(slots=True)
+class CheckRecord:
+    """
+    A finished check as it travels through the pipeline.
+
+    Plain slots instead of a validated model: millions of these are built and
+    dropped per run. `CheckResult.from_record` turns one into the model where
+    results leave the program.
+    """
+
+    username: str
+    status: CheckStatus
+    message: str | None = None
+    latency: float | None = None
+    offset: int | None = None
+    attempts: int = 1
+    error: ErrorKind | None = None
+    proxy: str | None = None  # Credential-free label of the proxy used
+    cached: bool = False  # Answered from an earlier run's result, not checked
 
 
 class CheckResult(BaseModel):
     username: str
     status: CheckStatus
     message: str | None = None
+    latency: float | None = None
+    offset: int | None = None
+    attempts: int = 1
+    error: ErrorKind | None = None
+    proxy: str | None = None
+
+    @classmethod
+    def from_record(cls, record: CheckRecord) -> "CheckResult":
+        return cls.model_validate(record, from_attributes=True)
@@ -0,0 +1,140 @@
+"""Tests for checkcord.bench (mock server and load test)."""
+
+import time
+
+import pytest
+
+from checkcord.bench import MockDiscordServer, MockOptions, run_benchmark
+from checkcord.bench.loadtest import bench_config, percentile
+from checkcord.core.bloom import KnownTakenFilter
+from checkcord.core.breaker import BreakerState
+from checkcord.core.cache import ResultCache
+from checkcord.core.checker import DiscordChecker
+from checkcord.core.tokens import NoActiveTokensError
+from checkcord.models import CheckRecord, CheckStatus
+
+
+class TestMockServer:
+    """End-to-end checks of DiscordChecker against the mock server."""
+
+    @pytest.mark.asyncio
+    async def test_taken_and_available(self):
+        async with MockDiscordServer(MockOptions(taken_ratio=0.5)) as server:
+            checker = DiscordChecker(bench_config(server, thread_count=5))
+            names = [f"user{i}" for i in range(40)]
+            results = await checker.process_usernames(names)
+
+        assert len(results) == 40
+        for result in results:
+            expected = (
+                CheckStatus.TAKEN
+                if server.is_taken(result.username)
+                else CheckStatus.AVAILABLE
+            )
+            assert result.status == expected
+            assert result.latency is not None
+
+    @pytest.mark.asyncio
+    async def test_bucket_headers_prevent_429s(self):
+        options = MockOptions(bucket_limit=10, bucket_window=0.2)
+        async with MockDiscordServer(options) as server:
+            checker = DiscordChecker(bench_config(server, thread_count=5))
+            results = await checker.process_usernames(f"u{i}" for i in range(40))
+
+        assert len(results) == 40
+        assert server.statuses[429] <= 5
+        # The few 429s that slip through are retried rather than reported
+        assert all(r.status != CheckStatus.RATE_LIMITED for r in results)
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_names_are_retried(self):
+        options = MockOptions(global_429_ratio=0.3, retry_after=0.01)
+        async with MockDiscordServer(options) as server:
+            config = bench_config(server, thread_count=5, max_attempts=20)
+            checker = DiscordChecker(config)
+            checker.rate_limiter.recovery_after = 0.0
+            results = await checker.process_usernames(f"u{i}" for i in range(30))
+
+        assert len(results) == 30
+        assert server.statuses[429] > 0
+        assert all(r.status != CheckStatus.RATE_LIMITED for r in results)
+        assert max(r.attempts for r in results) > 1
+
+    @pytest.mark.asyncio
+    async def test_known_taken_filter_only_skips_cache_misses(self, tmp_path):
+        bloom = KnownTakenFilter(tmp_path / "taken.bloom", capacity=1000)
+        bloom.add("freed")
+        bloom.add("stale")
+        bloom.close()
+        cache = ResultCache(tmp_path / "cache.db", ttl=3600)
+        cache.record(CheckRecord(username="freed", status=CheckStatus.AVAILABLE))
+        cache.close()
+
+        async with MockDiscordServer() as server:
+            config = bench_config(
+                server,
+                cache_path=str(tmp_path / "cache.db"),
+                known_taken_path=str(tmp_path / "taken.bloom"),
+            )
+            checker = DiscordChecker(config)
+            results = await checker.process_usernames(["freed", "stale"])
+
+        statuses = {r.username: r.status for r in results}
+        # A cached available name is checked again, whatever the filter says
+        assert statuses["freed"] != CheckStatus.SKIPPED
+        assert statuses["stale"] == CheckStatus.SKIPPED
+        assert server.requests == 1
+        assert checker.known_taken_skipped == 1
+
+    @pytest.mark.asyncio
+    async def test_server_errors_open_the_token_breaker(self):
+        options = MockOptions(server_error_ratio=1.0)
+        async with MockDiscordServer(options) as server:
+            config = bench_config(server, thread_count=1, max_attempts=1)
+            checker = DiscordChecker(config)
+            results = await checker.process_usernames(["aa", "bb", "cc"])
+            token = checker.token_pool.tokens[0]
+            assert [r.status for r in results] == [CheckStatus.ERROR] * 3
+            assert token.breaker.state is BreakerState.OPEN
+            assert not token.retired
+
+            # Past the cooldown one probe goes out, and its success closes it
+            server.options.server_error_ratio = 0.0
+            token.breaker.retry_at = time.monotonic()
+            results = await checker.process_usernames(["dd", "ee"])
+            assert len(results) == 2
+            assert all(r.status != CheckStatus.ERROR for r in results)
+            assert token.breaker.state is BreakerState.CLOSED
+
+        assert server.statuses[503] == 3
+
+    @pytest.mark.asyncio
+    async def test_unauthorized_token_is_retired(self):
+        options = MockOptions(valid_tokens={"good"})
+        async with MockDiscordServer(options) as server:
+            config = bench_config(server, token="bad", thread_count=1)
+            checker = DiscordChecker(config)
+            with pytest.raises(NoActiveTokensError):
+                _ = await checker.process_usernames(f"u{i}" for i in range(20))
+
+        assert server.statuses[401] == 1
+
+
+class TestBenchmark:
+    """Tests for the load-test driver."""
+
+    def test_percentile(self):
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 51.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 50) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_run_benchmark(self):
+        report = await run_benchmark(200, thread_count=10)
+        assert report.checks == 200
+        assert report.requests == 200
+        assert report.requests_per_second > 0
+        assert report.p99 >= report.p50 > 0
+        assert report.rate_limited_ratio == 0.0
+        assert dict(report.rows())["Checks"] == "200"
@@ -0,0 +1,65 @@
+"""Tests for checkcord.core.bloom module."""
+
+import pytest
+
+from checkcord.core.bloom import KnownTakenFilter
+
+
+class TestKnownTakenFilter:
+    """Tests for KnownTakenFilter."""
+
+    def test_membership(self, tmp_path):
+        bloom = KnownTakenFilter(tmp_path / "taken.bloom", capacity=1000)
+        bloom.add("discord")
+        assert "discord" in bloom
+        assert "DISCORD" in bloom
+        assert "nitro" not in bloom
+        assert len(bloom) == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "taken.bloom"
+        bloom = KnownTakenFilter(path, capacity=1000)
+        for i in range(100):
+            bloom.add(f"user{i}")
+        bloom.close()
+
+        reopened = KnownTakenFilter(path)
+        assert all(f"user{i}" in reopened for i in range(100))
+        assert len(reopened) == 100
+        reopened.close()
+
+    def test_readonly_sees_the_writer(self, tmp_path):
+        path = tmp_path / "taken.bloom"
+        writer = KnownTakenFilter(path, capacity=1000)
+        reader = KnownTakenFilter(path, readonly=True)
+        writer.add("alpha")
+        # Mapped from the same file, so no reopening or flushing needed
+        assert "alpha" in reader
+        with pytest.raises(PermissionError):
+            reader.add("beta")
+        reader.close()
+        writer.close()
+
+        reopened = KnownTakenFilter(path)
+        assert len(reopened) == 1
+        reopened.close()
+
+    def test_readonly_never_creates(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            _ = KnownTakenFilter(tmp_path / "missing.bloom", readonly=True)
+
+    def test_false_positive_rate(self, tmp_path):
+        bloom = KnownTakenFilter(
+            tmp_path / "taken.bloom", capacity=5000, error_rate=0.01
+        )
+        for i in range(5000):
+            bloom.add(f"taken{i}")
+        false_positives = sum(f"free{i}" in bloom for i in range(5000))
+        assert false_positives < 5000 * 0.03
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "other.bin"
+        _ = path.write_bytes(b"not a bloom filter at all")
+        with pytest.raises(ValueError):
+            _ = KnownTakenFilter(path)
+        assert path.read_bytes() == b"not a bloom filter at all"
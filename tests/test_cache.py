@@ -0,0 +1,63 @@
+"""Tests for checkcord.core.cache module."""
+
+import pytest
+
+from checkcord.core.cache import ResultCache
+from checkcord.models import CheckResult, CheckStatus
+
+
+class TestResultCache:
+    """Tests for ResultCache."""
+
+    @pytest.mark.asyncio
+    async def test_roundtrip(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache.db", ttl=60.0)
+        cache.record(CheckResult(username="Taken", status=CheckStatus.TAKEN))
+        _ = cache.flush()
+
+        cached = await cache.lookup("taken")
+        assert cached is not None
+        assert cached.status == CheckStatus.TAKEN
+        assert cached.cached
+
+    @pytest.mark.asyncio
+    async def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "cache.db"
+        cache = ResultCache(path, ttl=60.0)
+        cache.record(CheckResult(username="free", status=CheckStatus.AVAILABLE))
+        cache.close()
+
+        reopened = ResultCache(path, ttl=60.0)
+        cached = await reopened.lookup("free")
+        assert cached is not None
+        assert cached.status == CheckStatus.AVAILABLE
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_ignores_inconclusive_results(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache.db", ttl=60.0)
+        cache.record(CheckResult(username="a", status=CheckStatus.ERROR))
+        cache.record(CheckResult(username="b", status=CheckStatus.RATE_LIMITED))
+        _ = cache.flush()
+        assert await cache.lookup("a") is None
+        assert await cache.lookup("b") is None
+
+    @pytest.mark.asyncio
+    async def test_expired_and_disabled(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache.db", ttl=0.0)
+        cache.record(CheckResult(username="x", status=CheckStatus.TAKEN))
+        _ = cache.flush()
+        assert await cache.lookup("x") is None
+
+        cache.ttl = 1e-9
+        assert await cache.lookup("x") is None
+
+    @pytest.mark.asyncio
+    async def test_writes_are_batched(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache.db", ttl=60.0, batch_size=3)
+        for name in ("a", "b"):
+            cache.record(CheckResult(username=name, status=CheckStatus.TAKEN))
+        assert await cache.lookup("a") is None
+
+        cache.record(CheckResult(username="c", status=CheckStatus.TAKEN))
+        assert await cache.lookup("a") is not None
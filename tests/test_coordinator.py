@@ -0,0 +1,128 @@
+"""Tests for checkcord.core.coordinator module."""
+
+import asyncio
+import multiprocessing as mp
+
+import pytest
+
+from checkcord.bench.loadtest import bench_config
+from checkcord.bench.mock_server import MockDiscordServer
+from checkcord.core.coordinator import LeaseQueue, run_node
+from checkcord.core.keyspace import Keyspace
+from checkcord.models import AppConfig, CheckResult, CheckStatus
+
+
+def taken(offset: int, username: str) -> CheckResult:
+    return CheckResult(username=username, status=CheckStatus.TAKEN, offset=offset)
+
+
+def node_process(path: str, config: AppConfig, worker_id: str):
+    queue = LeaseQueue(path)
+    _ = asyncio.run(run_node(queue, config, worker_id, poll_interval=0.05))
+    queue.close()
+
+
+class TestLeaseQueue:
+    """Tests for LeaseQueue."""
+
+    def test_chunks_continue_offsets(self, tmp_path):
+        queue = LeaseQueue(tmp_path / "queue.db")
+        assert queue.add_lines(["a", "b", "c"], chunk_size=2) == 3
+        assert queue.add_lines(["d"], chunk_size=2) == 1
+
+        chunks = [queue.lease("n1") for _ in range(4)]
+        assert [(c.start, c.usernames) for c in chunks if c] == [
+            (0, ["a", "b"]),
+            (2, ["c"]),
+            (3, ["d"]),
+        ]
+        assert chunks[3] is None
+
+    def test_keyspace_chunks(self, tmp_path):
+        queue = LeaseQueue(tmp_path / "queue.db")
+        keyspace = Keyspace(2)
+        _ = queue.add_lines(["a"])
+        assert queue.add_keyspace(keyspace, 10, 20, chunk_size=4) == 10
+
+        chunks = [queue.lease("n1") for _ in range(5)]
+        assert [(c.start, len(c.usernames)) for c in chunks if c] == [
+            (0, 1),
+            (1, 4),
+            (5, 4),
+            (9, 2),
+        ]
+        leased = [name for c in chunks[1:] if c for name in c.usernames]
+        assert leased == list(keyspace.names(10, 20))
+
+    def test_complete_and_merge(self, tmp_path):
+        queue = LeaseQueue(tmp_path / "queue.db")
+        _ = queue.add_lines(["a", "b"])
+        chunk = queue.lease("n1")
+        assert chunk is not None
+        assert not queue.finished
+
+        results = [taken(o, n) for o, n in chunk.items()]
+        results[1].status = CheckStatus.AVAILABLE
+        assert queue.complete(chunk, "n1", results)
+        assert queue.finished
+        assert queue.available() == ["b"]
+        assert queue.status_counts()[CheckStatus.TAKEN] == 1
+
+    def test_expired_lease_moves_to_another_node(self, tmp_path):
+        path = tmp_path / "queue.db"
+        first, second = LeaseQueue(path), LeaseQueue(path)
+        _ = first.add_lines(["a"])
+
+        chunk = first.lease("n1", lease_time=-1.0)  # Already expired
+        assert chunk is not None
+        stolen = second.lease("n2")
+        assert stolen is not None and stolen.id == chunk.id
+
+        # The first node's late results are dropped
+        assert not first.renew(chunk, "n1")
+        assert not first.complete(chunk, "n1", [taken(0, "a")])
+        assert second.complete(stolen, "n2", [taken(0, "a")])
+        assert first.progress() == {"pending": 0, "leased": 0, "done": 1}
+
+    def test_release_returns_chunk(self, tmp_path):
+        queue = LeaseQueue(tmp_path / "queue.db")
+        _ = queue.add_lines(["a"])
+        chunk = queue.lease("n1")
+        assert chunk is not None
+        assert queue.lease("n2") is None
+
+        queue.release(chunk, "n1")
+        again = queue.lease("n2")
+        assert again is not None and again.id == chunk.id
+
+
+class TestNodes:
+    """Several local node processes sharing one queue."""
+
+    @pytest.mark.asyncio
+    async def test_nodes_split_the_work(self, tmp_path):
+        path = str(tmp_path / "queue.db")
+        queue = LeaseQueue(path)
+        names = [f"user{i}" for i in range(60)]
+        _ = queue.add_lines(names, chunk_size=5)
+
+        async with MockDiscordServer() as server:
+            config = bench_config(server, thread_count=4)
+            ctx = mp.get_context("spawn")
+            procs = [
+                ctx.Process(target=node_process, args=(path, config, f"n{i}"))
+                for i in range(2)
+            ]
+            for proc in procs:
+                proc.start()
+            while any(p.is_alive() for p in procs):
+                await asyncio.sleep(0.05)
+
+        assert all(p.exitcode == 0 for p in procs)
+        assert queue.finished
+        rows = queue.conn.execute("SELECT offset, username, worker FROM results")
+        merged = {offset: (name, worker) for offset, name, worker in rows}
+        assert sorted(merged) == list(range(60))
+        assert all(merged[i][0] == names[i] for i in range(60))
+        # Exactly one request per name across both nodes
+        assert server.requests == 60
@@ -0,0 +1,117 @@
+"""Tests for checkcord.core.errors and checkcord.core.breaker modules."""
+
+import pytest
+from curl_cffi.requests.exceptions import ConnectionError as CurlConnectionError
+from curl_cffi.requests.exceptions import ProxyError, ReadTimeout
+
+from checkcord.core.breaker import BreakerState, CircuitBreaker
+from checkcord.core.errors import ErrorKind, classify_exception, classify_response
+from checkcord.core.proxies import ProxyPool
+from checkcord.core.tokens import TokenPool
+from checkcord.models import TokenConfig
+
+JSON = {"Content-Type": "application/json"}
+HTML = {"Content-Type": "text/html; charset=UTF-8"}
+
+
+class TestClassify:
+    """Tests for classify_response and classify_exception."""
+
+    @pytest.mark.parametrize(
+        ("status", "headers", "kind"),
+        [
+            (200, JSON, None),
+            (429, JSON, None),
+            (401, JSON, ErrorKind.AUTH),
+            (403, JSON, ErrorKind.FORBIDDEN),
+            (403, HTML, ErrorKind.CLOUDFLARE),
+            (429, HTML, ErrorKind.CLOUDFLARE),
+            (503, {"cf-mitigated": "challenge"}, ErrorKind.CLOUDFLARE),
+            (502, JSON, ErrorKind.SERVER),
+            (400, JSON, ErrorKind.CLIENT),
+        ],
+    )
+    def test_responses(self, status, headers, kind):
+        assert classify_response(status, headers) is kind
+
+    @pytest.mark.parametrize(
+        ("error", "kind"),
+        [
+            (ProxyError("refused"), ErrorKind.PROXY),
+            (ReadTimeout("slow"), ErrorKind.TIMEOUT),
+            (TimeoutError(), ErrorKind.TIMEOUT),
+            (CurlConnectionError("reset"), ErrorKind.NETWORK),
+            (ValueError("bad json"), ErrorKind.UNKNOWN),
+        ],
+    )
+    def test_exceptions(self, error, kind):
+        assert classify_exception(error) is kind
+
+    def test_retry_and_blame(self):
+        assert ErrorKind.AUTH.fatal and ErrorKind.FORBIDDEN.fatal
+        assert not ErrorKind.TIMEOUT.fatal
+        assert not ErrorKind.CLIENT.retryable
+        assert ErrorKind.SERVER.retryable
+        assert not ErrorKind.SERVER.blames_connection
+        assert ErrorKind.CLOUDFLARE.blames_connection
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_threshold_then_probes(self):
+        breaker = CircuitBreaker(threshold=2, reset_timeout=10.0)
+        assert not breaker.record_failure(0.0, ErrorKind.TIMEOUT)
+        assert breaker.record_failure(0.0, ErrorKind.TIMEOUT)
+        assert breaker.state is BreakerState.OPEN
+        assert not breaker.ready(5.0)
+
+        assert breaker.ready(10.0)
+        breaker.begin(10.0)
+        assert breaker.state is BreakerState.HALF_OPEN
+        assert not breaker.ready(10.0)
+
+        breaker.record_success()
+        assert breaker.state is BreakerState.CLOSED
+
+    def test_failed_probe_doubles_cooldown(self):
+        breaker = CircuitBreaker(threshold=1, reset_timeout=10.0)
+        _ = breaker.record_failure(0.0)
+        breaker.begin(10.0)
+        assert breaker.record_failure(10.0)
+        assert breaker.retry_at == 30.0
+
+    def test_late_failures_do_not_extend_cooldown(self):
+        breaker = CircuitBreaker(threshold=1, reset_timeout=10.0)
+        _ = breaker.record_failure(0.0)
+        assert not breaker.record_failure(1.0)
+        assert breaker.retry_at == 10.0
+
+    def test_tripping_and_fatal_kinds(self):
+        breaker = CircuitBreaker(threshold=5)
+        assert breaker.record_failure(0.0, ErrorKind.CLOUDFLARE)
+        assert not breaker.dead
+
+        breaker = CircuitBreaker(threshold=5)
+        assert breaker.record_failure(0.0, ErrorKind.AUTH)
+        assert breaker.dead
+        assert not breaker.ready(1e9)
+
+
+class TestBreakerPools:
+    """Breakers wired into the token and proxy pools."""
+
+    @pytest.mark.asyncio
+    async def test_cloudflare_quarantines_proxy_at_once(self):
+        pool = ProxyPool(["http://a", "http://b"], max_failures=3)
+        proxy = await pool.acquire()
+        assert proxy is not None
+        pool.mark_failure(proxy, ErrorKind.CLOUDFLARE)
+        assert proxy.quarantined
+        assert pool.healthy == 1
+
+    def test_fatal_error_retires_token(self):
+        pool = TokenPool([TokenConfig(token="aaa"), TokenConfig(token="bbb")])
+        pool.mark_failure(pool.tokens[0], ErrorKind.FORBIDDEN, "HTTP 403")
+        assert pool.tokens[0].retired
+        assert [t.token for t in pool.active] == ["bbb"]
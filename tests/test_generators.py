@@ -8,6 +8,7 @@ from checkcord.core.generator import (
     PatternGenerator,
     RandomCharGenerator,
 )
+from checkcord.core.validator import is_valid
 
 
 class TestRandomCharGenerator:
@@ -31,16 +32,69 @@ class TestRandomCharGenerator:
     async def test_no_invalid_patterns(self):
         gen = RandomCharGenerator(length=4)
         usernames = await gen.generate(20)
-        for name in usernames:
-            assert ".." not in name
-            assert "__" not in name
-            assert not name.startswith(".")
-            assert not name.endswith(".")
+        assert all(is_valid(name) for name in usernames)
 
     def test_generator_name(self):
         gen = RandomCharGenerator(length=4)
         assert gen.name == "Random Characters"
 
+    @pytest.mark.asyncio
+    async def test_exhausts_keyspace_without_repeats(self):
+        gen = RandomCharGenerator(length=2, seed=1)
+        usernames = await gen.generate(gen.keyspace.size + 10)
+        assert sorted(usernames) == sorted(gen.sweep())
+        assert gen.position == gen.keyspace.size
+
+    @pytest.mark.asyncio
+    async def test_resume_from_seed_and_position(self):
+        whole = await RandomCharGenerator(length=3, seed=9).generate(40)
+
+        first = RandomCharGenerator(length=3, seed=9)
+        head = await first.generate(15)
+        rest = RandomCharGenerator(length=3, seed=9, position=first.position)
+        assert head + await rest.generate(25) == whole
+
+    @pytest.mark.asyncio
+    async def test_shuffled_order(self):
+        gen = RandomCharGenerator(length=3, seed=5)
+        usernames = await gen.generate(50)
+        assert usernames != sorted(usernames)
+
+    def test_sweep_covers_every_valid_name(self):
+        gen = RandomCharGenerator(length=2)
+        names = list(gen.sweep())
+        assert len(names) == len(set(names)) == gen.keyspace.size
+        assert all(is_valid(name) for name in names)
+
+    def test_sweep_skips_reserved_names(self):
+        gen = RandomCharGenerator(length=4)
+        start = gen.keyspace.index("here")
+        assert list(gen.sweep(start, start + 2)) == [gen.keyspace.name(start + 1)]
+
+
+class TestStream:
+    """Tests for GeneratorStrategy.stream."""
+
+    @pytest.mark.asyncio
+    async def test_names_are_made_as_they_are_pulled(self):
+        gen = RandomCharGenerator(length=4, seed=3)
+        stream = gen.stream()
+        first = await anext(stream)
+        assert gen.position < 100
+        await stream.aclose()
+        assert first == (await RandomCharGenerator(length=4, seed=3).generate(1))[0]
+
+    @pytest.mark.asyncio
+    async def test_unbounded_stream_ends_with_the_keyspace(self):
+        gen = DictionaryGenerator(add_numbers=False)
+        usernames = [name async for name in gen.stream()]
+        assert len(usernames) == len(set(usernames)) == gen.size
+
+    @pytest.mark.asyncio
+    async def test_stream_matches_generate(self):
+        streamed = [n async for n in LeetGenerator("test", seed=2).stream(8)]
+        assert streamed == await LeetGenerator("test", seed=2).generate(8)
+
 
 class TestPatternGenerator:
     """Tests for PatternGenerator."""
@@ -59,6 +113,11 @@ class TestPatternGenerator:
         usernames = await gen.generate(10)
         assert len(usernames) == len(set(usernames))
 
+    @pytest.mark.asyncio
+    async def test_pattern_without_placeholder(self):
+        gen = PatternGenerator(pattern="fixed")
+        assert await gen.generate(3) == ["fixed"]
+
     def test_generator_name(self):
         gen = PatternGenerator(pattern="x_{random}")
         assert gen.name == "Pattern Based"
@@ -84,6 +143,12 @@ class TestDictionaryGenerator:
         has_numbers = sum(1 for n in usernames if any(c.isdigit() for c in n))
         assert has_numbers >= 0  # May not always have numbers
 
+    @pytest.mark.asyncio
+    async def test_every_combination_once(self):
+        gen = DictionaryGenerator(add_numbers=False)
+        usernames = await gen.generate(gen.size + 1)
+        assert len(usernames) == len(set(usernames)) == gen.size
+
     def test_generator_name(self):
         gen = DictionaryGenerator()
         assert gen.name == "Dictionary (Adjective + Noun)"
@@ -105,6 +170,21 @@ class TestLeetGenerator:
         # Should have some variation
         assert len(set(usernames)) >= 1
 
+    @pytest.mark.asyncio
+    async def test_only_valid_substitutes(self):
+        gen = LeetGenerator(base_word="assassin")
+        usernames = await gen.generate(20)
+        assert usernames
+        assert all(is_valid(name) for name in usernames)
+
+    @pytest.mark.asyncio
+    async def test_every_variation_once(self):
+        gen = LeetGenerator(base_word="test")
+        usernames = await gen.generate(100)
+        assert len(usernames) == len(set(usernames)) == gen.size == 16
+        assert "test" in usernames
+        assert "7357" in usernames
+
     def test_generator_name(self):
         gen = LeetGenerator(base_word="viper")
         assert gen.name == "Leet Speak (viper)"
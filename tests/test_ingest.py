@@ -0,0 +1,69 @@
+"""Tests for checkcord.core.ingest module."""
+
+import gzip
+
+import pytest
+
+from checkcord.core.ingest import CompactHashSet, UsernameSource, normalize
+
+
+class TestNormalize:
+    """Tests for normalize."""
+
+    def test_strips_and_lowercases(self):
+        assert normalize("  CoolName\r\n") == "coolname"
+        assert normalize("\n") == ""
+
+
+class TestCompactHashSet:
+    """Tests for CompactHashSet."""
+
+    def test_add_and_contains(self):
+        seen = CompactHashSet()
+        assert seen.add("a")
+        assert not seen.add("a")
+        assert "a" in seen
+        assert "b" not in seen
+        assert len(seen) == 1
+
+    def test_grows_past_initial_capacity(self):
+        seen = CompactHashSet(capacity=4)
+        names = [f"user{i}" for i in range(5000)]
+        assert all(seen.add(n) for n in names)
+        assert len(seen) == 5000
+        assert all(n in seen for n in names)
+        assert "user5000" not in seen
+
+
+class TestUsernameSource:
+    """Tests for UsernameSource."""
+
+    def test_normalizes_and_dedupes(self, tmp_path):
+        path = tmp_path / "names.txt"
+        _ = path.write_text("Alpha\nbeta\n\n  ALPHA \ngamma\nbeta")
+
+        source = UsernameSource(path)
+        assert list(source) == ["alpha", "beta", "gamma"]
+        assert source.lines == 6
+        assert source.blank == 1
+        assert source.duplicates == 2
+
+    def test_keeps_duplicates_when_asked(self, tmp_path):
+        path = tmp_path / "names.txt"
+        _ = path.write_text("a\na\n")
+        assert list(UsernameSource(path, dedupe=False)) == ["a", "a"]
+
+    def test_reads_gzip(self, tmp_path):
+        path = tmp_path / "names.txt.gz"
+        with gzip.open(path, "wt") as f:
+            _ = f.write("one\ntwo\none\n")
+        assert list(UsernameSource(path)) == ["one", "two"]
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.txt"
+        path.touch()
+        assert list(UsernameSource(path)) == []
+
+    def test_missing_file_fails_early(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            _ = UsernameSource(tmp_path / "missing.txt")
@@ -0,0 +1,115 @@
+"""Tests for checkcord.core.journal module."""
+
+import pytest
+
+from checkcord.core.journal import Journal, JournalMismatchError, file_digest
+from checkcord.models import CheckResult, CheckStatus
+
+
+def result(offset: int, status: CheckStatus = CheckStatus.TAKEN) -> CheckResult:
+    return CheckResult(username=f"user{offset}", status=status, offset=offset)
+
+
+class TestJournal:
+    """Tests for Journal."""
+
+    def test_watermark_advances_over_contiguous_offsets(self, tmp_path):
+        journal = Journal(tmp_path / "run.journal")
+        for offset in (2, 0, 4):
+            journal.record(result(offset))
+        assert journal.watermark == 1
+        assert journal.end == 5
+
+        journal.record(result(1))
+        assert journal.watermark == 3
+        assert 2 in journal and 4 in journal
+        assert 3 not in journal
+
+    def test_resume_skips_settled_offsets(self, tmp_path):
+        path = tmp_path / "run.journal"
+        journal = Journal(path)
+        for offset in (0, 1, 3):
+            journal.record(result(offset))
+        journal.record(result(5, CheckStatus.AVAILABLE))
+        journal.close()
+
+        resumed = Journal(path, resume=True)
+        assert [o for o in range(7) if o not in resumed] == [2, 4, 6]
+        assert resumed.completed == 4
+        assert resumed.counts[CheckStatus.AVAILABLE] == 1
+        assert list(resumed.usernames()) == ["user0", "user1", "user3", "user5"]
+
+    def test_inconclusive_results_are_rechecked(self, tmp_path):
+        path = tmp_path / "run.journal"
+        journal = Journal(path)
+        journal.record(result(0, CheckStatus.ERROR))
+        journal.record(result(1, CheckStatus.RATE_LIMITED))
+        journal.close()
+
+        resumed = Journal(path, resume=True)
+        assert 0 not in resumed and 1 not in resumed
+        assert resumed.completed == 0
+
+        resumed.record(result(0))
+        assert 0 in resumed
+        resumed.close()
+
+        assert 0 in Journal(path, resume=True)
+
+    def test_torn_line_is_redone(self, tmp_path):
+        path = tmp_path / "run.journal"
+        _ = path.write_text("0\tTAKEN\tuser0\n1\tTAK")
+
+        resumed = Journal(path, resume=True)
+        assert 0 in resumed
+        assert 1 not in resumed
+
+    def test_fresh_run_truncates(self, tmp_path):
+        path = tmp_path / "run.journal"
+        _ = path.write_text("0\tTAKEN\tuser0\n")
+
+        journal = Journal(path)
+        assert 0 not in journal
+        journal.close()
+        assert path.read_text() == ""
+
+    def test_settled_needs_the_same_name(self, tmp_path):
+        path = tmp_path / "run.journal"
+        journal = Journal(path)
+        journal.record(result(0))
+        journal.close()
+
+        resumed = Journal(path, resume=True)
+        assert resumed.settled(0, "user0")
+        assert not resumed.settled(0, "other")
+        assert not resumed.settled(1, "user1")
+
+    def test_run_is_recorded_and_checked(self, tmp_path):
+        path = tmp_path / "run.journal"
+        journal = Journal(path, run="generate length=3 seed=1")
+        journal.record(result(0))
+        journal.close()
+
+        with pytest.raises(JournalMismatchError):
+            _ = Journal(path, resume=True, run="generate length=3 sweep")
+        assert path.read_text().startswith("#run\tgenerate length=3 seed=1\n")
+
+        resumed = Journal(path, resume=True, run="generate length=3 seed=1")
+        assert resumed.settled(0, "user0")
+        assert resumed.completed == 1
+        resumed.record(result(1))
+        resumed.close()
+        assert path.read_text().count("#run") == 1
+
+    def test_file_digest_tells_inputs_apart(self, tmp_path):
+        first, second = tmp_path / "a.txt", tmp_path / "b.txt"
+        _ = first.write_text("alpha\nbeta\n")
+        _ = second.write_text("alpha\ngamma\n")
+        assert file_digest(first) != file_digest(second)
+        assert file_digest(first) == file_digest(first)
+
+    def test_results_without_offset_are_ignored(self, tmp_path):
+        journal = Journal(tmp_path / "run.journal")
+        journal.record(CheckResult(username="x", status=CheckStatus.TAKEN))
+        assert journal.end == 0
+        assert journal.completed == 0
@@ -0,0 +1,74 @@
+"""Tests for checkcord.core.keyspace module."""
+
+from itertools import pairwise, product
+
+import pytest
+
+from checkcord.core.keyspace import ALPHABET, Keyspace
+from checkcord.core.validator import is_valid
+
+
+def brute_force(length: int, alphabet: str = ALPHABET) -> list[str]:
+    """Every name the placement rules allow, in alphabet order."""
+    names = ("".join(chars) for chars in product(alphabet, repeat=length))
+    return [name for name in names if ".." not in name]
+
+
+class TestKeyspace:
+    """Tests for Keyspace."""
+
+    @pytest.mark.parametrize("length", [1, 2, 3])
+    def test_matches_brute_force(self, length):
+        keyspace = Keyspace(length)
+        expected = brute_force(length)
+        assert keyspace.size == len(expected)
+        assert list(keyspace.names()) == expected
+
+    @pytest.mark.parametrize("length", [2, 3])
+    def test_matches_the_validator(self, length):
+        names = ("".join(chars) for chars in product(ALPHABET, repeat=length))
+        assert Keyspace(length).size == sum(map(is_valid, names))
+
+    def test_index_inverts_name(self):
+        keyspace = Keyspace(4)
+        for index in (0, 1, 27, 12345, keyspace.size - 1):
+            assert keyspace.index(keyspace.name(index)) == index
+
+    def test_custom_alphabet(self):
+        keyspace = Keyspace(3, "ab0_.")
+        assert list(keyspace.names()) == brute_force(3, "ab0_.")
+
+    def test_large_keyspace_is_not_listed(self):
+        keyspace = Keyspace(32)
+        assert keyspace.size > 2**64
+        name = keyspace.name(keyspace.size // 2)
+        assert keyspace.index(name) == keyspace.size // 2
+
+    def test_out_of_range(self):
+        keyspace = Keyspace(2)
+        with pytest.raises(IndexError):
+            _ = keyspace.name(keyspace.size)
+        with pytest.raises(ValueError):
+            _ = keyspace.index("..")
+        with pytest.raises(ValueError):
+            _ = keyspace.index("abc")
+
+    def test_ranges_cover_the_keyspace(self):
+        keyspace = Keyspace(3)
+        ranges = keyspace.ranges(7)
+        assert len(ranges) == 7
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == keyspace.size
+        assert all(a[1] == b[0] for a, b in pairwise(ranges))
+
+        swept = [name for lo, hi in ranges for name in keyspace.names(lo, hi)]
+        assert swept == list(keyspace.names())
+
+    def test_resume_from_index(self):
+        keyspace = Keyspace(3)
+        assert list(keyspace.names(100, 105)) == list(keyspace.names())[100:105]
+
+    def test_spec_roundtrip(self):
+        keyspace = Keyspace(5, "xyz_")
+        again = Keyspace.from_spec(keyspace.spec)
+        assert (again.length, again.alphabet, again.size) == (5, "xyz_", keyspace.size)
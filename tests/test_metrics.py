@@ -0,0 +1,129 @@
+"""Tests for checkcord.core.metrics module."""
+
+import json
+import pickle
+
+import pytest
+from curl_cffi.requests import AsyncSession
+
+from checkcord.bench.loadtest import bench_config
+from checkcord.bench.mock_server import MockDiscordServer, MockOptions
+from checkcord.core.checker import DiscordChecker
+from checkcord.core.metrics import MetricsRegistry, exporting, serve_metrics
+from checkcord.core.shards import ShardedChecker
+
+
+class TestRegistry:
+    """Tests for MetricsRegistry and its families."""
+
+    def test_prometheus_text(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests", ["outcome"])
+        requests.inc("taken")
+        requests.inc("taken")
+        requests.inc('odd "one"')
+        latency = registry.histogram("latency_seconds", "Latency", buckets=[0.1, 1])
+        latency.observe(0.05)
+        latency.observe(0.5)
+        latency.observe(5.0)
+
+        text = registry.render()
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{outcome="taken"} 2' in text
+        assert r'requests_total{outcome="odd \"one\""} 1' in text
+        # Buckets are cumulative and end with +Inf
+        assert 'latency_seconds_bucket{le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{le="1"} 2' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+        assert "latency_seconds_count 3" in text
+        assert "latency_seconds_sum 5.55" in text
+
+    def test_label_count_is_checked(self):
+        registry = MetricsRegistry()
+        errors = registry.counter("errors_total", "Errors", ["kind"])
+        with pytest.raises(ValueError):
+            errors.inc()
+        with pytest.raises(ValueError):
+            _ = registry.gauge("errors_total", "Duplicate")
+
+    def test_hooks_refresh_mirrored_values(self):
+        registry = MetricsRegistry()
+        depth = registry.gauge("depth", "Depth")
+        queue = [1, 2, 3]
+        registry.on_collect(lambda: depth.set(len(queue)))
+        assert registry.snapshot()["depth"]["samples"] == [{"labels": {}, "value": 3}]
+
+    def test_children_are_summed(self):
+        def worker(n: int) -> list:
+            registry = MetricsRegistry()
+            registry.counter("hits_total", "Hits").inc(amount=n)
+            registry.histogram("lag_seconds", "Lag").observe(n)
+            # Families cross the process boundary pickled
+            return pickle.loads(pickle.dumps(registry.collect()))
+
+        parent = MetricsRegistry()
+        parent.children[0] = worker(2)
+        parent.children[1] = worker(3)
+        merged = {m.name: m for m in parent.collect()}
+        assert merged["hits_total"].get() == 5
+        assert merged["lag_seconds"].count() == 2
+        # Collecting never mutates what the workers reported
+        assert parent.children[0][0].get() == 2
+
+    @pytest.mark.asyncio
+    async def test_http_endpoint_and_snapshot(self, tmp_path):
+        registry = MetricsRegistry()
+        registry.counter("hits_total", "Hits").inc()
+        server = await serve_metrics(registry, 0)
+        port = server.sockets[0].getsockname()[1]
+        snapshot = tmp_path / "metrics.json"
+
+        async with exporting(registry, snapshot_path=snapshot):
+            async with AsyncSession() as session:
+                base = f"http://127.0.0.1:{port}"
+                text = await session.get(f"{base}/metrics")  # type: ignore
+                missing = await session.get(f"{base}/other")  # type: ignore
+            registry.counter("late_total", "Late").inc()
+        server.close()
+        await server.wait_closed()
+
+        assert text.status_code == 200
+        assert "hits_total 1" in text.text
+        assert missing.status_code == 404
+        data = json.loads(snapshot.read_text())
+        assert data["late_total"]["samples"][0]["value"] == 1
+
+
+class TestCheckerMetrics:
+    """The checker's instrumentation against the mock server."""
+
+    @pytest.mark.asyncio
+    async def test_requests_and_latency(self):
+        options = MockOptions(bucket_limit=5, bucket_window=0.2)
+        async with MockDiscordServer(options) as server:
+            checker = DiscordChecker(bench_config(server, thread_count=4))
+            results = await checker.process_usernames([f"u{i}" for i in range(30)])
+
+        families = {m.name: m for m in checker.metrics.collect()}
+        requests = families["checkcord_requests_total"]
+        assert sum(requests.values.values()) == server.requests
+        assert requests.get("rate_limited") == server.statuses[429]
+        assert sum(families["checkcord_results_total"].values.values()) == 30
+        label = checker.token_pool.tokens[0].label
+        latency = families["checkcord_token_latency_seconds"]
+        assert latency.count(label) == server.requests
+        assert families["checkcord_retries_total"].get() == sum(
+            r.attempts - 1 for r in results
+        )
+        assert families["checkcord_in_flight"].get() == 0
+        assert families["checkcord_tokens_active"].get() == 1
+
+    @pytest.mark.asyncio
+    async def test_workers_report_to_parent(self):
+        async with MockDiscordServer() as server:
+            config = bench_config(server, tokens=["t2"], thread_count=4)
+            checker = ShardedChecker(config, workers=2)
+            _ = [r async for r in checker.stream_usernames(["a1", "b2", "c3"])]
+
+        families = {m.name: m for m in checker.metrics.collect()}
+        assert sum(families["checkcord_requests_total"].values.values()) == 3
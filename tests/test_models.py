@@ -1,9 +1,12 @@
 """Tests for checkcord.models module."""
 
+from checkcord.core.errors import ErrorKind
 from checkcord.models import (
     AppConfig,
+    CheckRecord,
     CheckResult,
     CheckStatus,
+    TokenConfig,
     WebhookEmbed,
     WebhookEmbedFooter,
     WebhookPayload,
@@ -43,6 +46,39 @@ class TestCheckResult:
         result = CheckResult(username="test", status=CheckStatus.TAKEN)
         assert result.message is None
 
+    def test_from_record(self):
+        record = CheckRecord(
+            username="test",
+            status=CheckStatus.ERROR,
+            offset=3,
+            attempts=2,
+            error=ErrorKind.TIMEOUT,
+        )
+        result = CheckResult.from_record(record)
+        assert result.model_dump() == {
+            "username": "test",
+            "status": CheckStatus.ERROR,
+            "message": None,
+            "latency": None,
+            "offset": 3,
+            "attempts": 2,
+            "error": ErrorKind.TIMEOUT,
+            "proxy": None,
+        }
+
+
+class TestCheckRecord:
+    """Tests for CheckRecord."""
+
+    def test_defaults_match_the_model(self):
+        record = CheckRecord(username="test", status=CheckStatus.TAKEN)
+        model = CheckResult(username="test", status=CheckStatus.TAKEN)
+        assert CheckResult.from_record(record) == model
+
+    def test_no_instance_dict(self):
+        record = CheckRecord(username="test", status=CheckStatus.TAKEN)
+        assert not hasattr(record, "__dict__")
+
 
 class TestAppConfig:
     """Tests for AppConfig model."""
@@ -63,6 +99,27 @@ class TestAppConfig:
         assert config.thread_count == 10
         assert config.retry_delay == 5.0
 
+    def test_request_interval(self):
+        assert (
+            AppConfig(token="t", thread_count=4, retry_delay=2.0).request_interval()
+            == 0.5
+        )
+        assert AppConfig(token="t", requests_per_second=10).request_interval() == 0.1
+
+    def test_tokens_accept_strings(self):
+        config = AppConfig(
+            token="main",
+            tokens=["extra", {"token": "pinned", "proxies": ["http://p"]}, "main"],
+        )
+        assert config.accounts() == [
+            TokenConfig(token="main"),
+            TokenConfig(token="extra"),
+            TokenConfig(token="pinned", proxies=["http://p"]),
+        ]
+
+    def test_placeholder_token_is_not_an_account(self):
+        assert AppConfig(token="YOUR_TOKEN_HERE").accounts() == []
+
 
 class TestWebhookModels:
     """Tests for webhook-related models."""
@@ -0,0 +1,37 @@
+"""Tests for checkcord.core.permutation module."""
+
+import pytest
+
+from checkcord.core.permutation import Permutation
+
+
+class TestPermutation:
+    """Tests for Permutation."""
+
+    @pytest.mark.parametrize("size", [1, 2, 3, 17, 1000, 4097])
+    def test_is_a_permutation(self, size):
+        assert sorted(Permutation(size, seed=42).values()) == list(range(size))
+
+    def test_same_seed_same_order(self):
+        first = list(Permutation(500, seed=7).values())
+        assert list(Permutation(500, seed=7).values()) == first
+        assert list(Permutation(500, seed=8).values()) != first
+        assert first != sorted(first)
+
+    def test_resume_from_position(self):
+        order = Permutation(300, seed=3)
+        assert list(order.values(120)) == list(order.values())[120:]
+        assert order[120] == list(order.values())[120]
+
+    def test_huge_domain(self):
+        size = 2**150 + 12345
+        order = Permutation(size, seed=1)
+        values = [order[position] for position in range(50)]
+        assert len(set(values)) == 50
+        assert all(0 <= value < size for value in values)
+
+    def test_out_of_range(self):
+        with pytest.raises(IndexError):
+            _ = Permutation(10, seed=0)[10]
+        with pytest.raises(ValueError):
+            _ = Permutation(0, seed=0)
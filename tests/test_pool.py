@@ -0,0 +1,109 @@
+"""Tests for checkcord.core.pool module."""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+
+import pytest
+
+from checkcord.core.pool import WorkerPool, numbered
+from checkcord.core.retry import RetryScheduler
+
+
+async def double(x: int) -> int:
+    await asyncio.sleep(0)
+    return x * 2
+
+
+class TestWorkerPool:
+    """Tests for WorkerPool."""
+
+    @pytest.mark.asyncio
+    async def test_all_results_yielded(self):
+        pool: WorkerPool[int, int] = WorkerPool(double, workers=4)
+        results = [r async for r in pool.imap_unordered(range(100))]
+        assert sorted(results) == [x * 2 for x in range(100)]
+
+    @pytest.mark.asyncio
+    async def test_async_iterable_input(self):
+        async def source() -> AsyncIterator[int]:
+            for i in range(10):
+                yield i
+
+        pool: WorkerPool[int, int] = WorkerPool(double, workers=3)
+        results = [r async for r in pool.imap_unordered(source())]
+        assert sorted(results) == [x * 2 for x in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_input_consumed_lazily(self):
+        pulled = 0
+
+        def source() -> Iterator[int]:
+            nonlocal pulled
+            for i in range(1_000_000):
+                pulled += 1
+                yield i
+
+        pool: WorkerPool[int, int] = WorkerPool(double, workers=2, queue_size=4)
+        async for _ in pool.imap_unordered(source()):
+            break
+        # Only the workers plus the bounded queues may run ahead of the consumer
+        assert pulled < 20
+
+    @pytest.mark.asyncio
+    async def test_shortcut_results_skip_the_workers(self):
+        handled: list[int] = []
+
+        async def handler(x: int) -> int:
+            handled.append(x)
+            return x * 2
+
+        async def odd_negated(x: int) -> int | None:
+            return -x if x % 2 else None
+
+        pool: WorkerPool[int, int] = WorkerPool(handler, workers=2)
+        results = [r async for r in pool.imap_unordered(range(10), None, odd_negated)]
+        assert sorted(results) == sorted([0, 4, 8, 12, 16, -1, -3, -5, -7, -9])
+        assert sorted(handled) == [0, 2, 4, 6, 8]
+
+    @pytest.mark.asyncio
+    async def test_retries_go_out_while_input_is_idle(self):
+        retried = asyncio.Event()
+
+        async def source() -> AsyncIterator[int]:
+            yield 1
+            # Like a worker's inbox: nothing more until the retry has finished
+            _ = await retried.wait()
+
+        retries: RetryScheduler[int] = RetryScheduler(base_delay=0.0)
+        pool: WorkerPool[int, int] = WorkerPool(double, workers=2)
+        results: list[int] = []
+
+        async def consume():
+            async for result in pool.imap_unordered(source(), retries):
+                results.append(result)
+                if len(results) == 1:
+                    _ = retries.schedule(1, attempt=1)
+                else:
+                    retried.set()
+
+        await asyncio.wait_for(consume(), 5)
+        assert results == [2, 2]
+
+    @pytest.mark.asyncio
+    async def test_handler_error_propagates(self):
+        async def boom(x: int) -> int:
+            raise ValueError(f"bad {x}")
+
+        pool: WorkerPool[int, int] = WorkerPool(boom, workers=2)
+        with pytest.raises(ValueError):
+            async for _ in pool.imap_unordered([1, 2, 3]):
+                pass
+
+
+class TestNumbered:
+    """Tests for numbered."""
+
+    @pytest.mark.asyncio
+    async def test_offsets_and_skip(self):
+        pairs = [p async for p in numbered("abcde", start=10, skip={11, 13})]
+        assert pairs == [(10, "a"), (12, "c"), (14, "e")]
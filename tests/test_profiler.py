@@ -0,0 +1,117 @@
+"""Tests for checkcord.core.profiler module."""
+
+import asyncio
+import json
+import pstats
+
+import pytest
+
+from checkcord.bench.loadtest import bench_config
+from checkcord.bench.mock_server import MockDiscordServer
+from checkcord.cli import runner
+from checkcord.core.checker import DiscordChecker
+from checkcord.core.profiler import NullProfiler, PhaseProfiler, PhaseStats
+
+
+def balanced(profile: dict) -> bool:
+    """Events are in time order and every close matches the latest open."""
+    stack: list[int] = []
+    last = 0.0
+    for event in profile["events"]:
+        if event["at"] < last:
+            return False
+        last = event["at"]
+        if event["type"] == "O":
+            stack.append(event["frame"])
+        elif not stack or stack.pop() != event["frame"]:
+            return False
+    return not stack
+
+
+class TestPhaseProfiler:
+    """Tests for PhaseProfiler."""
+
+    def test_null_profiler_is_a_noop(self):
+        profiler = NullProfiler()
+        with profiler.phase("anything"):
+            pass
+        assert not profiler.enabled
+
+    def test_totals_per_phase(self):
+        profiler = PhaseProfiler()
+        profiler.record("request", 1.0, 1.5)
+        profiler.record("request", 2.0, 2.1)
+        with profiler.phase("parse"):
+            pass
+
+        stats = profiler.phases["request"]
+        assert stats.calls == 2
+        assert stats.total == pytest.approx(0.6)
+        assert stats.max == pytest.approx(0.5)
+        assert stats.mean == pytest.approx(0.3)
+        assert profiler.phases["parse"].calls == 1
+
+        profiler.merge({"request": PhaseStats(1, 2.0, 2.0)})
+        assert profiler.phases["request"].calls == 3
+        assert profiler.phases["request"].max == 2.0
+
+    @pytest.mark.asyncio
+    async def test_speedscope_lanes_per_task(self):
+        profiler = PhaseProfiler(trace=True)
+
+        async def check(name: str):
+            with profiler.phase("check"):
+                with profiler.phase("limiter"):
+                    await asyncio.sleep(0.01)
+                with profiler.phase("request"):
+                    await asyncio.sleep(0.02)
+
+        _ = await asyncio.gather(
+            asyncio.create_task(check("a"), name="worker-a"),
+            asyncio.create_task(check("b"), name="worker-b"),
+        )
+        trace = profiler.speedscope()
+
+        frames = [f["name"] for f in trace["shared"]["frames"]]
+        assert sorted(frames) == ["check", "limiter", "request"]
+        assert sorted(p["name"] for p in trace["profiles"]) == ["worker-a", "worker-b"]
+        # The overlapping tasks still give each lane well nested events
+        assert all(balanced(p) for p in trace["profiles"])
+
+
+class TestProfiledRun:
+    """run_checks with --profile against the mock server."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("suffix", [".json", ".prof"])
+    async def test_profile_output(self, tmp_path, monkeypatch, suffix):
+        checkers: list[DiscordChecker] = []
+
+        class Recording(DiscordChecker):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                checkers.append(self)
+
+        monkeypatch.setattr(runner, "DiscordChecker", Recording)
+        monkeypatch.setattr(runner.console, "quiet", True)
+        path = tmp_path / f"run{suffix}"
+
+        async with MockDiscordServer() as server:
+            await runner.run_checks(
+                [f"u{i}" for i in range(20)],
+                bench_config(server, thread_count=4),
+                output_file=None,
+                profile_output=path,
+            )
+
+        profiler = checkers[0].profiler
+        assert isinstance(profiler, PhaseProfiler)
+        for phase in ("check", "limiter", "slot", "request", "parse", "render"):
+            assert phase in profiler.phases
+        assert profiler.phases["request"].calls == 20
+
+        if suffix == ".json":
+            trace = json.loads(path.read_text())
+            assert all(balanced(p) for p in trace["profiles"])
+        else:
+            assert pstats.Stats(str(path)).total_calls > 0
@@ -0,0 +1,177 @@
+"""Tests for checkcord.core.ratelimiter module."""
+
+import asyncio
+
+import pytest
+
+from checkcord.core.ratelimiter import (
+    MAX_BACKOFF_FACTOR,
+    GlobalRateLimiter,
+    RateLimitInfo,
+)
+
+
+async def grant_times(limiter: GlobalRateLimiter, n: int) -> list[float]:
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    times: list[float] = []
+
+    async def take():
+        await limiter.wait_for_token()
+        times.append(loop.time() - start)
+
+    _ = await asyncio.gather(*(take() for _ in range(n)))
+    return sorted(times)
+
+
+class FakeClockLimiter(GlobalRateLimiter):
+    """Reads `now` instead of the loop's clock, so schedules can be checked exactly."""
+
+    now: float = 100.0
+
+    def _now(self) -> float:
+        return self.now
+
+    def slots(self, n: int) -> list[float]:
+        """Reserve `n` requests at `now`, returning when each may go out."""
+        return [self.now + self._reserve(self.now) for _ in range(n)]
+
+
+class TestGlobalRateLimiter:
+    """Tests for GlobalRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_requests_are_spaced(self):
+        limiter = GlobalRateLimiter(initial_delay=0.02)
+        times = await grant_times(limiter, 5)
+        assert times[-1] >= 0.07
+
+    @pytest.mark.asyncio
+    async def test_burst_goes_out_immediately(self):
+        limiter = GlobalRateLimiter(initial_delay=0.5, burst=4)
+        times = await grant_times(limiter, 4)
+        assert times[-1] < 0.1
+
+    def test_rate(self):
+        assert GlobalRateLimiter(initial_delay=0.25).rate == 4.0
+        assert GlobalRateLimiter(initial_delay=0.0).rate == float("inf")
+
+    @pytest.mark.asyncio
+    async def test_backoff_releases_waiters_staggered(self):
+        limiter = FakeClockLimiter(initial_delay=0.0, burst=10)
+        await limiter.trigger_backoff(0.05)
+        assert limiter.is_paused
+        delay = limiter.current_delay
+        assert delay > 0
+
+        # Waiters leave one interval apart on a fixed schedule from the resume
+        # (the interval has begun, barely, to recover by then)
+        resume = limiter.paused_until
+        limiter.now = resume
+        expected = [resume + i * delay for i in range(4)]
+        assert limiter.slots(4) == pytest.approx(expected, abs=0.005)
+        await asyncio.sleep(0.06)
+        assert not limiter.is_paused
+
+    @pytest.mark.asyncio
+    async def test_backoff_starts_from_the_request_rate(self):
+        limiter = FakeClockLimiter(initial_delay=0.0, recovery_after=30.0)
+        for _ in range(200):
+            limiter.now += 0.001
+            _ = limiter.slots(1)
+        await limiter.trigger_backoff(0.0)
+        # A third slower than the 1000/s it was doing, not a fixed 10/s
+        assert limiter.current_delay == pytest.approx(0.0015, rel=0.05)
+
+    @pytest.mark.asyncio
+    async def test_backoff_is_capped(self):
+        limiter = FakeClockLimiter(initial_delay=0.01, recovery_after=30.0)
+        for _ in range(50):
+            await limiter.trigger_backoff(0.0)
+            await asyncio.sleep(0)  # Let the pause end before the next 429
+        assert limiter.current_delay == pytest.approx(0.01 * MAX_BACKOFF_FACTOR)
+
+    @pytest.mark.asyncio
+    async def test_delay_recovers_in_proportion_to_quiet_time(self):
+        limiter = FakeClockLimiter(initial_delay=0.01, recovery_after=10.0)
+        await limiter.trigger_backoff(0.0)
+        await asyncio.sleep(0)
+        await limiter.trigger_backoff(0.0)
+        assert limiter.current_delay == pytest.approx(0.0225)
+
+        limiter.now += 5.0
+        _ = limiter.slots(1)
+        assert limiter.current_delay == pytest.approx(0.0225 / 1.5**0.5)
+        limiter.now += 15.0
+        _ = limiter.slots(1)
+        assert limiter.current_delay == 0.01
+
+    @pytest.mark.asyncio
+    async def test_unthrottled_recovers_completely(self):
+        limiter = FakeClockLimiter(initial_delay=0.0, recovery_after=1.0)
+        await limiter.trigger_backoff(0.0)
+        assert limiter.current_delay > 0
+        limiter.now += 1.5
+        _ = limiter.slots(1)
+        assert limiter.current_delay == 0.0
+
+
+def headers(remaining: int, reset_after: float, **extra: str) -> dict[str, str]:
+    return {
+        "X-RateLimit-Bucket": "pomelo",
+        "X-RateLimit-Limit": "5",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset-After": str(reset_after),
+        **extra,
+    }
+
+
+class TestRateLimitHeaders:
+    """Tests for X-RateLimit-* header tracking."""
+
+    def test_parse_headers(self):
+        info = RateLimitInfo.from_headers(
+            headers(3, 1.5, **{"X-RateLimit-Global": "true"})
+        )
+        assert info is not None
+        assert info.bucket == "pomelo"
+        assert info.limit == 5
+        assert info.remaining == 3
+        assert info.reset_after == 1.5
+        assert info.is_global
+
+    def test_no_headers(self):
+        assert RateLimitInfo.from_headers({"Content-Type": "application/json"}) is None
+
+    @pytest.mark.asyncio
+    async def test_tracks_budget(self):
+        limiter = GlobalRateLimiter(initial_delay=0.0)
+        assert limiter.budget() is None
+        _ = limiter.update_from_headers(headers(3, 10.0))
+        assert limiter.budget() == 3
+        # A stale response from earlier in the window cannot raise the budget
+        _ = limiter.update_from_headers(headers(4, 9.9))
+        assert limiter.budget() == 3
+
+    @pytest.mark.asyncio
+    async def test_waits_for_reset_when_exhausted(self):
+        limiter = GlobalRateLimiter(initial_delay=0.0)
+        _ = limiter.update_from_headers(headers(0, 0.05))
+        times = await grant_times(limiter, 1)
+        assert times[0] >= 0.04
+
+    @pytest.mark.asyncio
+    async def test_spreads_remaining_budget(self):
+        limiter = GlobalRateLimiter(initial_delay=0.0)
+        _ = limiter.update_from_headers(headers(3, 0.1))
+        times = await grant_times(limiter, 3)
+        # Three requests spread over the window instead of leaving at once
+        assert times[-1] >= 0.03
+
+    @pytest.mark.asyncio
+    async def test_bucket_backoff_does_not_pause_globally(self):
+        limiter = GlobalRateLimiter(initial_delay=0.0)
+        _ = limiter.update_from_headers(headers(2, 10.0))
+        await limiter.trigger_backoff(0.05, bucket="pomelo")
+        assert not limiter.is_paused
+        assert limiter.budget() == 0
@@ -0,0 +1,169 @@
+"""Tests for checkcord.cli.render module."""
+
+import asyncio
+import io
+import json
+
+import pytest
+from rich.console import Console
+
+from checkcord.bench.loadtest import bench_config
+from checkcord.bench.mock_server import MockDiscordServer, MockOptions
+from checkcord.cli import runner
+from checkcord.cli.render import MAX_HIT_LINES, JsonRenderer, Renderer, RichRenderer
+from checkcord.core.generator import RandomCharGenerator
+from checkcord.core.journal import Journal
+from checkcord.models import CheckRecord, CheckStatus
+
+
+def record(username: str, status: CheckStatus, message: str | None = None):
+    return CheckRecord(username=username, status=status, message=message)
+
+
+def rich_renderer(total: int | None = None) -> tuple[RichRenderer, io.StringIO]:
+    out = io.StringIO()
+    console = Console(file=out, width=200, color_system=None)
+    return RichRenderer(console, total), out
+
+
+class TestRichRenderer:
+    """Tests for RichRenderer."""
+
+    def test_results_are_only_counted_until_refresh(self):
+        renderer, out = rich_renderer(total=3)
+        renderer.result(record("free", CheckStatus.AVAILABLE))
+        assert out.getvalue() == ""
+
+        renderer.refresh()
+        assert "AVAILABLE: free" in out.getvalue()
+        assert renderer.progress.tasks[0].completed == 1
+
+    def test_repeated_errors_collapse(self):
+        renderer, out = rich_renderer()
+        for i in range(50):
+            renderer.result(record(f"e{i}", CheckStatus.ERROR, "Timed out"))
+        renderer.result(record("odd", CheckStatus.ERROR, "Bad gateway"))
+        for i in range(30):
+            renderer.result(record(f"r{i}", CheckStatus.RATE_LIMITED))
+        renderer.refresh()
+
+        lines = out.getvalue().splitlines()
+        assert "ERROR x50: Timed out (last: e49)" in lines
+        assert "ERROR: odd - Bad gateway" in lines
+        assert "RATE LIMITED: 30 usernames (last: r29)" in lines
+        assert len(lines) == 3
+
+    def test_hit_lines_are_capped(self):
+        renderer, out = rich_renderer()
+        for i in range(MAX_HIT_LINES + 5):
+            renderer.result(record(f"h{i}", CheckStatus.AVAILABLE))
+        renderer.refresh()
+
+        lines = out.getvalue().splitlines()
+        assert len(lines) == MAX_HIT_LINES + 1
+        assert lines[-1] == "AVAILABLE: 5 more"
+
+    @pytest.mark.asyncio
+    async def test_refreshes_on_its_own_clock(self):
+        renderer, out = rich_renderer()
+        async with renderer:
+            renderer.result(record("free", CheckStatus.AVAILABLE))
+            await asyncio.sleep(renderer.interval * 3)
+            assert "AVAILABLE: free" in out.getvalue()
+
+
+class TestJsonRenderer:
+    """Tests for JsonRenderer."""
+
+    @pytest.mark.asyncio
+    async def test_last_line_is_done(self):
+        stream = io.StringIO()
+        async with JsonRenderer(total=2, stream=stream) as renderer:
+            renderer.result(record("free", CheckStatus.AVAILABLE))
+            renderer.result(record("gone", CheckStatus.TAKEN))
+
+        lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert len(lines) == 1
+        assert lines[0]["done"] is True
+        assert lines[0]["completed"] == 2
+        assert lines[0]["statuses"] == {"AVAILABLE": 1, "TAKEN": 1}
+        assert lines[0]["available"] == ["free"]
+
+    def test_hits_are_reported_once(self):
+        stream = io.StringIO()
+        renderer = JsonRenderer(stream=stream)
+        renderer.result(record("free", CheckStatus.AVAILABLE))
+        renderer.refresh()
+        renderer.refresh()
+
+        first, second = (json.loads(line) for line in stream.getvalue().splitlines())
+        assert first["available"] == ["free"]
+        assert second["available"] == []
+
+
+class TestQuietRun:
+    """run_checks without a progress bar against the mock server."""
+
+    @pytest.mark.asyncio
+    async def test_json_progress(self, monkeypatch):
+        monkeypatch.setattr(runner.console, "quiet", True)
+        stream = io.StringIO()
+
+        async with MockDiscordServer() as server:
+            await runner.run_checks(
+                [f"u{i}" for i in range(30)],
+                bench_config(server, thread_count=4),
+                output_file=None,
+                json_progress=stream,
+            )
+
+        last = json.loads(stream.getvalue().splitlines()[-1])
+        assert last["done"] is True
+        assert last["completed"] == last["total"] == 30
+        assert sum(last["statuses"].values()) == 30
+
+    @pytest.mark.asyncio
+    async def test_until_available_stops_an_endless_stream(self, monkeypatch):
+        monkeypatch.setattr(runner.console, "quiet", True)
+        stream = io.StringIO()
+        gen = RandomCharGenerator(length=6, seed=1)
+
+        async with MockDiscordServer() as server:
+            await runner.run_checks(
+                gen.stream(),
+                bench_config(server, thread_count=4),
+                output_file=None,
+                json_progress=stream,
+                until_available=5,
+            )
+
+        last = json.loads(stream.getvalue().splitlines()[-1])
+        assert last["statuses"]["AVAILABLE"] == 5
+        # Only a queue's worth of names is made ahead of the checks
+        assert gen.position < last["completed"] * 2 + 50
+
+    @pytest.mark.asyncio
+    async def test_retired_tokens_end_the_run_cleanly(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(runner.console, "quiet", True)
+        stream = io.StringIO()
+        journal = Journal(tmp_path / "run.journal")
+
+        async with MockDiscordServer(MockOptions(valid_tokens={"good"})) as server:
+            await runner.run_checks(
+                [f"u{i}" for i in range(30)],
+                bench_config(server, token="bad", thread_count=4),
+                output_file=None,
+                journal=journal,
+                json_progress=stream,
+            )
+
+        last = json.loads(stream.getvalue().splitlines()[-1])
+        assert last["done"] is True
+        assert last["completed"] < 30
+        assert set(last["statuses"]) <= {"ERROR"}
+
+    def test_quiet_renderer_does_nothing(self):
+        renderer = Renderer()
+        renderer.result(record("free", CheckStatus.AVAILABLE))
+        renderer.refresh()
+        assert renderer.completed == 0
@@ -0,0 +1,73 @@
+"""Tests for checkcord.core.retry module."""
+
+import asyncio
+
+import pytest
+
+from checkcord.core.pool import WorkerPool
+from checkcord.core.retry import RetryScheduler
+
+
+class TestRetryScheduler:
+    """Tests for RetryScheduler."""
+
+    def test_backoff_is_capped_and_jittered(self):
+        retries: RetryScheduler[str] = RetryScheduler(
+            base_delay=1.0, max_delay=5.0, jitter=0.5
+        )
+        for attempt, full in ((1, 1.0), (2, 2.0), (3, 4.0), (4, 5.0), (10, 5.0)):
+            for _ in range(20):
+                assert full / 2 <= retries.delay(attempt) <= full
+
+    @pytest.mark.asyncio
+    async def test_attempts_are_limited(self):
+        retries: RetryScheduler[str] = RetryScheduler(max_attempts=3, base_delay=0)
+        assert retries.schedule("a", 1)
+        assert retries.schedule("a", 2)
+        assert not retries.schedule("a", 3)
+        assert retries.scheduled == 2
+        assert retries.exhausted == 1
+
+    @pytest.mark.asyncio
+    async def test_ready_order(self):
+        retries: RetryScheduler[str] = RetryScheduler(base_delay=0)
+        _ = retries.schedule("late", 1, not_before=0.05)
+        _ = retries.schedule("soon", 1)
+        assert retries.pop_ready() == ["soon"]
+        assert len(retries) == 1
+        assert await asyncio.wait_for(retries.get(), 1) == "late"
+
+    @pytest.mark.asyncio
+    async def test_get_wakes_for_earlier_item(self):
+        retries: RetryScheduler[str] = RetryScheduler(base_delay=0)
+        _ = retries.schedule("late", 1, not_before=10)
+        getter = asyncio.create_task(retries.get())
+        await asyncio.sleep(0)
+        _ = retries.schedule("now", 1)
+        assert await asyncio.wait_for(getter, 1) == "now"
+
+
+class TestPoolRetries:
+    """Tests for WorkerPool with a RetryScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_failed_items_come_back(self):
+        calls: dict[int, int] = {}
+
+        async def flaky(x: int) -> tuple[int, bool]:
+            calls[x] = calls.get(x, 0) + 1
+            # Odd numbers fail on their first try
+            return x, bool(x % 2 == 0 or calls[x] > 1)
+
+        retries: RetryScheduler[int] = RetryScheduler(base_delay=0.001)
+        pool: WorkerPool[int, tuple[int, bool]] = WorkerPool(flaky, workers=3)
+        done: list[int] = []
+        async for x, ok in pool.imap_unordered(range(10), retries):
+            if not ok:
+                assert retries.schedule(x, calls[x])
+                continue
+            done.append(x)
+
+        assert sorted(done) == list(range(10))
+        assert retries.scheduled == 5
+        assert all(calls[x] == (2 if x % 2 else 1) for x in range(10))
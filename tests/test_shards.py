@@ -0,0 +1,127 @@
+"""Tests for checkcord.core.shards module."""
+
+import pytest
+
+from checkcord.bench.loadtest import bench_config
+from checkcord.bench.mock_server import MockDiscordServer, MockOptions
+from checkcord.core.bloom import KnownTakenFilter
+from checkcord.core.shards import ShardedChecker, prepare_shared_files, shard_config
+from checkcord.core.tokens import NoActiveTokensError
+from checkcord.models import AppConfig, CheckStatus
+
+
+class TestShardConfig:
+    """Tests for shard_config."""
+
+    def test_tokens_are_disjoint(self):
+        config = AppConfig(token="a", tokens=["b", "c"], requests_per_second=6.0)
+        shards = [shard_config(config, i, 2) for i in range(2)]
+        assert [t.token for t in shards[0].accounts()] == ["a", "c"]
+        assert [t.token for t in shards[1].accounts()] == ["b"]
+        # The workers share the global rate between them
+        assert all(s.requests_per_second == pytest.approx(3.0) for s in shards)
+
+    def test_pinned_proxies_stay_with_their_token(self):
+        config = AppConfig.model_validate(
+            {"token": "a", "tokens": [{"token": "a", "proxies": ["http://p"]}]}
+        )
+        shard = shard_config(config, 0, 1)
+        assert shard.accounts()[0].proxies == ["http://p"]
+
+    def test_unthrottled_stays_unthrottled(self):
+        config = AppConfig(token="a", tokens=["b"], retry_delay=0.0)
+        assert shard_config(config, 0, 2).request_interval() == 0.0
+
+
+class TestShardedChecker:
+    """Tests for ShardedChecker."""
+
+    def test_workers_capped_by_tokens(self):
+        config = AppConfig(token="a", tokens=["b"])
+        checker = ShardedChecker(config, workers=8)
+        assert checker.workers == 2
+        assert checker.requested == 8
+
+    def test_shared_files_exist_before_workers_start(self, tmp_path):
+        bloom_path = tmp_path / "taken.bloom"
+        bloom = KnownTakenFilter(bloom_path, capacity=1000)
+        bloom.add("discord")
+        bloom.close()
+        config = AppConfig(
+            token="a",
+            cache_path=str(tmp_path / "cache.db"),
+            known_taken_path=str(bloom_path),
+        )
+
+        prepare_shared_files(config)
+        assert (tmp_path / "cache.db").exists()
+        reopened = KnownTakenFilter(bloom_path)
+        assert "discord" in reopened
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_checks_across_processes(self):
+        async with MockDiscordServer() as server:
+            config = bench_config(server, tokens=["t2"], thread_count=4)
+            checker = ShardedChecker(config, workers=2)
+            names = [f"u{i}" for i in range(30)] + ["x"]
+            results = [r async for r in checker.stream_usernames(names, skip={3})]
+
+        assert sorted(r.offset for r in results) == [i for i in range(30) if i != 3]
+        for result in results:
+            expected = server.is_taken(result.username)
+            assert (result.status == CheckStatus.TAKEN) == expected
+        assert checker.validator.saved == 1
+
+    @pytest.mark.asyncio
+    async def test_parent_adds_taken_names_to_the_filter(self, tmp_path):
+        bloom_path = tmp_path / "taken.bloom"
+        async with MockDiscordServer() as server:
+            config = bench_config(
+                server,
+                tokens=["t2"],
+                known_taken_path=str(bloom_path),
+                known_taken_capacity=1000,
+            )
+            names = [f"u{i}" for i in range(30)]
+            checker = ShardedChecker(config, workers=2)
+            first = [r async for r in checker.stream_usernames(names)]
+            requests = server.requests
+            checker = ShardedChecker(config, workers=2)
+            second = [r async for r in checker.stream_usernames(names)]
+
+        taken = {r.username for r in first if r.status == CheckStatus.TAKEN}
+        assert taken
+        bloom = KnownTakenFilter(bloom_path)
+        assert all(name in bloom for name in taken)
+        assert len(bloom) == len(taken)
+        bloom.close()
+        # The workers read what the parent wrote and skip those names
+        assert {r.username for r in second if r.status == CheckStatus.SKIPPED} >= taken
+        assert server.requests - requests <= len(names) - len(taken)
+
+    @pytest.mark.asyncio
+    async def test_worker_out_of_tokens_hands_its_names_back(self):
+        options = MockOptions(valid_tokens={"good"})
+        async with MockDiscordServer(options) as server:
+            config = bench_config(server, token="good", tokens=["bad"], thread_count=4)
+            checker = ShardedChecker(config, workers=2)
+            names = [f"u{i}" for i in range(40)]
+            results = [r async for r in checker.stream_usernames(names)]
+
+        # The worker holding "bad" gives up and the other one finishes its share
+        assert sorted(r.offset for r in results) == list(range(40))
+        assert all(
+            r.status in (CheckStatus.TAKEN, CheckStatus.AVAILABLE) for r in results
+        )
+        assert server.statuses[401] >= 1
+
+    @pytest.mark.asyncio
+    async def test_every_worker_out_of_tokens_ends_the_run(self):
+        options = MockOptions(valid_tokens={"good"})
+        async with MockDiscordServer(options) as server:
+            config = bench_config(server, token="bad", tokens=["worse"])
+            checker = ShardedChecker(config, workers=2)
+            names = [f"u{i}" for i in range(40)]
+            with pytest.raises(NoActiveTokensError):
+                _ = [r async for r in checker.stream_usernames(names)]
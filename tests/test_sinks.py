@@ -0,0 +1,259 @@
+"""Tests for checkcord.core.sinks module."""
+
+import asyncio
+import csv
+import json
+import sqlite3
+import time
+
+import pytest
+
+from checkcord.bench.loadtest import bench_config
+from checkcord.bench.mock_server import MockDiscordServer
+from checkcord.cli import runner
+from checkcord.core.cache import ResultCache
+from checkcord.core.errors import ErrorKind
+from checkcord.core.sinks import (
+    MAX_QUEUED_BATCHES,
+    CsvSink,
+    JsonlSink,
+    ResultSink,
+    Row,
+    SinkFormat,
+    SqliteSink,
+    TextSink,
+    open_sink,
+)
+from checkcord.models import CheckRecord, CheckStatus
+
+
+class SlowSink(TextSink):
+    """A text sink on a disk that takes a while to write each batch."""
+
+    def _write(self, batch: list[Row]):
+        time.sleep(0.02)
+        super()._write(batch)
+
+
+def records() -> list[CheckRecord]:
+    return [
+        CheckRecord(
+            username="free",
+            status=CheckStatus.AVAILABLE,
+            latency=0.25,
+            offset=0,
+            proxy="http://proxy:8080",
+        ),
+        CheckRecord(username="gone", status=CheckStatus.TAKEN, offset=1),
+        CheckRecord(
+            username="oops",
+            status=CheckStatus.ERROR,
+            message="Timed out",
+            offset=2,
+            attempts=4,
+            error=ErrorKind.TIMEOUT,
+        ),
+    ]
+
+
+class TestOpenSink:
+    """Tests for picking a sink."""
+
+    @pytest.mark.parametrize(
+        ("name", "sink_type"),
+        [
+            ("valid.txt", TextSink),
+            ("results.jsonl", JsonlSink),
+            ("results.CSV", CsvSink),
+            ("results.db", SqliteSink),
+            ("results", TextSink),
+        ],
+    )
+    def test_format_from_suffix(self, tmp_path, name, sink_type):
+        sink = open_sink(tmp_path / name)
+        assert isinstance(sink, sink_type)
+        sink.close()
+
+    def test_explicit_format_wins(self, tmp_path):
+        sink = open_sink(tmp_path / "out.txt", SinkFormat.JSONL)
+        assert isinstance(sink, JsonlSink)
+        sink.close()
+
+
+class TestSinks:
+    """Tests for the formats written."""
+
+    @pytest.mark.asyncio
+    async def test_text_lists_available_names(self, tmp_path):
+        path = tmp_path / "valid.txt"
+        path.write_text("earlier\n")
+        sink = open_sink(path)
+        for record in records():
+            await sink.write(record)
+        sink.close()
+
+        assert path.read_text() == "earlier\nfree\n"
+        assert sink.written == 1
+
+    @pytest.mark.asyncio
+    async def test_jsonl(self, tmp_path):
+        path = tmp_path / "results.jsonl"
+        sink = open_sink(path)
+        for record in records():
+            await sink.write(record)
+        sink.close()
+
+        rows = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [row["status"] for row in rows] == ["AVAILABLE", "TAKEN", "ERROR"]
+        assert rows[0]["latency"] == 0.25
+        assert rows[0]["proxy"] == "http://proxy:8080"
+        assert rows[2]["error"] == "TIMEOUT"
+        assert rows[2]["attempts"] == 4
+
+    @pytest.mark.asyncio
+    async def test_csv_header_written_once(self, tmp_path):
+        path = tmp_path / "results.csv"
+        for _ in range(2):
+            sink = open_sink(path)
+            for record in records():
+                await sink.write(record)
+            sink.close()
+
+        rows = list(csv.DictReader(path.open()))
+        assert len(rows) == 6
+        assert rows[3]["username"] == "free"
+        assert rows[5]["message"] == "Timed out"
+
+    @pytest.mark.asyncio
+    async def test_sqlite(self, tmp_path):
+        path = tmp_path / "results.db"
+        sink = open_sink(path, statuses=(CheckStatus.AVAILABLE, CheckStatus.TAKEN))
+        for record in records():
+            await sink.write(record)
+        sink.close()
+
+        with sqlite3.connect(path) as conn:
+            rows = conn.execute(
+                "SELECT username, status, offset FROM check_results ORDER BY offset"
+            ).fetchall()
+        assert rows == [("free", "AVAILABLE", 0), ("gone", "TAKEN", 1)]
+
+    @pytest.mark.asyncio
+    async def test_sqlite_shares_a_file_with_the_cache(self, tmp_path):
+        path = tmp_path / "checkcord.db"
+        cache = ResultCache(path, ttl=3600)
+        cache.record(CheckRecord(username="gone", status=CheckStatus.TAKEN))
+        _ = cache.flush().result()
+
+        sink = open_sink(path, statuses=(CheckStatus.AVAILABLE, CheckStatus.TAKEN))
+        for record in records():
+            await sink.write(record)
+        sink.close()
+
+        cached = await cache.lookup("gone")
+        assert cached is not None
+        assert cached.status == CheckStatus.TAKEN
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_nothing_written_creates_no_file(self, tmp_path):
+        path = tmp_path / "valid.txt"
+        sink = open_sink(path)
+        await sink.write(CheckRecord(username="gone", status=CheckStatus.TAKEN))
+        sink.close()
+        assert not path.exists()
+
+
+class TestBuffering:
+    """Tests for when rows reach the disk."""
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_written(self, tmp_path):
+        path = tmp_path / "results.jsonl"
+        sink = open_sink(path, batch_size=2, flush_interval=60.0)
+        await sink.write(records()[0])
+        assert not path.exists()
+
+        await sink.write(records()[1])
+        sink._executor.submit(lambda: None).result()  # Let the writer catch up
+        assert len(path.read_text().splitlines()) == 2
+        sink.close()
+
+    @pytest.mark.asyncio
+    async def test_interval_flushes_a_partial_batch(self, tmp_path):
+        path = tmp_path / "results.jsonl"
+        sink = open_sink(path, batch_size=100, flush_interval=0.05)
+        await sink.write(records()[0])
+        await asyncio.sleep(0.2)
+        assert len(path.read_text().splitlines()) == 1
+        sink.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_disk_pauses_writes_not_the_loop(self, tmp_path):
+        sink = SlowSink(tmp_path / "valid.txt", batch_size=1)
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        for i in range(MAX_QUEUED_BATCHES + 4):
+            record = CheckRecord(username=f"u{i}", status=CheckStatus.AVAILABLE)
+            await sink.write(record)
+            assert len(sink._futures) <= MAX_QUEUED_BATCHES
+        _ = ticker.cancel()
+        sink.close()
+
+        assert ticks > 0
+        assert len(sink.path.read_text().splitlines()) == MAX_QUEUED_BATCHES + 4
+
+    def test_base_class_is_abstract(self, tmp_path):
+        with pytest.raises(TypeError):
+            _ = ResultSink(tmp_path / "out")  # type: ignore
+
+    @pytest.mark.asyncio
+    async def test_write_errors_surface(self, tmp_path):
+        sink = open_sink(tmp_path / "missing" / "results.jsonl")
+        await sink.write(records()[0])
+        with pytest.raises(FileNotFoundError):
+            sink.close()
+
+
+class TestRunOutput:
+    """run_checks writing every result against the mock server."""
+
+    @pytest.mark.asyncio
+    async def test_jsonl_run(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(runner.console, "quiet", True)
+        path = tmp_path / "results.jsonl"
+        names = [f"u{i}" for i in range(50)]
+
+        async with MockDiscordServer() as server:
+            await runner.run_checks(
+                names, bench_config(server, thread_count=4), output_file=str(path)
+            )
+            available = {name for name in names if not server.is_taken(name)}
+
+        rows = [json.loads(line) for line in path.read_text().splitlines()]
+        assert sorted(row["offset"] for row in rows) == list(range(50))
+        assert {r["username"] for r in rows if r["status"] == "AVAILABLE"} == available
+        assert all(row["latency"] is not None for row in rows)
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_are_not_written_again(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(runner.console, "quiet", True)
+        names = [f"u{i}" for i in range(50)]
+
+        async with MockDiscordServer() as server:
+            config = bench_config(server, cache_path=str(tmp_path / "cache.db"))
+            await runner.run_checks(names, config, output_file=str(tmp_path / "a.txt"))
+            first = server.requests
+            await runner.run_checks(names, config, output_file=str(tmp_path / "b.txt"))
+            available = [name for name in names if not server.is_taken(name)]
+
+        # Taken names are answered from the cache; available ones are re-checked
+        assert server.requests - first == len(available)
+        assert sorted((tmp_path / "b.txt").read_text().split()) == sorted(available)
@@ -0,0 +1,68 @@
+"""Import-time budget for the package and the CLI entry point."""
+
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time allowed, in milliseconds. Eagerly importing the
+# checker stack (curl_cffi, pydantic, rich.progress) costs ~350ms on its own.
+BUDGETS = {"checkcord": 50, "checkcord.cli.main": 250}
+
+HEAVY = ("curl_cffi", "pydantic", "rich.progress", "checkcord.core.checker")
+
+
+def run(code: str, *flags: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def import_time_ms(module: str) -> float:
+    """Best of a few `-X importtime` runs of a fresh interpreter."""
+    best = float("inf")
+    for _ in range(3):
+        stderr = run(f"import {module}", "-X", "importtime").stderr
+        for line in stderr.splitlines():
+            _, cumulative, name = line.split("|")
+            # Only the top-level entry; nested imports are indented
+            if name == f" {module}":
+                best = min(best, int(cumulative) / 1000)
+    return best
+
+
+class TestLazyImports:
+    """Importing the package or the CLI must not load the checker stack."""
+
+    @pytest.mark.parametrize("module", ["checkcord", "checkcord.cli.main"])
+    def test_heavy_modules_stay_unloaded(self, module):
+        code = (
+            f"import sys, {module}; print(*[m for m in {HEAVY!r} if m in sys.modules])"
+        )
+        assert run(code).stdout.strip() == ""
+
+    def test_models_leave_the_http_client_unloaded(self):
+        code = "import sys, checkcord.models; print('curl_cffi' in sys.modules)"
+        assert run(code).stdout.strip() == "False"
+
+    def test_public_names_load_on_access(self):
+        code = (
+            "import sys, checkcord; "
+            "checker = checkcord.DiscordChecker; "
+            "print('curl_cffi' in sys.modules, 'DiscordChecker' in vars(checkcord))"
+        )
+        assert run(code).stdout.split() == ["True", "True"]
+
+    def test_unknown_attribute(self):
+        import checkcord
+
+        with pytest.raises(AttributeError):
+            _ = checkcord.NotAThing  # type: ignore
+        assert "DiscordChecker" in dir(checkcord)
+
+    @pytest.mark.parametrize("module", sorted(BUDGETS))
+    def test_import_time_budget(self, module):
+        assert import_time_ms(module) < BUDGETS[module]
@@ -0,0 +1,75 @@
+"""Tests for checkcord.core.tokens module."""
+
+import asyncio
+import time
+
+import pytest
+
+from checkcord.core.breaker import BreakerState
+from checkcord.core.tokens import NoActiveTokensError, TokenPool
+from checkcord.models import TokenConfig
+
+
+def budget_headers(remaining: int) -> dict[str, str]:
+    return {
+        "X-RateLimit-Bucket": "pomelo",
+        "X-RateLimit-Limit": "10",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset-After": "30",
+    }
+
+
+class TestTokenPool:
+    """Tests for TokenPool."""
+
+    @pytest.mark.asyncio
+    async def test_spreads_over_tokens(self):
+        pool = TokenPool([TokenConfig(token="aaa"), TokenConfig(token="bbb")])
+        first = await pool.acquire()
+        second = await pool.acquire()
+        assert {first.token, second.token} == {"aaa", "bbb"}
+
+    @pytest.mark.asyncio
+    async def test_prefers_token_with_budget(self):
+        pool = TokenPool([TokenConfig(token="aaa"), TokenConfig(token="bbb")])
+        a, _ = pool.tokens
+        _ = a.limiter.update_from_headers(budget_headers(0))
+        for _ in range(3):
+            token = await pool.acquire()
+            assert token.token == "bbb"
+            pool.release(token)
+
+    @pytest.mark.asyncio
+    async def test_retired_tokens_are_skipped(self):
+        pool = TokenPool([TokenConfig(token="aaa"), TokenConfig(token="bbb")])
+        pool.retire(pool.tokens[0], "HTTP 401")
+        assert len(pool.active) == 1
+        token = await pool.acquire()
+        assert token.token == "bbb"
+
+        pool.retire(token, "HTTP 403")
+        with pytest.raises(NoActiveTokensError):
+            _ = await pool.acquire()
+
+    @pytest.mark.asyncio
+    async def test_half_open_token_sends_one_probe(self):
+        pool = TokenPool([TokenConfig(token="aaa")])
+        token = pool.tokens[0]
+        token.breaker.state = BreakerState.OPEN
+        token.breaker.retry_at = time.monotonic() - 1
+
+        probe = await pool.acquire()
+        assert token.breaker.state is BreakerState.HALF_OPEN
+        waiter = asyncio.create_task(pool.acquire())
+        await asyncio.sleep(0.1)
+        assert not waiter.done()
+
+        token.breaker.record_success()
+        pool.release(probe)
+        assert await asyncio.wait_for(waiter, 1.0) is token
+
+    def test_headers_and_label(self):
+        pool = TokenPool([TokenConfig(token="secret-token-123456")])
+        token = pool.tokens[0]
+        assert token.headers["Authorization"] == "secret-token-123456"
+        assert token.label == "...123456"
@@ -0,0 +1,53 @@
+"""Tests for checkcord.core.validator module."""
+
+import pytest
+
+from checkcord.core.validator import UsernameValidator, invalid_reason, is_valid
+
+
+class TestInvalidReason:
+    """Tests for invalid_reason."""
+
+    @pytest.mark.parametrize("name", ["ab", "a" * 32, "cool.name_42", "Upper"])
+    def test_valid(self, name):
+        assert is_valid(name)
+
+    @pytest.mark.parametrize(
+        ("name", "reason"),
+        [
+            ("a", "length"),
+            ("a" * 33, "length"),
+            ("v1p3r!", "charset"),
+            ("some name", "charset"),
+            ("é1", "charset"),
+            ("a..b", "consecutive periods"),
+            ("everyone", "reserved"),
+            ("Here", "reserved"),
+            ("mydiscordname", "banned word"),
+        ],
+    )
+    def test_invalid(self, name, reason):
+        assert invalid_reason(name) == reason
+
+
+class TestUsernameValidator:
+    """Tests for UsernameValidator."""
+
+    def test_filter_counts(self):
+        validator = UsernameValidator()
+        kept = list(validator.filter(["good", "x", "b@d", "fine", "here"]))
+        assert kept == ["good", "fine"]
+        assert validator.accepted == 2
+        assert validator.saved == 3
+        assert validator.rejected == {"length": 1, "charset": 1, "reserved": 1}
+
+    @pytest.mark.asyncio
+    async def test_filter_async_input(self):
+        async def source():
+            for name in ("ok", "a..b", "ok2"):
+                yield name
+
+        validator = UsernameValidator()
+        kept = [name async for name in validator.filter(source())]
+        assert kept == ["ok", "ok2"]
+        assert validator.saved == 1
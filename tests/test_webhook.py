@@ -0,0 +1,69 @@
+"""Tests for checkcord.core.webhook module."""
+
+from typing import Any
+
+import pytest
+
+from checkcord.core.webhook import WebhookDispatcher
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, data: dict[str, Any] | None = None):
+        self.status_code = status_code
+        self._data = data or {}
+
+    def json(self) -> dict[str, Any]:
+        return self._data
+
+
+class FakeSession:
+    def __init__(self, responses: list[FakeResponse] | None = None):
+        self.responses = responses or []
+        self.payloads: list[dict[str, Any]] = []
+
+    async def post(self, url: str, json: dict[str, Any]) -> FakeResponse:
+        self.payloads.append(json)
+        return self.responses.pop(0) if self.responses else FakeResponse(204)
+
+
+class TestWebhookDispatcher:
+    """Tests for WebhookDispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_batches_hits(self):
+        session = FakeSession()
+        dispatcher = WebhookDispatcher("http://hook", batch_window=0.05)
+        for i in range(23):
+            dispatcher.submit(session, f"name{i}")  # type: ignore
+        await dispatcher.aclose()
+
+        assert [len(p["embeds"]) for p in session.payloads] == [10, 10, 3]
+        assert dispatcher.sent == 23
+        assert session.payloads[0]["embeds"][0]["title"] == "**name0**"
+
+    @pytest.mark.asyncio
+    async def test_retries_after_rate_limit(self):
+        session = FakeSession([FakeResponse(429, {"retry_after": 0.01})])
+        dispatcher = WebhookDispatcher("http://hook", batch_window=0.0)
+        dispatcher.submit(session, "hit")  # type: ignore
+        await dispatcher.aclose()
+
+        assert len(session.payloads) == 2
+        assert dispatcher.sent == 1
+        assert dispatcher.failed == 0
+
+    @pytest.mark.asyncio
+    async def test_gives_up_on_client_error(self):
+        session = FakeSession([FakeResponse(404)])
+        dispatcher = WebhookDispatcher("http://hook", batch_window=0.0)
+        dispatcher.submit(session, "hit")  # type: ignore
+        await dispatcher.aclose()
+
+        assert len(session.payloads) == 1
+        assert dispatcher.failed == 1
+
+    @pytest.mark.asyncio
+    async def test_close_without_hits(self):
+        dispatcher = WebhookDispatcher("http://hook")
+        await dispatcher.aclose()
+        assert dispatcher.pending == 0